@@ -11,6 +11,14 @@ from resume_analyzer import ResumeAnalyzer
 from model_trainer import ModelTrainer
 from text_extractor import TextExtractor
 from ats_scorer import ATSScorer
+from keyword_registry import get_registry, get_field_keywords
+from history_store import get_history_store, HISTORY_BACKEND, HISTORY_DB
+from metrics import get_metrics, process_stats
+from profiler import get_profiler
+from online_learner import get_online_learner
+from retrain_scheduler import get_retrain_scheduler
+from model_registry import get_model_registry
+from shadow_scorer import get_shadow_scorer
 
 # Add this import at the top with other imports
 from startup_check import ensure_system_ready
@@ -23,6 +31,21 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Analysis pipeline stages after extraction, in the order they run
+ANALYSIS_STAGES = [
+    ('scoring', "🎯 Calculating ATS score..."),
+    ('classification', "🤖 Running AI field detection..."),
+    ('gap_analysis', "📊 Analyzing skills gap...")
+]
+
+STAGE_NAMES = [
+    ('extraction', "Text extraction"),
+    ('scoring', "ATS scoring"),
+    ('classification', "Field classification"),
+    ('gap_analysis', "Gap analysis"),
+    ('total', "Total")
+]
+
 # Custom CSS for neon theme with fixed fonts
 def load_custom_css():
     st.markdown("""
@@ -476,6 +499,12 @@ def create_neon_metric_card(title, value, delta=None, color="cyan"):
     </div>
     """, unsafe_allow_html=True)
 
+def format_seconds(seconds):
+    """Format a measured duration for display"""
+    if seconds < 1:
+        return f"{seconds * 1000:.0f} ms"
+    return f"{seconds:.2f} s"
+
 def create_progress_bar_neon(value, label="Progress"):
     """Create neon-styled progress bar with NO truncation"""
     # NO TRUNCATION - Show full label
@@ -517,6 +546,9 @@ def main():
     # Load components
     analyzer, trainer, extractor, scorer = load_components()
     
+    # Retrains in a separate process when the dataset changes; serving keeps the live model meanwhile
+    get_retrain_scheduler()
+    
     # Enhanced sidebar with proper sizing - REMOVED MODEL TRAINING
     with st.sidebar:
         st.markdown("""
@@ -581,7 +613,7 @@ def resume_analysis_page(analyzer, extractor, scorer):
         
         target_field = st.selectbox(
             "🎯 Target Job Field",
-            ["Software Engineering", "Data Analyst", "Consultant"],
+            get_registry().fields(),
             help="Select your target job field for analysis"
         )
         
@@ -610,7 +642,11 @@ def resume_analysis_page(analyzer, extractor, scorer):
             }
         }
         
-        info = field_info[target_field]
+        info = field_info.get(target_field) or {
+            "icon": "🧩",
+            "skills": [keyword.title() for keyword in get_field_keywords().get(target_field, ())[:5]],
+            "color": "#00ffff"
+        }
         skills_text = ', '.join(info['skills'])  # NO TRUNCATION
         
         st.markdown(f"""
@@ -626,11 +662,18 @@ def resume_analysis_page(analyzer, extractor, scorer):
     if uploaded_file is not None:
         # Extract text with progress
         with st.spinner("🔄 Extracting text from resume..."):
-            time.sleep(1)  # Simulate processing time
+            started = time.perf_counter()
             resume_text = extractor.extract_text(uploaded_file)
+            extraction_seconds = time.perf_counter() - started
+        
+        # Streamlit reruns the page on every click; keep the first, uncached extraction time
+        upload_key = (uploaded_file.name, uploaded_file.size)
+        if st.session_state.get('extraction_timing', (None,))[0] != upload_key:
+            st.session_state['extraction_timing'] = (upload_key, extraction_seconds)
+        extraction_seconds = st.session_state['extraction_timing'][1]
         
         if resume_text:
-            st.success("✅ Text extraction completed!")
+            st.success(f"✅ Text extraction completed in {format_seconds(extraction_seconds)}!")
             
             # Show extracted text in expandable section
             with st.expander("📝 View Extracted Text", expanded=False):
@@ -640,32 +683,46 @@ def resume_analysis_page(analyzer, extractor, scorer):
             
             # Analysis button
             if st.button("🚀 ANALYZE RESUME", type="primary"):
-                # Create progress bar for analysis
-                progress_bar = st.progress(0)
+                # Progress follows the real pipeline; extraction has already finished
+                progress_bar = st.progress(int(100 / (len(ANALYSIS_STAGES) + 1)))
                 status_text = st.empty()
                 
-                # Simulate analysis steps with progress
-                steps = [
-                    ("🔍 Analyzing text structure...", 20),
-                    ("🎯 Calculating ATS score...", 40),
-                    ("🤖 Running AI field detection...", 60),
-                    ("📊 Generating insights...", 80),
-                    ("✨ Finalizing results...", 100)
-                ]
+                ctx = scorer.get_context(resume_text)
+                stage_runs = {
+                    'scoring': lambda: scorer.score_all(ctx, target_field),
+                    'classification': lambda: analyzer.get_field_recommendations(resume_text),
+                    'gap_analysis': lambda: analyzer.analyze_resume(resume_text, target_field)
+                }
                 
-                for step_text, progress in steps:
-                    status_text.text(step_text)
-                    progress_bar.progress(progress)
-                    time.sleep(0.5)
+                timings = {'extraction': extraction_seconds}
+                stage_results = {}
+                # Profiles the pipeline only when enabled on the System Status page or via ATS_PROFILE
+                with get_profiler().capture(f"analysis-{uploaded_file.name}"):
+                    for i, (stage, label) in enumerate(ANALYSIS_STAGES, 2):
+                        status_text.text(label)
+                        started = time.perf_counter()
+                        stage_results[stage] = stage_runs[stage]()
+                        timings[stage] = time.perf_counter() - started
+                        progress_bar.progress(int(100 * i / (len(ANALYSIS_STAGES) + 1)))
+                timings['total'] = sum(timings.values())
                 
                 status_text.empty()
                 progress_bar.empty()
                 
-                # Perform actual analysis
-                ats_score = scorer.calculate_ats_score(resume_text, target_field)
-                field_recommendations = analyzer.get_field_recommendations(resume_text)
-                analysis_results = analyzer.analyze_resume(resume_text, target_field)
+                scores = stage_results['scoring']
+                total_score = sum(scores.values())
+                ats_score = min(100, max(0, total_score))
+                field_recommendations = stage_results['classification']
+                analysis_results = stage_results['gap_analysis']
                 
+                # Recorded after every stage so the history row carries the full timing breakdown
+                scorer.save_analysis_history(ctx, target_field, total_score, scores, timings)
+
+                # The targeted field doubles as a label for background model updates
+                online_learner = get_online_learner()
+                if online_learner is not None:
+                    online_learner.add_example(analyzer.preprocess_text(resume_text), target_field)
+
                 # Display results
                 st.markdown("## 🎉 ANALYSIS RESULTS")
                 
@@ -691,8 +748,8 @@ def resume_analysis_page(analyzer, extractor, scorer):
                 # Detailed analysis tabs
                 st.markdown("### 📋 DETAILED ANALYSIS")
                 
-                tab1, tab2, tab3, tab4 = st.tabs([
-                    "🎯 Requirements", "🏆 Field Scores", "💡 Suggestions", "📈 Skills Gap"
+                tab1, tab2, tab3, tab4, tab5 = st.tabs([
+                    "🎯 Requirements", "🏆 Field Scores", "💡 Suggestions", "📈 Skills Gap", "⏱️ Timings"
                 ])
                 
                 with tab1:
@@ -787,6 +844,16 @@ def resume_analysis_page(analyzer, extractor, scorer):
                         st.plotly_chart(fig, use_container_width=True)
                     
                     st.markdown('</div>', unsafe_allow_html=True)
+                
+                with tab5:
+                    st.markdown('<div class="neon-card">', unsafe_allow_html=True)
+                    st.markdown("#### ⏱️ PIPELINE TIMINGS")
+                    
+                    stage_labels = dict(STAGE_NAMES)
+                    for stage, seconds in timings.items():
+                        st.markdown(f"**{stage_labels.get(stage, stage)}:** {format_seconds(seconds)}")
+                    
+                    st.markdown('</div>', unsafe_allow_html=True)
 
 def dataset_management_page():
     st.markdown("""
@@ -943,8 +1010,8 @@ def analytics_dashboard_page():
     """, unsafe_allow_html=True)
     
     # Generate sample analytics data if not exists
-    analytics_file = "data/analysis_history.csv"
-    if not os.path.exists(analytics_file):
+    history_store = get_history_store()
+    if history_store.total_count() == 0:
         # Create sample data
         sample_data = []
         for i in range(50):
@@ -956,30 +1023,28 @@ def analytics_dashboard_page():
                 'match_percentage': np.random.randint(30, 95)
             })
         
-        os.makedirs("data", exist_ok=True)
-        pd.DataFrame(sample_data).to_csv(analytics_file, index=False)
+        history_store.extend(sample_data)
     
-    # Load analytics data
-    df = pd.read_csv(analytics_file)
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-    df['date'] = df['timestamp'].dt.date
+    # Aggregate queries instead of loading the full history
+    total_analyses = history_store.total_count()
+    field_counts = history_store.field_counts()
     
     # Key metrics with NO truncation
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        create_neon_metric_card("Total Analyses", len(df), color="cyan")
+        create_neon_metric_card("Total Analyses", total_analyses, color="cyan")
     
     with col2:
-        avg_ats = df['ats_score'].mean()
+        avg_ats = history_store.average_score() or 0
         create_neon_metric_card("Avg ATS Score", f"{avg_ats:.1f}%", color="pink")
     
     with col3:
-        today_analyses = len(df[df['date'] == datetime.now().date()])
+        today_analyses = history_store.today_count()
         create_neon_metric_card("Today's Analyses", today_analyses, color="green")
     
     with col4:
-        top_field = df['target_field'].mode().iloc[0] if len(df) > 0 else "N/A"
+        top_field = max(field_counts, key=field_counts.get) if field_counts else "N/A"
         # NO TRUNCATION - Show full field name
         create_neon_metric_card("Top Field", top_field, color="orange")
     
@@ -990,10 +1055,13 @@ def analytics_dashboard_page():
         st.markdown('<div class="neon-card">', unsafe_allow_html=True)
         st.markdown("#### 📊 ATS Score Distribution")
         
-        fig = px.histogram(
-            df, 
+        histogram_df = pd.DataFrame(history_store.score_histogram(), columns=['start', 'end', 'count'])
+        histogram_df['ats_score'] = (histogram_df['start'] + histogram_df['end']) / 2
+        
+        fig = px.bar(
+            histogram_df, 
             x='ats_score', 
-            nbins=15,
+            y='count',
             title="ATS Score Distribution",
             color_discrete_sequence=['#00ffff']
         )
@@ -1004,7 +1072,8 @@ def analytics_dashboard_page():
             font_color='white',
             title_font_color='#00ffff',
             font_size=10,
-            height=350
+            height=350,
+            bargap=0
         )
         
         st.plotly_chart(fig, use_container_width=True)
@@ -1014,11 +1083,9 @@ def analytics_dashboard_page():
         st.markdown('<div class="neon-card">', unsafe_allow_html=True)
         st.markdown("#### 🎯 Field Analysis Trends")
         
-        field_counts = df['target_field'].value_counts()
-        
         fig = px.pie(
-            values=field_counts.values,
-            names=field_counts.index,
+            values=list(field_counts.values()),
+            names=list(field_counts.keys()),
             title="Analysis by Field",
             color_discrete_sequence=['#00ffff', '#ff00ff', '#00ff00']
         )
@@ -1055,8 +1122,8 @@ def system_status_page():
             ("📁 Data Directory", os.path.exists("data")),
             ("🤖 Models Directory", os.path.exists("models")),
             ("📊 Training Dataset", os.path.exists("data/comprehensive_training_dataset.csv")),
-            ("🧠 AI Models", os.path.exists("models/field_classifier.pkl")),
-            ("📈 Analytics Data", os.path.exists("data/analysis_history.csv"))
+            ("🧠 AI Models", os.path.exists(get_model_registry().resolve("models/field_classifier.pkl"))),
+            ("📈 Analytics Data", os.path.exists(HISTORY_DB if HISTORY_BACKEND == 'sqlite' else "data/analysis_history.csv"))
         ]
         
         for check_name, status in checks:
@@ -1070,33 +1137,185 @@ def system_status_page():
         st.markdown('<div class="neon-card" style="border-color: #ff4500;">', unsafe_allow_html=True)
         st.markdown("### 📊 PERFORMANCE METRICS")
         
-        # Simulate system metrics
-        cpu_usage = np.random.randint(20, 80)
-        memory_usage = np.random.randint(30, 70)
-        disk_usage = np.random.randint(40, 90)
+        # Real usage of this server process, read from /proc
+        stats = process_stats()
         
-        create_progress_bar_neon(cpu_usage, "CPU Usage")
-        create_progress_bar_neon(memory_usage, "Memory Usage")
-        create_progress_bar_neon(disk_usage, "Disk Usage")
+        if stats['cpu_percent'] is not None:
+            create_progress_bar_neon(min(100, int(stats['cpu_percent'])), "CPU Usage (process)")
+        if stats['memory_percent'] is not None:
+            create_progress_bar_neon(int(stats['memory_percent']), f"Memory Usage (RSS {stats['rss_bytes'] / 1024 ** 2:.0f} MB)")
+        if stats['disk_percent'] is not None:
+            create_progress_bar_neon(int(stats['disk_percent']), "Disk Usage")
+        if stats['threads'] is not None:
+            st.markdown(f"<div style='font-size: 0.9rem; margin: 0.5rem 0;'>🧵 **Threads**: {stats['threads']}</div>", unsafe_allow_html=True)
         
         st.markdown('</div>', unsafe_allow_html=True)
     
-    # System logs with NO truncation
+    # Hot-path latency histograms with NO truncation
     st.markdown('<div class="neon-card">', unsafe_allow_html=True)
-    st.markdown("### 📋 SYSTEM LOGS")
-    
-    # Generate sample logs
-    logs = [
-        f"[{datetime.now().strftime('%H:%M:%S')}] ✅ System initialized successfully",
-        f"[{(datetime.now() - timedelta(minutes=5)).strftime('%H:%M:%S')}] 🔄 Model training completed",
-        f"[{(datetime.now() - timedelta(minutes=10)).strftime('%H:%M:%S')}] 📊 Analytics updated",
-        f"[{(datetime.now() - timedelta(minutes=15)).strftime('%H:%M:%S')}] 🎯 Resume analysis performed",
-        f"[{(datetime.now() - timedelta(minutes=20)).strftime('%H:%M:%S')}] 💾 Dataset saved successfully"
-    ]
+    st.markdown("### ⏱️ HOT-PATH LATENCY")
+    
+    metrics = get_metrics()
+    latency = metrics.latency_summary()
+    
+    if latency:
+        latency_df = pd.DataFrame([
+            {
+                'Operation': name,
+                'Calls': summary['count'],
+                'Mean (ms)': summary['mean'] * 1000,
+                'p50 (ms)': summary['p50'] * 1000,
+                'p95 (ms)': summary['p95'] * 1000,
+                'p99 (ms)': summary['p99'] * 1000,
+                'Max (ms)': summary['max'] * 1000
+            }
+            for name, summary in latency.items()
+        ])
+        st.dataframe(latency_df.round(2), use_container_width=True, hide_index=True)
+    else:
+        st.info("No timings recorded yet. Analyze a resume to populate the histograms.")
+    
+    counters = metrics.counters()
+    if counters:
+        st.markdown("#### 🔢 COUNTERS")
+        for name, value in counters.items():
+            st.code(f"{name}: {value}", language=None)
+    
+    since = datetime.fromtimestamp(metrics.started_at).strftime('%Y-%m-%d %H:%M:%S')
+    persisted = f"persisted to {metrics.metrics_file}" if metrics.metrics_file else "in memory only"
+    st.caption(f"Collected since {since}, {persisted}")
+    
+    if st.button("🔄 Reset Metrics"):
+        metrics.reset()
+        st.rerun()
     
-    for log in logs:
-        st.code(log, language=None)
+    st.markdown('</div>', unsafe_allow_html=True)
     
+    # On-demand profiling of individual analyses
+    st.markdown('<div class="neon-card">', unsafe_allow_html=True)
+    st.markdown("### 🔬 PROFILING")
+    
+    profiler = get_profiler()
+    profiler.enabled = st.checkbox(
+        "Profile each analysis with cProfile and tracemalloc",
+        value=profiler.enabled,
+        help="Adds noticeable overhead while on; captures are kept in " + profiler.profile_dir
+    )
+    
+    captures = profiler.list_captures()
+    if captures:
+        capture_names = [capture['name'] for capture in captures]
+        selected = st.selectbox(f"Recent captures ({len(captures)} kept, newest first)", capture_names)
+        capture = captures[capture_names.index(selected)]
+        
+        top_df = pd.DataFrame(profiler.top_functions(capture['prof_path'], limit=20))
+        if not top_df.empty:
+            st.markdown("#### 🔥 TOP 20 FUNCTIONS BY CUMULATIVE TIME")
+            st.dataframe(top_df.round(4), use_container_width=True, hide_index=True)
+        
+        allocations = profiler.read_allocations(capture)
+        if allocations:
+            with st.expander("🧠 Top allocations", expanded=False):
+                st.code(allocations, language=None)
+        
+        with open(capture['prof_path'], 'rb') as f:
+            st.download_button("💾 Download .prof", f.read(), file_name=capture['name'] + '.prof')
+    else:
+        st.info("No profile captures yet. Enable profiling and analyze a resume.")
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    online_learner = get_online_learner()
+    if online_learner is not None:
+        st.markdown('<div class="neon-card">', unsafe_allow_html=True)
+        st.markdown("### 🔁 ONLINE LEARNING")
+
+        online_stats = online_learner.stats()
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Buffered", online_stats['queued'] + online_stats['pending'])
+        col2.metric("Holdout", online_stats['holdout'])
+        col3.metric("Published", online_stats['published'])
+        col4.metric("Rejected", online_stats['rejected'])
+
+        if online_stats['last_holdout_accuracy'] is not None:
+            st.caption(f"Last published update: {online_stats['last_holdout_accuracy']:.1%} holdout accuracy")
+        if online_stats['skipped']:
+            st.caption(f"{online_stats['skipped']} examples skipped (buffer full, or the served model has no partial_fit and was saved without an online companion; retrain to create one)")
+
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    retrain_scheduler = get_retrain_scheduler()
+    if retrain_scheduler is not None:
+        st.markdown('<div class="neon-card">', unsafe_allow_html=True)
+        st.markdown("### 🗓️ SCHEDULED RETRAINING")
+
+        retrain_state = retrain_scheduler.load_state()
+        if retrain_scheduler.running:
+            st.info("🔄 Retraining in progress; the live model keeps serving")
+        last_run = retrain_state.get('last_run')
+        if last_run:
+            finished = datetime.fromtimestamp(last_run['finished']).strftime('%Y-%m-%d %H:%M:%S')
+            st.caption(f"Last run {last_run['version']} ({last_run['reason']}): {last_run['status']} at {finished}")
+        st.caption(f"Live version: {get_model_registry().production or 'initial training'}")
+
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    # Versioned models with pointer-flip promotion, rollback and shadow scoring
+    st.markdown('<div class="neon-card">', unsafe_allow_html=True)
+    st.markdown("### 🗃️ MODEL REGISTRY")
+
+    registry = get_model_registry()
+    versions = registry.list_versions()
+    if versions:
+        versions_df = pd.DataFrame(versions)[[
+            'version', 'role', 'best_model', 'accuracy', 'holdout_accuracy', 'latency_p99_ms', 'source', 'training_date', 'dataset_fingerprint'
+        ]]
+        versions_df['dataset_fingerprint'] = versions_df['dataset_fingerprint'].fillna('').str[:12]
+        st.dataframe(versions_df.round(4), use_container_width=True, hide_index=True)
+
+        trained = [row['version'] for row in versions if row['trained']]
+        selected_version = st.selectbox("Version", trained[::-1]) if trained else None
+
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            if st.button("🚀 Promote", disabled=selected_version is None):
+                registry.promote(selected_version)
+                st.rerun()
+        with col2:
+            if st.button("🧪 Shadow", disabled=selected_version is None):
+                registry.set_candidate(selected_version)
+                st.rerun()
+        with col3:
+            if st.button("⏹️ Stop Shadow", disabled=registry.candidate is None):
+                registry.set_candidate(None)
+                st.rerun()
+        with col4:
+            if st.button("⏪ Rollback", disabled=not registry.read_state().get('history')):
+                registry.rollback()
+                st.rerun()
+
+        shadow_report = get_shadow_scorer().report()
+        if shadow_report is not None:
+            st.markdown(f"#### 🧪 SHADOW: VERSION {shadow_report['version']} VS PRODUCTION")
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Shadowed Requests", shadow_report['requests'])
+            col2.metric(
+                "Agreement",
+                f"{shadow_report['agreement_rate']:.1%}" if shadow_report['agreement_rate'] is not None else "-"
+            )
+            col3.metric("Dropped", shadow_report['dropped'])
+
+            latency_rows = [
+                {'model': name, **{key: summary[key] * 1000 for key in ('p50', 'p95', 'p99', 'max')}}
+                for name, summary in (('production', shadow_report['production']), ('candidate', shadow_report['candidate']))
+                if summary is not None
+            ]
+            if latency_rows:
+                st.dataframe(pd.DataFrame(latency_rows).round(3), use_container_width=True, hide_index=True)
+                st.caption("Prediction latency in milliseconds on the same requests")
+    else:
+        st.info("No model versions yet. Train a model to create the first version.")
+
     st.markdown('</div>', unsafe_allow_html=True)
 
 if __name__ == "__main__":
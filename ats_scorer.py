@@ -1,7 +1,64 @@
 import re
 from datetime import datetime
+from functools import cached_property
+import numpy as np
 import pandas as pd
-import os
+from history_store import get_history_store
+from keyword_matcher import get_keyword_matcher
+from metrics import timed
+
+# Patterns are compiled once per process instead of once per scorer call
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERNS = [
+    re.compile(r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b'),  # 123-456-7890 or 123.456.7890 or 123 456 7890
+    re.compile(r'$$\d{3}$$\s?\d{3}[-.\s]?\d{4}'),      # (123) 456-7890
+    re.compile(r'\+\d{1,3}[-.\s]?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}'),  # +1-123-456-7890
+    re.compile(r'\b\d{10}\b')  # 1234567890
+]
+DATE_PATTERNS = [
+    re.compile(r'\b\d{4}\s*[-–]\s*\d{4}\b'),  # 2020-2023
+    re.compile(r'\b\d{4}\s*[-–]\s*present\b'),  # 2020-present
+    re.compile(r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{4}\b'),  # Month Year
+    re.compile(r'\b\d{1,2}/\d{4}\b')  # MM/YYYY
+]
+YEAR_PATTERN = re.compile(r'\b(?:19|20)\d{2}\b')
+GPA_PATTERN = re.compile(r'gpa|grade point average')
+BULLET_PATTERN = re.compile(r'^\s*[-*]\s', re.MULTILINE)
+CAPITALIZED_PATTERN = re.compile(r'[A-Z][a-z]')
+
+
+class ResumeContext:
+    """Shared views of one resume, computed once and reused by every scorer"""
+
+    def __init__(self, text):
+        self.text = text
+        self.text_lower = text.lower()
+        self.keyword_hits = {}
+
+    @cached_property
+    def lines(self):
+        return self.text.split('\n')
+
+    @cached_property
+    def lines_lower(self):
+        return self.text_lower.split('\n')
+
+    @cached_property
+    def line_word_counts(self):
+        return [len(line.split()) for line in self.lines]
+
+    @cached_property
+    def tokens(self):
+        return self.text_lower.split()
+
+    @cached_property
+    def token_set(self):
+        return set(self.tokens)
+
+    @cached_property
+    def word_count(self):
+        return len(self.tokens)
+
 
 class ATSScorer:
     def __init__(self):
@@ -16,61 +73,78 @@ class ATSScorer:
             'length': 5
         }
     
-    def calculate_ats_score(self, resume_text, target_field):
-        """Calculate comprehensive ATS score"""
+    def get_context(self, text):
+        """Return the shared analysis context for a resume"""
+        if isinstance(text, ResumeContext):
+            return text
+        return ResumeContext(text)
+    
+    def find_keywords(self, ctx, matcher):
+        """Return the field keywords present in the resume, scanning it at most once per matcher"""
+        found = ctx.keyword_hits.get(matcher)
+        if found is None:
+            found = matcher.find_keywords(ctx.text_lower)
+            ctx.keyword_hits[matcher] = found
+        return found
+    
+    def score_all(self, resume_text, target_field):
+        """Run every scorer against a single shared context"""
+        ctx = self.get_context(resume_text)
         scores = {}
         
         # Contact Information (10 points)
-        scores['contact_info'] = self.score_contact_info(resume_text)
+        scores['contact_info'] = self.score_contact_info(ctx)
         
         # Professional Summary (8 points)
-        scores['professional_summary'] = self.score_professional_summary(resume_text)
+        scores['professional_summary'] = self.score_professional_summary(ctx)
         
         # Work Experience (25 points)
-        scores['work_experience'] = self.score_work_experience(resume_text)
+        scores['work_experience'] = self.score_work_experience(ctx)
         
         # Education (10 points)
-        scores['education'] = self.score_education(resume_text)
+        scores['education'] = self.score_education(ctx)
         
         # Skills (20 points)
-        scores['skills'] = self.score_skills(resume_text, target_field)
+        scores['skills'] = self.score_skills(ctx, target_field)
         
         # Keywords Match (15 points)
-        scores['keywords_match'] = self.score_keywords_match(resume_text, target_field)
+        scores['keywords_match'] = self.score_keywords_match(ctx, target_field)
         
         # Formatting (7 points)
-        scores['formatting'] = self.score_formatting(resume_text)
+        scores['formatting'] = self.score_formatting(ctx)
         
         # Length (5 points)
-        scores['length'] = self.score_length(resume_text)
+        scores['length'] = self.score_length(ctx)
+        
+        return scores
+    
+    def calculate_ats_score(self, resume_text, target_field):
+        """Calculate comprehensive ATS score"""
+        ctx = self.get_context(resume_text)
+        scores = self.score_all(ctx, target_field)
         
         # Calculate total score
         total_score = sum(scores.values())
         
         # Save analysis history
-        self.save_analysis_history(resume_text, target_field, total_score, scores)
+        self.save_analysis_history(ctx, target_field, total_score, scores)
         
         return min(100, max(0, total_score))
     
+    @timed('ats_scorer.score_contact_info')
     def score_contact_info(self, text):
         """Score contact information completeness"""
+        ctx = self.get_context(text)
         score = 0
-        text_lower = text.lower()
+        text_lower = ctx.text_lower
         
         # Email - Fixed regex pattern
-        if re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text):
+        if EMAIL_PATTERN.search(ctx.text):
             score += 4
         
         # Phone number - Fixed regex pattern
-        phone_patterns = [
-            r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b',  # 123-456-7890 or 123.456.7890 or 123 456 7890
-            r'$$\d{3}$$\s?\d{3}[-.\s]?\d{4}',      # (123) 456-7890
-            r'\+\d{1,3}[-.\s]?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',  # +1-123-456-7890
-            r'\b\d{10}\b'  # 1234567890
-        ]
-        
-        for pattern in phone_patterns:
-            if re.search(pattern, text):
+        for pattern in PHONE_PATTERNS:
+            if pattern.search(ctx.text):
                 score += 3
                 break
         
@@ -80,28 +154,32 @@ class ATSScorer:
         
         return score
     
+    @timed('ats_scorer.score_professional_summary')
     def score_professional_summary(self, text):
         """Score professional summary/objective"""
-        text_lower = text.lower()
+        ctx = self.get_context(text)
+        text_lower = ctx.text_lower
         summary_keywords = ['summary', 'objective', 'profile', 'about', 'overview']
         
         for keyword in summary_keywords:
             if keyword in text_lower:
                 # Check if it's substantial (more than just the heading)
-                lines = text.split('\n')
-                for i, line in enumerate(lines):
-                    if keyword in line.lower() and i + 1 < len(lines):
-                        next_lines = ' '.join(lines[i+1:i+4])
-                        if len(next_lines.split()) > 10:
+                lines_lower = ctx.lines_lower
+                word_counts = ctx.line_word_counts
+                for i, line in enumerate(lines_lower):
+                    if keyword in line and i + 1 < len(lines_lower):
+                        if sum(word_counts[i+1:i+4]) > 10:
                             return 8
                 return 4
         
         return 0
     
+    @timed('ats_scorer.score_work_experience')
     def score_work_experience(self, text):
         """Score work experience section"""
+        ctx = self.get_context(text)
         score = 0
-        text_lower = text.lower()
+        text_lower = ctx.text_lower
         
         # Check for experience section
         experience_keywords = ['experience', 'employment', 'work history', 'career', 'professional experience']
@@ -111,17 +189,9 @@ class ATSScorer:
             score += 10
         
         # Count job positions (look for date patterns)
-        date_patterns = [
-            r'\b\d{4}\s*[-–]\s*\d{4}\b',  # 2020-2023
-            r'\b\d{4}\s*[-–]\s*present\b',  # 2020-present
-            r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{4}\b',  # Month Year
-            r'\b\d{1,2}/\d{4}\b'  # MM/YYYY
-        ]
-        
         job_count = 0
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text_lower)
-            job_count += len(matches)
+        for pattern in DATE_PATTERNS:
+            job_count += sum(1 for _ in pattern.finditer(text_lower))
         
         # Score based on number of positions
         if job_count >= 3:
@@ -133,9 +203,11 @@ class ATSScorer:
         
         return min(25, score)
     
+    @timed('ats_scorer.score_education')
     def score_education(self, text):
         """Score education section"""
-        text_lower = text.lower()
+        ctx = self.get_context(text)
+        text_lower = ctx.text_lower
         education_keywords = ['education', 'degree', 'university', 'college', 'bachelor', 'master', 'phd', 'diploma']
         
         score = 0
@@ -145,11 +217,11 @@ class ATSScorer:
                 break
         
         # Check for graduation year
-        if re.search(r'\b(19|20)\d{2}\b', text):
+        if YEAR_PATTERN.search(ctx.text):
             score += 3
         
         # Check for GPA (optional but good)
-        if re.search(r'gpa|grade point average', text_lower):
+        if GPA_PATTERN.search(text_lower):
             score += 2
         
         # Check for relevant coursework or certifications
@@ -158,9 +230,11 @@ class ATSScorer:
         
         return min(10, score)
     
+    @timed('ats_scorer.score_skills')
     def score_skills(self, text, target_field):
         """Score skills section"""
-        text_lower = text.lower()
+        ctx = self.get_context(text)
+        text_lower = ctx.text_lower
         
         # Check for skills section
         if 'skill' in text_lower:
@@ -168,61 +242,47 @@ class ATSScorer:
         else:
             base_score = 0
         
-        # Import field keywords from resume_analyzer
-        try:
-            from resume_analyzer import ResumeAnalyzer
-            analyzer = ResumeAnalyzer()
-            field_keywords = analyzer.field_keywords.get(target_field, [])
-        except ImportError:
-            # Fallback keywords if import fails
-            field_keywords = {
-                'Software Engineering': ['python', 'java', 'javascript', 'react', 'sql'],
-                'Data Analyst': ['sql', 'python', 'excel', 'tableau', 'analytics'],
-                'Consultant': ['strategy', 'analysis', 'consulting', 'management']
-            }.get(target_field, [])
+        matcher = get_keyword_matcher()
+        field_keywords = matcher.field_keywords.get(target_field, ())
+        found = self.find_keywords(ctx, matcher)
         
         # Count relevant skills
-        skills_found = sum(1 for skill in field_keywords if skill.lower() in text_lower)
+        skills_found = sum(1 for skill in field_keywords if skill.lower() in found)
         skill_score = min(15, skills_found * 1.5)
         
         return base_score + skill_score
     
+    @timed('ats_scorer.score_keywords_match')
     def score_keywords_match(self, text, target_field):
         """Score keyword matching for target field"""
-        try:
-            from resume_analyzer import ResumeAnalyzer
-            analyzer = ResumeAnalyzer()
-            field_keywords = analyzer.field_keywords.get(target_field, [])
-        except ImportError:
-            # Fallback keywords if import fails
-            field_keywords = {
-                'Software Engineering': ['python', 'java', 'javascript', 'react', 'sql', 'git', 'aws'],
-                'Data Analyst': ['sql', 'python', 'excel', 'tableau', 'analytics', 'statistics'],
-                'Consultant': ['strategy', 'analysis', 'consulting', 'management', 'client']
-            }.get(target_field, [])
-        
-        text_lower = text.lower()
-        matches = sum(1 for keyword in field_keywords if keyword.lower() in text_lower)
+        matcher = get_keyword_matcher()
+        field_keywords = matcher.field_keywords.get(target_field, ())
+        found = self.find_keywords(self.get_context(text), matcher)
+        
+        matches = sum(1 for keyword in field_keywords if keyword.lower() in found)
         
         # Score based on percentage of keywords matched
         match_percentage = matches / len(field_keywords) if field_keywords else 0
         return match_percentage * 15
     
+    @timed('ats_scorer.score_formatting')
     def score_formatting(self, text):
         """Score formatting and structure"""
+        ctx = self.get_context(text)
+        text = ctx.text
         score = 0
         
         # Check for proper sections (headers)
         sections = ['experience', 'education', 'skills', 'summary']
-        section_count = sum(1 for section in sections if section in text.lower())
+        section_count = sum(1 for section in sections if section in ctx.text_lower)
         score += min(4, section_count)
         
         # Check for bullet points or structured lists
-        if '•' in text or '·' in text or re.search(r'^\s*[-*]\s', text, re.MULTILINE):
+        if '•' in text or '·' in text or BULLET_PATTERN.search(text):
             score += 2
         
         # Check for proper capitalization
-        if re.search(r'[A-Z][a-z]', text):
+        if CAPITALIZED_PATTERN.search(text):
             score += 1
         
         # Penalize excessive formatting issues
@@ -231,9 +291,10 @@ class ATSScorer:
         
         return max(0, min(7, score))
     
+    @timed('ats_scorer.score_length')
     def score_length(self, text):
         """Score resume length appropriateness"""
-        word_count = len(text.split())
+        word_count = self.get_context(text).word_count
         
         if 300 <= word_count <= 800:  # Optimal length
             return 5
@@ -244,45 +305,156 @@ class ATSScorer:
         else:  # Too long
             return 2
     
-    def save_analysis_history(self, resume_text, target_field, total_score, detailed_scores):
-        """Save analysis results for analytics"""
+    def history_row(self, resume_text, target_field, total_score, detailed_scores, timings=None):
+        """Build the analysis history row for one scored resume"""
+        ctx = self.get_context(resume_text)
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'target_field': target_field,
+            'ats_score': total_score,
+            'word_count': ctx.word_count,
+            'match_percentage': detailed_scores.get('keywords_match', 0) * (100/15),  # Convert to percentage
+            **{f'score_{k}': v for k, v in detailed_scores.items()},
+            **{f'seconds_{k}': v for k, v in (timings or {}).items()}
+        }
+    
+    def save_analysis_history(self, resume_text, target_field, total_score, detailed_scores, timings=None):
+        """Save analysis results for analytics, with optional per-stage timings in seconds"""
         try:
-            history_data = {
-                'timestamp': datetime.now().isoformat(),
-                'target_field': target_field,
-                'ats_score': total_score,
-                'word_count': len(resume_text.split()),
-                'match_percentage': detailed_scores.get('keywords_match', 0) * (100/15),  # Convert to percentage
-                **{f'score_{k}': v for k, v in detailed_scores.items()}
-            }
-            
-            # Create data directory if it doesn't exist
-            os.makedirs('data', exist_ok=True)
+            history_data = self.history_row(resume_text, target_field, total_score, detailed_scores, timings)
             
-            # Append to history file
-            history_file = 'data/analysis_history.csv'
-            if os.path.exists(history_file):
-                df = pd.read_csv(history_file)
-                df = pd.concat([df, pd.DataFrame([history_data])], ignore_index=True)
-            else:
-                df = pd.DataFrame([history_data])
-            
-            df.to_csv(history_file, index=False)
+            # Hand off to the configured history backend (append-only CSV or SQLite)
+            get_history_store().append(history_data)
+        except Exception as e:
+            print(f"Error saving analysis history: {e}")
+    
+    def score_batch(self, texts, target_field, save_history=True):
+        """Score many resumes at once with vectorized string operations
+        
+        Returns a DataFrame with one row per resume: every category score, the word
+        count and the clipped ATS score. Scores match calculate_ats_score exactly.
+        """
+        text = pd.Series(list(texts), dtype=object)
+        lower = text.str.lower()
+        
+        def contains(series, pattern):
+            if isinstance(pattern, str):
+                return series.str.contains(pattern, regex=False).to_numpy(dtype=bool)
+            return series.str.contains(pattern).to_numpy(dtype=bool)
+        
+        def contains_any(series, words):
+            found = np.zeros(len(series), dtype=bool)
+            for word in words:
+                found |= contains(series, word)
+            return found
+        
+        scores = pd.DataFrame(index=text.index)
+        
+        # Contact Information (10 points)
+        phone = np.zeros(len(text), dtype=bool)
+        for pattern in PHONE_PATTERNS:
+            phone |= contains(text, pattern)
+        scores['contact_info'] = (
+            np.where(contains(text, EMAIL_PATTERN), 4, 0)
+            + np.where(phone, 3, 0)
+            + np.where(contains_any(lower, ['linkedin', 'github', 'portfolio']), 3, 0)
+        )
+        
+        # Professional Summary (8 points) - line-oriented, only resumes with a heading need the full check
+        has_summary = contains_any(lower, ['summary', 'objective', 'profile', 'about', 'overview'])
+        scores['professional_summary'] = [
+            self.score_professional_summary(resume) if flagged else 0
+            for resume, flagged in zip(text, has_summary)
+        ]
+        
+        # Work Experience (25 points)
+        job_count = sum(lower.str.count(pattern).to_numpy() for pattern in DATE_PATTERNS)
+        experience_keywords = ['experience', 'employment', 'work history', 'career', 'professional experience']
+        scores['work_experience'] = np.minimum(25, (
+            np.where(contains_any(lower, experience_keywords), 10, 0)
+            + np.select([job_count >= 3, job_count >= 2, job_count >= 1], [15, 10, 5], 0)
+        ))
+        
+        # Education (10 points)
+        education_keywords = ['education', 'degree', 'university', 'college', 'bachelor', 'master', 'phd', 'diploma']
+        scores['education'] = np.minimum(10, (
+            np.where(contains_any(lower, education_keywords), 2, 0)
+            + np.where(contains(text, YEAR_PATTERN), 3, 0)
+            + np.where(contains(lower, GPA_PATTERN), 2, 0)
+            + np.where(contains_any(lower, ['coursework', 'certification', 'certified', 'course']), 3, 0)
+        ))
+        
+        # Skills (20 points) and Keywords Match (15 points) share one scan per keyword
+        matcher = get_keyword_matcher()
+        field_keywords = matcher.field_keywords.get(target_field, ())
+        keyword_hits = {}
+        for keyword in field_keywords:
+            keyword = keyword.lower()
+            if keyword not in keyword_hits:
+                keyword_hits[keyword] = contains(lower, keyword).astype(int)
+        matches = sum((keyword_hits[keyword.lower()] for keyword in field_keywords), np.zeros(len(text), dtype=int))
+        
+        scores['skills'] = np.where(contains(lower, 'skill'), 5, 0) + np.minimum(15, matches * 1.5)
+        scores['keywords_match'] = (matches / len(field_keywords) if field_keywords else np.zeros(len(text))) * 15
+        
+        # Formatting (7 points)
+        section_count = sum(contains(lower, section).astype(int) for section in ['experience', 'education', 'skills', 'summary'])
+        bullets = contains(text, '•') | contains(text, '·') | contains(text, BULLET_PATTERN)
+        formatting = (
+            np.minimum(4, section_count)
+            + np.where(bullets, 2, 0)
+            + np.where(contains(text, CAPITALIZED_PATTERN), 1, 0)
+            - np.where(text.str.count('\n\n\n').to_numpy() > 5, 1, 0)
+        )
+        scores['formatting'] = np.clip(formatting, 0, 7)
+        
+        # Length (5 points)
+        word_count = text.str.split().str.len().fillna(0).astype(int).to_numpy()
+        scores['length'] = np.select(
+            [
+                (word_count >= 300) & (word_count <= 800),
+                ((word_count >= 200) & (word_count < 300)) | ((word_count > 800) & (word_count <= 1200)),
+                word_count < 200
+            ],
+            [5, 3, 1],
+            2
+        )
+        
+        # Same summation order as calculate_ats_score so totals are bit-identical
+        total = 0
+        for category in self.scoring_criteria:
+            total = total + scores[category].to_numpy()
+        
+        scores['word_count'] = word_count
+        scores['total_score'] = total
+        scores['ats_score'] = np.clip(total, 0, 100)
+        
+        if save_history:
+            self.save_batch_history(target_field, scores)
+        
+        return scores
+    
+    def save_batch_history(self, target_field, batch_scores):
+        """Save the results of a scored batch with a single history write"""
+        try:
+            timestamp = datetime.now().isoformat()
+            rows = []
+            for record in batch_scores.to_dict('records'):
+                rows.append({
+                    'timestamp': timestamp,
+                    'target_field': target_field,
+                    'ats_score': record['total_score'],
+                    'word_count': record['word_count'],
+                    'match_percentage': record['keywords_match'] * (100/15),
+                    **{f'score_{k}': record[k] for k in self.scoring_criteria}
+                })
+            get_history_store().extend(rows)
         except Exception as e:
             print(f"Error saving analysis history: {e}")
     
     def get_detailed_breakdown(self, resume_text, target_field):
         """Get detailed breakdown of ATS scoring"""
-        scores = {}
-        
-        scores['contact_info'] = self.score_contact_info(resume_text)
-        scores['professional_summary'] = self.score_professional_summary(resume_text)
-        scores['work_experience'] = self.score_work_experience(resume_text)
-        scores['education'] = self.score_education(resume_text)
-        scores['skills'] = self.score_skills(resume_text, target_field)
-        scores['keywords_match'] = self.score_keywords_match(resume_text, target_field)
-        scores['formatting'] = self.score_formatting(resume_text)
-        scores['length'] = self.score_length(resume_text)
+        scores = self.score_all(resume_text, target_field)
         
         # Calculate percentages
         breakdown = {}
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Headless bulk screening of resumes across a process pool
+
+Usage:
+    python -m ats_screen score resumes/ --field "Data Analyst" --workers 8 --output results.jsonl
+    python -m ats_screen score batch.zip --field "Consultant" --output results.csv
+
+Results are streamed to the output file as each resume finishes. The output file is
+also the checkpoint: rerunning the same command skips every resume already in it.
+"""
+
+import argparse
+import csv
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+MIME_TYPES = {
+    '.pdf': 'application/pdf',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.txt': 'text/plain'
+}
+
+# History rows from the workers are handed to the store in batches of this size
+HISTORY_BATCH_SIZE = 500
+
+RESULT_COLUMNS = [
+    'file', 'status', 'error', 'target_field', 'ats_score', 'word_count', 'match_percentage',
+    'recommended_field', 'field_confidence', 'contact_info', 'professional_summary',
+    'work_experience', 'education', 'skills', 'keywords_match', 'formatting', 'length'
+]
+
+
+class LocalUpload:
+    """Minimal stand-in for a Streamlit UploadedFile backed by raw bytes"""
+
+    def __init__(self, name, data):
+        self.name = name
+        self.type = MIME_TYPES.get(os.path.splitext(name)[1].lower(), 'application/octet-stream')
+        self.size = len(data)
+        self._buffer = io.BytesIO(data)
+
+    def read(self, *args):
+        return self._buffer.read(*args)
+
+    def seek(self, *args):
+        return self._buffer.seek(*args)
+
+    def getvalue(self):
+        return self._buffer.getvalue()
+
+
+def discover_resumes(source):
+    """List (source, member) pairs for every supported resume in a directory or zip archive"""
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            return sorted(
+                (source, name) for name in archive.namelist()
+                if not name.endswith('/') and os.path.splitext(name)[1].lower() in MIME_TYPES
+            )
+
+    found = []
+    for root, _, files in os.walk(source):
+        for name in files:
+            if os.path.splitext(name)[1].lower() in MIME_TYPES:
+                found.append((None, os.path.join(root, name)))
+    return sorted(found)
+
+
+def resume_key(item):
+    source, member = item
+    return f"{source}:{member}" if source else member
+
+
+# Per-process state, built once by the pool initializer
+_worker = {}
+
+
+def _init_worker(target_field, record_history, profile=False):
+    from ats_scorer import ATSScorer
+    from extraction_pool import EXTRACTION_WORKERS, ExtractionPool
+    from profiler import get_profiler
+    from resume_analyzer import ResumeAnalyzer
+    from text_extractor import TextExtractor
+
+    # Executor workers are not daemonic, so each runs PDF/DOCX parsing in its own isolated
+    # child under the extraction timeout and memory cap; a hung file cannot stall the run
+    _worker['extractor'] = TextExtractor(isolate=ExtractionPool(workers=1) if EXTRACTION_WORKERS > 0 else False)
+    _worker['scorer'] = ATSScorer()
+    _worker['analyzer'] = ResumeAnalyzer()
+    _worker['target_field'] = target_field
+    _worker['record_history'] = record_history
+    _worker['archives'] = {}
+    _worker['profiler'] = get_profiler()
+    if profile:
+        _worker['profiler'].enabled = True
+
+
+def _read_resume(item):
+    source, member = item
+    if source is None:
+        with open(member, 'rb') as f:
+            return f.read()
+
+    archive = _worker['archives'].get(source)
+    if archive is None:
+        archive = zipfile.ZipFile(source)
+        _worker['archives'][source] = archive
+    return archive.read(member)
+
+
+def _screen(item, target_field, result):
+    """Fill in the result for one resume"""
+    upload = LocalUpload(item[1], _read_resume(item))
+    resume_text = _worker['extractor'].extract_text(upload)
+    if not resume_text:
+        result.update(status='error', error=_worker['extractor'].last_error or 'no text extracted')
+        return
+
+    scorer = _worker['scorer']
+    analyzer = _worker['analyzer']
+    ctx = scorer.get_context(resume_text)
+
+    scores = scorer.score_all(ctx, target_field)
+    total_score = sum(scores.values())
+    # Returned to the parent, which owns the history store; a worker's own writer would
+    # still be buffering when the pool terminates it
+    history_row = None
+    if _worker['record_history']:
+        history_row = scorer.history_row(ctx, target_field, total_score, scores)
+
+    recommendations = analyzer.get_field_recommendations(resume_text)
+    recommended_field = max(recommendations, key=recommendations.get)
+    analysis = analyzer.analyze_resume(resume_text, target_field)
+
+    result.update(scores)
+    result.update(
+        ats_score=min(100, max(0, total_score)),
+        word_count=ctx.word_count,
+        match_percentage=analysis['match_percentage'],
+        recommended_field=recommended_field,
+        field_confidence=float(recommendations[recommended_field])
+    )
+    return history_row
+
+
+def screen_resume(item):
+    """Extract, score and classify one resume; runs inside a pool worker
+
+    Returns the result row and, with --record-history, the analysis history row.
+    """
+    target_field = _worker['target_field']
+    result = {'file': resume_key(item), 'status': 'ok', 'error': '', 'target_field': target_field}
+    history_row = None
+
+    try:
+        with _worker['profiler'].capture(f"screen-{os.path.basename(item[1])}"):
+            history_row = _screen(item, target_field, result)
+    except Exception as e:
+        result.update(status='error', error=str(e))
+
+    return result, history_row
+
+
+def screen_chunk(items):
+    """Screen a chunk of resumes in one worker round trip"""
+    return [screen_resume(item) for item in items]
+
+
+def _imap_unordered(executor, fn, iterable, window):
+    """Yield fn(item) results as they finish, keeping at most `window` items in flight"""
+    in_flight = set()
+    for item in iterable:
+        if len(in_flight) >= window:
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                yield future.result()
+        in_flight.add(executor.submit(fn, item))
+
+    while in_flight:
+        finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in finished:
+            yield future.result()
+
+
+class ResultWriter:
+    """Streams results to JSONL or CSV and remembers which resumes are already done"""
+
+    def __init__(self, output_file):
+        self.output_file = output_file
+        self.format = 'csv' if output_file.lower().endswith('.csv') else 'jsonl'
+        self._drop_torn_line()
+        self.completed = self._load_completed()
+
+        directory = os.path.dirname(output_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        is_new = not os.path.exists(output_file) or os.path.getsize(output_file) == 0
+        self._file = open(output_file, 'a', newline='')
+        if self.format == 'csv':
+            self._csv = csv.DictWriter(self._file, fieldnames=RESULT_COLUMNS, extrasaction='ignore')
+            if is_new:
+                self._csv.writeheader()
+
+    def _drop_torn_line(self):
+        """Cut a partial last record left by an interrupted run so appends start on a fresh line"""
+        if not os.path.exists(self.output_file):
+            return
+
+        with open(self.output_file, 'rb+') as f:
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(0, position - 4096)
+                f.seek(start)
+                chunk = f.read(position - start)
+                newline = chunk.rfind(b'\n')
+                if newline != -1:
+                    position = start + newline + 1
+                    break
+                position = start
+            if position < end:
+                f.truncate(position)
+
+    def _load_completed(self):
+        if not os.path.exists(self.output_file):
+            return set()
+
+        completed = set()
+        with open(self.output_file, 'r', newline='') as f:
+            if self.format == 'csv':
+                for row in csv.DictReader(f):
+                    completed.add(row.get('file'))
+            else:
+                for line in f:
+                    try:
+                        completed.add(json.loads(line)['file'])
+                    except (ValueError, KeyError):
+                        continue
+        return completed
+
+    def write(self, result):
+        if self.format == 'csv':
+            self._csv.writerow(result)
+        else:
+            self._file.write(json.dumps(result) + '\n')
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def format_progress(done, total, started_at):
+    elapsed = time.monotonic() - started_at
+    rate = done / elapsed if elapsed > 0 else 0
+    eta = (total - done) / rate if rate > 0 else 0
+    return f"\r⚡ {done}/{total} resumes | {rate:.1f}/s | ETA {int(eta // 60)}m{int(eta % 60):02d}s"
+
+
+def score_command(args):
+    items = discover_resumes(args.source)
+    writer = ResultWriter(args.output)
+    pending = [item for item in items if resume_key(item) not in writer.completed]
+
+    print(f"📂 Found {len(items)} resumes, {len(items) - len(pending)} already screened, {len(pending)} to go")
+    if not pending:
+        writer.close()
+        return 0
+
+    history_store = None
+    history_rows = []
+    if args.record_history:
+        from history_store import get_history_store
+        history_store = get_history_store()
+
+    started_at = time.monotonic()
+    errors = 0
+    done = 0
+    last_report = 0
+    chunks = [pending[i:i + args.chunksize] for i in range(0, len(pending), args.chunksize)]
+
+    # Spawned, not forked: the parent already runs the history store's writer thread, and
+    # the executor starts workers lazily while results are coming in
+    with ProcessPoolExecutor(
+        max_workers=args.workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+        initargs=(args.field, args.record_history, args.profile)
+    ) as executor:
+        try:
+            for chunk_results in _imap_unordered(executor, screen_chunk, chunks, window=2 * args.workers):
+                for result, history_row in chunk_results:
+                    done += 1
+                    writer.write(result)
+                    if result['status'] != 'ok':
+                        errors += 1
+                    if history_row is not None:
+                        history_rows.append(history_row)
+                        if len(history_rows) >= HISTORY_BATCH_SIZE:
+                            history_store.extend(history_rows)
+                            history_rows = []
+
+                now = time.monotonic()
+                if now - last_report >= 1 or done == len(pending):
+                    sys.stderr.write(format_progress(done, len(pending), started_at))
+                    sys.stderr.flush()
+                    last_report = now
+        finally:
+            writer.close()
+            if history_store is not None:
+                history_store.extend(history_rows)
+                history_store.flush()
+
+    sys.stderr.write('\n')
+    print(f"✅ Screened {len(pending)} resumes ({errors} errors) in {time.monotonic() - started_at:.1f}s -> {args.output}")
+    return 0
+
+
+def main(argv=None):
+    from keyword_registry import get_registry
+
+    parser = argparse.ArgumentParser(prog='ats_screen', description="Bulk resume screening")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    score_parser = subparsers.add_parser('score', help="Score every resume in a directory or zip archive")
+    score_parser.add_argument('source', help="Directory or .zip archive of PDF/DOCX/TXT resumes")
+    score_parser.add_argument('--field', required=True, choices=get_registry().fields(), help="Target job field")
+    score_parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Worker processes")
+    score_parser.add_argument('--output', default='screening_results.jsonl', help="Results file (.jsonl or .csv)")
+    score_parser.add_argument('--chunksize', type=int, default=8, help="Resumes handed to a worker at a time")
+    score_parser.add_argument('--record-history', action='store_true', help="Also record each analysis in the dashboard history")
+    score_parser.add_argument('--profile', action='store_true', help="Write a cProfile/tracemalloc capture per resume to data/profiles")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'score':
+        return score_command(args)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+import atexit
+import io
+import multiprocessing
+import os
+import queue
+import threading
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+EXTRACTION_WORKERS = int(os.environ.get('ATS_EXTRACTION_WORKERS', min(4, os.cpu_count() or 1)))
+EXTRACTION_TIMEOUT = float(os.environ.get('ATS_EXTRACTION_TIMEOUT', 30))
+EXTRACTION_MEMORY_MB = int(os.environ.get('ATS_EXTRACTION_MEMORY_MB', 1024))
+EXTRACTION_MAX_JOBS = int(os.environ.get('ATS_EXTRACTION_MAX_JOBS', 50))
+
+
+class ExtractionError(Exception):
+    """Extraction failed inside a worker process"""
+
+
+class ExtractionTimeout(ExtractionError):
+    """Extraction ran past its wall-clock limit and the worker was killed"""
+
+
+class _WorkerUpload(io.BytesIO):
+    """Upload stand-in rebuilt from raw bytes inside a worker"""
+
+    def __init__(self, data, file_type):
+        super().__init__(data)
+        self.type = file_type
+
+
+def _current_address_space():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return 0
+
+
+def _worker_main(conn, memory_limit_mb, max_jobs):
+    """Worker loop: extract up to max_jobs documents, then exit so the parent starts a fresh one"""
+    from text_extractor import TextExtractor
+
+    extractor = TextExtractor(cache=False, isolate=False)
+
+    # Cap growth beyond what the imports above already mapped
+    if resource is not None and memory_limit_mb:
+        limit = _current_address_space() + memory_limit_mb * 1024 * 1024
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ValueError, OSError):
+            pass
+
+    for _ in range(max_jobs):
+        try:
+            job = conn.recv()
+            if job is None:
+                return
+
+            data, file_type, max_pdf_pages, max_chars = job
+            extractor.max_pdf_pages = max_pdf_pages
+            extractor.max_chars = max_chars
+            text = extractor.parse_by_type(_WorkerUpload(data, file_type), file_type)
+            conn.send(('ok', text))
+        except EOFError:
+            return
+        except MemoryError:
+            # The heap may be left fragmented, so the worker retires after reporting
+            conn.send(('memory', f'memory limit of {memory_limit_mb} MB exceeded'))
+            return
+        except Exception as e:
+            conn.send(('error', str(e)))
+
+
+class _Worker:
+    def __init__(self, context, memory_limit_mb, max_jobs):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, memory_limit_mb, max_jobs),
+            name='extraction-worker',
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.jobs_done = 0
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+
+class ExtractionPool:
+    """Recycled worker processes that run PDF/DOCX extraction under a timeout and memory cap"""
+
+    def __init__(self, workers=EXTRACTION_WORKERS, timeout=EXTRACTION_TIMEOUT,
+                 memory_limit_mb=EXTRACTION_MEMORY_MB, max_jobs_per_worker=EXTRACTION_MAX_JOBS):
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.max_jobs_per_worker = max(1, max_jobs_per_worker)
+        self.timeouts = 0
+        self.recycled = 0
+
+        # spawn, not fork: the parent is a threaded Streamlit server
+        self._context = multiprocessing.get_context('spawn')
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._started = 0
+        self._closed = False
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._started < self.workers:
+                self._started += 1
+                try:
+                    return _Worker(self._context, self.memory_limit_mb, self.max_jobs_per_worker)
+                except Exception:
+                    self._started -= 1
+                    raise
+
+        return self._idle.get()
+
+    def _discard(self, worker, kill=False):
+        if kill:
+            worker.kill()
+        else:
+            worker.stop()
+        with self._lock:
+            self._started -= 1
+        # Wake a waiter so it can start a replacement worker
+        self._idle.put(None)
+
+    def _release(self, worker):
+        if worker.jobs_done >= self.max_jobs_per_worker or self._closed:
+            self.recycled += 1
+            self._discard(worker)
+        else:
+            self._idle.put(worker)
+
+    def extract(self, data, file_type, max_pdf_pages=None, max_chars=None):
+        """Extract text from raw file bytes in a worker; raises ExtractionError or ExtractionTimeout"""
+        worker = None
+        while worker is None:
+            worker = self._acquire()  # None is a wake-up token left by a discarded worker
+
+        try:
+            worker.conn.send((data, file_type, max_pdf_pages, max_chars))
+            if not worker.conn.poll(self.timeout):
+                self.timeouts += 1
+                self._discard(worker, kill=True)
+                raise ExtractionTimeout(f"extraction took longer than {self.timeout:.0f}s")
+            status, payload = worker.conn.recv()
+        except (EOFError, OSError) as e:
+            self._discard(worker, kill=True)
+            raise ExtractionError(f"extraction worker crashed: {e}")
+
+        worker.jobs_done += 1
+        if status == 'memory':
+            self._discard(worker)
+        else:
+            self._release(worker)
+
+        if status != 'ok':
+            raise ExtractionError(payload)
+        return payload
+
+    def close(self):
+        """Stop every idle worker"""
+        self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if worker is not None:
+                worker.stop()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_extraction_pool():
+    """Return the shared extraction pool, or None when isolation is disabled"""
+    global _pool
+    if EXTRACTION_WORKERS <= 0:
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ExtractionPool()
+                atexit.register(_pool.close)
+    return _pool
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+import scipy.sparse as sp
+
+FEATURE_CACHE_DIR = 'data/feature_cache'
+
+# Bump when preprocess_text changes so cached cleaned text is not reused
+FEATURE_CACHE_VERSION = '1'
+
+# Appended rows reuse the cached vocabulary and idf weights until they exceed this
+# fraction of the rows the vectorizer was fitted on; then everything is refitted
+REFIT_FRACTION = 0.25
+
+# Cleaned, non-empty training rows with their TF-IDF matrix, the fitted vectorizer and the dataset fingerprint
+FeatureSet = namedtuple('FeatureSet', ['vectorizer', 'texts', 'labels', 'matrix', 'status', 'fingerprint'])
+
+
+def _params_key(vectorizer):
+    params = {name: repr(value) for name, value in sorted(vectorizer.get_params().items())}
+    params['cache_version'] = FEATURE_CACHE_VERSION
+    params['vectorizer'] = type(vectorizer).__name__
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode('utf-8')).hexdigest()[:24]
+
+
+def row_hashes(texts, labels):
+    """64-bit content digest of every (text, label) row"""
+    hashes = np.empty(len(texts), dtype=np.uint64)
+    for i, (text, label) in enumerate(zip(texts, labels)):
+        digest = hashlib.blake2b(f'{text}\0{label}'.encode('utf-8'), digest_size=8).digest()
+        hashes[i] = int.from_bytes(digest, 'little')
+    return hashes
+
+
+def dataset_fingerprint(hashes):
+    return hashlib.sha256(hashes.tobytes()).hexdigest()
+
+
+class FeatureCache:
+    """Cleaned training text and TF-IDF features kept on disk per vectorizer configuration"""
+
+    def __init__(self, cache_dir=FEATURE_CACHE_DIR, refit_fraction=REFIT_FRACTION):
+        self.cache_dir = cache_dir
+        self.refit_fraction = refit_fraction
+        self._lock = threading.Lock()
+
+    def _entry_dir(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def _read_entry(self, key):
+        entry_dir = self._entry_dir(key)
+        if not os.path.isdir(entry_dir):
+            return None
+        try:
+            with open(os.path.join(entry_dir, 'meta.json'), 'r') as f:
+                meta = json.load(f)
+            with open(os.path.join(entry_dir, 'rows.json'), 'r') as f:
+                rows = json.load(f)
+            with open(os.path.join(entry_dir, 'vectorizer.pkl'), 'rb') as f:
+                vectorizer = pickle.load(f)
+            return {
+                'meta': meta,
+                'hashes': np.load(os.path.join(entry_dir, 'row_hashes.npy')),
+                'cleaned': rows['cleaned'],
+                'labels': rows['labels'],
+                'vectorizer': vectorizer,
+                'matrix': sp.load_npz(os.path.join(entry_dir, 'features.npz')).tocsr()
+            }
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable feature cache {entry_dir}: {e}")
+            return None
+
+    def _write_entry(self, key, hashes, cleaned, labels, vectorizer, matrix, fitted_rows):
+        """Write the entry into a temporary directory and swap it in"""
+        entry_dir = self._entry_dir(key)
+        tmp_dir = f'{entry_dir}.{os.getpid()}.tmp'
+        old_dir = f'{entry_dir}.{os.getpid()}.old'
+        try:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            os.makedirs(tmp_dir)
+
+            np.save(os.path.join(tmp_dir, 'row_hashes.npy'), hashes)
+            sp.save_npz(os.path.join(tmp_dir, 'features.npz'), matrix)
+            with open(os.path.join(tmp_dir, 'rows.json'), 'w') as f:
+                json.dump({'cleaned': cleaned, 'labels': labels}, f)
+            with open(os.path.join(tmp_dir, 'vectorizer.pkl'), 'wb') as f:
+                pickle.dump(vectorizer, f)
+            with open(os.path.join(tmp_dir, 'vocabulary.json'), 'w') as f:
+                json.dump(sorted(vectorizer.vocabulary_, key=vectorizer.vocabulary_.get), f)
+            with open(os.path.join(tmp_dir, 'meta.json'), 'w') as f:
+                json.dump({
+                    'fingerprint': dataset_fingerprint(hashes),
+                    'rows': len(hashes),
+                    'fitted_rows': fitted_rows,
+                    'features': matrix.shape[1],
+                    'created': time.time()
+                }, f)
+
+            if os.path.exists(entry_dir):
+                os.rename(entry_dir, old_dir)
+            os.rename(tmp_dir, entry_dir)
+            shutil.rmtree(old_dir, ignore_errors=True)
+        except Exception as e:
+            print(f"⚠️ Could not write feature cache: {e}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def load(self, texts, labels, vectorizer, preprocess):
+        """Return the FeatureSet for a dataset, computing only what the cache does not hold
+
+        status is 'hit' when the dataset is unchanged, 'append' when new rows were added to
+        a cached dataset and only those were transformed, and 'miss' after a full fit.
+        """
+        texts = [str(text) for text in texts]
+        labels = [str(label) for label in labels]
+        hashes = row_hashes(texts, labels)
+        fingerprint = dataset_fingerprint(hashes)
+        key = _params_key(vectorizer)
+
+        with self._lock:
+            entry = self._read_entry(key)
+
+            if entry is not None and entry['meta']['fingerprint'] == fingerprint:
+                return self._feature_set(entry['vectorizer'], entry['cleaned'], entry['labels'], entry['matrix'], 'hit', fingerprint)
+
+            if entry is not None and self._is_append(entry, hashes):
+                cached_rows = len(entry['hashes'])
+                new_cleaned = [preprocess(text) for text in texts[cached_rows:]]
+                new_matrix = entry['vectorizer'].transform(new_cleaned).tocsr()
+
+                cleaned = entry['cleaned'] + new_cleaned
+                matrix = sp.vstack([entry['matrix'], new_matrix], format='csr')
+                self._write_entry(key, hashes, cleaned, labels, entry['vectorizer'], matrix, entry['meta']['fitted_rows'])
+                return self._feature_set(entry['vectorizer'], cleaned, labels, matrix, 'append', fingerprint)
+
+            cleaned = [preprocess(text) for text in texts]
+            non_empty = [i for i, text in enumerate(cleaned) if text]
+            fitted = vectorizer.fit_transform([cleaned[i] for i in non_empty]).tocsr()
+
+            # Empty rows get all-zero feature rows so the matrix lines up with the dataset
+            matrix = sp.csr_matrix((len(cleaned), fitted.shape[1]), dtype=fitted.dtype)
+            if non_empty:
+                placement = sp.csr_matrix(
+                    (np.ones(len(non_empty)), (non_empty, np.arange(len(non_empty)))),
+                    shape=(len(cleaned), len(non_empty))
+                )
+                matrix = (placement @ fitted).tocsr()
+
+            # Counted over every row, like the appended ones _is_append compares against it
+            self._write_entry(key, hashes, cleaned, labels, vectorizer, matrix, len(cleaned))
+            return self._feature_set(vectorizer, cleaned, labels, matrix, 'miss', fingerprint)
+
+    def _is_append(self, entry, hashes):
+        cached_rows = len(entry['hashes'])
+        if cached_rows == 0 or cached_rows >= len(hashes):
+            return False
+        if not np.array_equal(entry['hashes'], hashes[:cached_rows]):
+            return False
+        # Too many rows judged by a stale vocabulary; refit instead
+        return len(hashes) - entry['meta']['fitted_rows'] <= self.refit_fraction * entry['meta']['fitted_rows']
+
+    def _feature_set(self, vectorizer, cleaned, labels, matrix, status, fingerprint):
+        """Drop rows whose cleaned text is empty, as prepare_data does"""
+        keep = [i for i, text in enumerate(cleaned) if text]
+        return FeatureSet(
+            vectorizer,
+            [cleaned[i] for i in keep],
+            np.array([labels[i] for i in keep], dtype=object),
+            matrix[keep],
+            status,
+            fingerprint
+        )
+
+    def clear(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_feature_cache():
+    """Return the shared feature cache"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = FeatureCache()
+    return _cache
@@ -0,0 +1,147 @@
+import sqlite3
+from collections import defaultdict
+
+SCORE_BINS = 15
+SCORE_LOW = 0
+SCORE_HIGH = 100
+
+
+def score_bin_edges(bins=SCORE_BINS, low=SCORE_LOW, high=SCORE_HIGH):
+    """Return the (start, end) pairs of the fixed-width score histogram bins"""
+    width = (high - low) / bins
+    return [(low + i * width, low + (i + 1) * width) for i in range(bins)]
+
+
+def score_bin(score, bins=SCORE_BINS, low=SCORE_LOW, high=SCORE_HIGH):
+    """Return the histogram bin index of a score"""
+    width = (high - low) / bins
+    return max(0, min(bins - 1, int((score - low) / width)))
+
+
+def _as_score(value):
+    try:
+        score = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if score != score else score  # NaN
+
+
+class HistoryRollups:
+    """Per-day, per-field aggregates of the analysis history kept in SQLite tables
+
+    The methods take a connection so the SQLite history store can update rollups in the
+    same transaction as the raw insert, while the CSV store keeps them in a side database.
+    """
+
+    def __init__(self, bins=SCORE_BINS, low=SCORE_LOW, high=SCORE_HIGH):
+        self.bins = bins
+        self.low = low
+        self.high = high
+
+    def create_schema(self, conn):
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS history_daily ('
+            'day TEXT NOT NULL, target_field TEXT NOT NULL, analyses INTEGER NOT NULL, '
+            'scored INTEGER NOT NULL, score_sum REAL NOT NULL, PRIMARY KEY (day, target_field))'
+        )
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS history_score_bins ('
+            'day TEXT NOT NULL, target_field TEXT NOT NULL, bin INTEGER NOT NULL, '
+            'analyses INTEGER NOT NULL, PRIMARY KEY (day, target_field, bin))'
+        )
+
+    def _aggregate(self, rows):
+        daily = defaultdict(lambda: [0, 0, 0.0])
+        bins = defaultdict(int)
+
+        for row in rows:
+            day = str(row.get('timestamp') or '')[:10]
+            field = row.get('target_field')
+            if not isinstance(field, str):
+                field = ''
+            totals = daily[(day, field)]
+            totals[0] += 1
+
+            score = _as_score(row.get('ats_score'))
+            if score is not None:
+                totals[1] += 1
+                totals[2] += score
+                bins[(day, field, score_bin(score, self.bins, self.low, self.high))] += 1
+
+        return daily, bins
+
+    def apply(self, conn, rows):
+        """Fold new history rows into the rollups; the caller owns the transaction"""
+        daily, bins = self._aggregate(rows)
+
+        conn.executemany(
+            'INSERT INTO history_daily (day, target_field, analyses, scored, score_sum) VALUES (?, ?, ?, ?, ?) '
+            'ON CONFLICT (day, target_field) DO UPDATE SET '
+            'analyses = analyses + excluded.analyses, scored = scored + excluded.scored, '
+            'score_sum = score_sum + excluded.score_sum',
+            [(day, field, *totals) for (day, field), totals in daily.items()]
+        )
+        conn.executemany(
+            'INSERT INTO history_score_bins (day, target_field, bin, analyses) VALUES (?, ?, ?, ?) '
+            'ON CONFLICT (day, target_field, bin) DO UPDATE SET analyses = analyses + excluded.analyses',
+            [(day, field, bin_index, count) for (day, field, bin_index), count in bins.items()]
+        )
+
+    def clear(self, conn):
+        conn.execute('DELETE FROM history_daily')
+        conn.execute('DELETE FROM history_score_bins')
+
+    def is_empty(self, conn):
+        return conn.execute('SELECT COUNT(*) FROM history_daily').fetchone()[0] == 0
+
+    def total_count(self, conn):
+        return conn.execute('SELECT COALESCE(SUM(analyses), 0) FROM history_daily').fetchone()[0]
+
+    def average_score(self, conn):
+        scored, score_sum = conn.execute('SELECT SUM(scored), SUM(score_sum) FROM history_daily').fetchone()
+        return score_sum / scored if scored else None
+
+    def day_count(self, conn, day):
+        return conn.execute(
+            'SELECT COALESCE(SUM(analyses), 0) FROM history_daily WHERE day = ?', (day,)
+        ).fetchone()[0]
+
+    def daily_counts(self, conn, since_day=None):
+        sql = 'SELECT day, SUM(analyses) FROM history_daily'
+        params = ()
+        if since_day is not None:
+            sql += ' WHERE day >= ?'
+            params = (since_day,)
+        sql += ' GROUP BY day ORDER BY day'
+        return dict(conn.execute(sql, params).fetchall())
+
+    def field_counts(self, conn, since_day=None):
+        sql = 'SELECT target_field, SUM(analyses) FROM history_daily'
+        params = ()
+        if since_day is not None:
+            sql += ' WHERE day >= ?'
+            params = (since_day,)
+        sql += ' GROUP BY target_field ORDER BY SUM(analyses) DESC'
+        return dict(conn.execute(sql, params).fetchall())
+
+    def score_histogram(self, conn, target_field=None):
+        sql = 'SELECT bin, SUM(analyses) FROM history_score_bins'
+        params = ()
+        if target_field is not None:
+            sql += ' WHERE target_field = ?'
+            params = (target_field,)
+        sql += ' GROUP BY bin'
+
+        counts = dict(conn.execute(sql, params).fetchall())
+        return [
+            (start, end, counts.get(i, 0))
+            for i, (start, end) in enumerate(score_bin_edges(self.bins, self.low, self.high))
+        ]
+
+
+def connect(db_file):
+    """Open a WAL-mode SQLite connection for history data"""
+    conn = sqlite3.connect(db_file, timeout=30)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    return conn
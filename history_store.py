@@ -0,0 +1,268 @@
+import argparse
+import os
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+from history_rollups import HistoryRollups, connect
+from history_writer import HISTORY_COLUMNS, HISTORY_FILE, HistoryWriter
+
+HISTORY_DB = 'data/analysis_history.db'
+
+# 'csv' keeps the append-only CSV log, 'sqlite' switches to the indexed database
+HISTORY_BACKEND = os.environ.get('ATS_HISTORY_BACKEND', 'csv').lower()
+
+
+def start_of_today():
+    """Return midnight today as an ISO timestamp, comparable with stored timestamps"""
+    return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
+
+
+class CSVHistoryStore(HistoryWriter):
+    """Append-only CSV history log with rollups kept in a side SQLite database"""
+
+    def __init__(self, history_file=HISTORY_FILE, rollup_db=None, **kwargs):
+        # Rollups live next to the log they summarise, e.g. data/analysis_history_rollups.db
+        self.rollup_db = rollup_db or os.path.splitext(history_file)[0] + '_rollups.db'
+        self.rollups = HistoryRollups()
+        self._local = threading.local()
+        self._rollup_lock = threading.Lock()
+
+        directory = os.path.dirname(self.rollup_db)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = self._connect()
+        with conn:
+            self.rollups.create_schema(conn)
+
+        super().__init__(history_file, **kwargs)
+
+        if self.rollups.is_empty(conn) and self._has_raw_rows():
+            self.rebuild_rollups()
+
+    def _connect(self):
+        """Return this thread's rollup connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = connect(self.rollup_db)
+            self._local.conn = conn
+        return conn
+
+    def _has_raw_rows(self):
+        if not os.path.exists(self.history_file):
+            return False
+        with open(self.history_file, 'r') as f:
+            f.readline()
+            return bool(f.readline().strip())
+
+    def _write_batch(self, rows):
+        # Append and roll up under one lock so a concurrent rebuild never counts a batch twice
+        with self._rollup_lock:
+            written = super()._write_batch(rows)
+            if written:
+                try:
+                    conn = self._connect()
+                    with conn:
+                        self.rollups.apply(conn, rows)
+                except Exception as e:
+                    print(f"Error updating analysis rollups: {e}")
+            return written
+
+    def rebuild_rollups(self, chunksize=50000):
+        """Regenerate every rollup from the raw CSV log"""
+        self.flush()
+        with self._rollup_lock:
+            conn = self._connect()
+            with conn:
+                self.rollups.clear(conn)
+                if os.path.exists(self.history_file):
+                    for chunk in pd.read_csv(self.history_file, chunksize=chunksize, on_bad_lines='skip'):
+                        self.rollups.apply(conn, chunk.to_dict('records'))
+
+    def _load_frame(self):
+        self.flush()
+        if not os.path.exists(self.history_file):
+            return pd.DataFrame(columns=self.columns)
+        return pd.read_csv(self.history_file, on_bad_lines='skip')
+
+    def total_count(self):
+        self.flush()
+        return self.rollups.total_count(self._connect())
+
+    def average_score(self):
+        self.flush()
+        return self.rollups.average_score(self._connect())
+
+    def count_since(self, since):
+        df = self._load_frame()
+        return int((df['timestamp'].astype(str) >= since).sum())
+
+    def today_count(self):
+        self.flush()
+        return self.rollups.day_count(self._connect(), start_of_today()[:10])
+
+    def daily_counts(self, since_day=None):
+        self.flush()
+        return self.rollups.daily_counts(self._connect(), since_day)
+
+    def field_counts(self, since_day=None):
+        self.flush()
+        return self.rollups.field_counts(self._connect(), since_day)
+
+    def score_histogram(self, target_field=None):
+        self.flush()
+        return self.rollups.score_histogram(self._connect(), target_field)
+
+    def close(self):
+        super().close()
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class SQLiteHistoryStore:
+    """Analysis history in a WAL-mode SQLite database indexed by timestamp and target field"""
+
+    def __init__(self, db_file=HISTORY_DB):
+        self.db_file = db_file
+        self.columns = list(HISTORY_COLUMNS)
+        self.rollups = HistoryRollups()
+        self._local = threading.local()
+
+        directory = os.path.dirname(db_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._create_schema()
+
+    def _connect(self):
+        """Return this thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = connect(self.db_file)
+            self._local.conn = conn
+        return conn
+
+    def _create_schema(self):
+        column_types = {'timestamp': 'TEXT', 'target_field': 'TEXT'}
+        column_sql = ', '.join(f'{column} {column_types.get(column, "REAL")}' for column in self.columns)
+
+        conn = self._connect()
+        with conn:
+            conn.execute(f'CREATE TABLE IF NOT EXISTS analysis_history ({column_sql})')
+            # Databases created before a column was added get it appended
+            existing = {row[1] for row in conn.execute('PRAGMA table_info(analysis_history)')}
+            for column in self.columns:
+                if column not in existing:
+                    conn.execute(f'ALTER TABLE analysis_history ADD COLUMN {column} {column_types.get(column, "REAL")}')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_history_timestamp ON analysis_history (timestamp)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_history_field ON analysis_history (target_field, timestamp)')
+            self.rollups.create_schema(conn)
+
+        if self.rollups.is_empty(conn) and self._scalar('SELECT COUNT(*) FROM analysis_history') > 0:
+            self.rebuild_rollups()
+
+    def append(self, row):
+        """Insert one history row"""
+        self.extend([row])
+
+    def extend(self, rows):
+        """Insert several history rows and update the rollups in one transaction"""
+        placeholders = ', '.join('?' for _ in self.columns)
+        values = [tuple(row.get(column) for column in self.columns) for row in rows]
+
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                f'INSERT INTO analysis_history ({", ".join(self.columns)}) VALUES ({placeholders})',
+                values
+            )
+            self.rollups.apply(conn, rows)
+
+    def rebuild_rollups(self, batch_size=50000):
+        """Regenerate every rollup from the raw history table"""
+        conn = self._connect()
+        with conn:
+            self.rollups.clear(conn)
+            cursor = conn.execute('SELECT timestamp, target_field, ats_score FROM analysis_history')
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    break
+                self.rollups.apply(conn, [
+                    {'timestamp': timestamp, 'target_field': field, 'ats_score': score}
+                    for timestamp, field, score in batch
+                ])
+
+    def flush(self):
+        """Rows are committed on insert; kept for API parity with the CSV writer"""
+
+    def close(self):
+        """Close this thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _scalar(self, sql, params=()):
+        return self._connect().execute(sql, params).fetchone()[0]
+
+    def total_count(self):
+        """Number of recorded analyses"""
+        return self.rollups.total_count(self._connect())
+
+    def average_score(self):
+        """Mean ATS score over all analyses, or None when there are none"""
+        return self.rollups.average_score(self._connect())
+
+    def count_since(self, since):
+        """Number of analyses recorded at or after an ISO timestamp"""
+        return self._scalar('SELECT COUNT(*) FROM analysis_history WHERE timestamp >= ?', (since,))
+
+    def today_count(self):
+        """Number of analyses recorded today"""
+        return self.rollups.day_count(self._connect(), start_of_today()[:10])
+
+    def daily_counts(self, since_day=None):
+        """Analyses per day, oldest first"""
+        return self.rollups.daily_counts(self._connect(), since_day)
+
+    def field_counts(self, since_day=None):
+        """Analyses per target field, most frequent first"""
+        return self.rollups.field_counts(self._connect(), since_day)
+
+    def score_histogram(self, target_field=None):
+        """Counts of ATS scores in fixed-width bins as (start, end, count) tuples"""
+        return self.rollups.score_histogram(self._connect(), target_field)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_history_store():
+    """Return the configured history backend, shared across the process"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                if HISTORY_BACKEND == 'sqlite':
+                    _store = SQLiteHistoryStore()
+                else:
+                    _store = CSVHistoryStore(HISTORY_FILE)
+    return _store
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analysis history maintenance")
+    parser.add_argument('command', choices=['rebuild-rollups'])
+    args = parser.parse_args()
+
+    if args.command == 'rebuild-rollups':
+        store = get_history_store()
+        store.rebuild_rollups()
+        print(f"✅ Rebuilt rollups for {store.total_count()} analyses ({HISTORY_BACKEND} backend)")
+        store.close()
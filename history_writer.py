@@ -0,0 +1,218 @@
+import atexit
+import csv
+import io
+import os
+import queue
+import threading
+import time
+import weakref
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+HISTORY_FILE = 'data/analysis_history.csv'
+
+HISTORY_COLUMNS = [
+    'timestamp', 'target_field', 'ats_score', 'word_count', 'match_percentage',
+    'score_contact_info', 'score_professional_summary', 'score_work_experience',
+    'score_education', 'score_skills', 'score_keywords_match', 'score_formatting',
+    'score_length', 'seconds_extraction', 'seconds_scoring', 'seconds_classification',
+    'seconds_gap_analysis', 'seconds_total'
+]
+
+
+class HistoryWriter:
+    """Append-only analysis history log fed by a bounded queue and a background flush thread"""
+
+    def __init__(self, history_file=HISTORY_FILE, max_buffered=10000, batch_size=500, flush_interval=0.5):
+        self.history_file = history_file
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.columns = list(HISTORY_COLUMNS)
+        self.rows_written = 0
+
+        self._queue = queue.Queue(maxsize=max_buffered)
+        self._file_lock = threading.Lock()
+        self._closed = False
+
+        self._prepare_file()
+
+        self._thread = threading.Thread(target=self._run, name='history-writer', daemon=True)
+        self._thread.start()
+        _open_writers.add(self)
+
+    def _prepare_file(self):
+        """Create the log or adopt its header, and isolate any torn line left by a crash"""
+        directory = os.path.dirname(self.history_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if not os.path.exists(self.history_file) or os.path.getsize(self.history_file) == 0:
+            return
+
+        with open(self.history_file, 'r', newline='') as f:
+            header = next(csv.reader(f), [])
+        if header:
+            # Keep the existing column order; new columns are appended to the header once
+            missing = [column for column in HISTORY_COLUMNS if column not in header]
+            self.columns = header + missing
+            if missing:
+                self._rewrite_header()
+
+        with open(self.history_file, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            ends_with_newline = f.read(1) == b'\n'
+        if not ends_with_newline:
+            self._append_bytes(b'\n')
+
+    def _rewrite_header(self):
+        """One-off migration of an older log to the current column set
+
+        Holds the same exclusive lock as appends, keeps every row (a malformed one verbatim)
+        and swaps the migrated copy in with os.replace.
+        """
+        with self._file_lock:
+            fd = os.open(self.history_file, os.O_RDONLY)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                with open(self.history_file, 'r', newline='') as source:
+                    reader = csv.reader(source)
+                    header = next(reader, [])
+                    missing = [column for column in HISTORY_COLUMNS if column not in header]
+                    self.columns = header + missing
+                    if not missing:
+                        return  # another process migrated it while we waited for the lock
+
+                    tmp_file = f'{self.history_file}.{os.getpid()}.tmp'
+                    with open(tmp_file, 'w', newline='') as target:
+                        writer = csv.writer(target, lineterminator='\n')
+                        writer.writerow(self.columns)
+                        for row in reader:
+                            if not row:
+                                continue
+                            if len(row) <= len(header):
+                                row = row + [''] * (len(self.columns) - len(row))
+                            writer.writerow(row)
+                os.replace(tmp_file, self.history_file)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+
+    def _format_rows(self, rows):
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=self.columns, extrasaction='ignore', lineterminator='\n')
+        writer.writerows(rows)
+        return buffer.getvalue().encode('utf-8')
+
+    def _header_bytes(self):
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator='\n').writerow(self.columns)
+        return buffer.getvalue().encode('utf-8')
+
+    def _open_locked(self):
+        """Open the log for appending under an exclusive lock on the file currently at its path"""
+        while True:
+            fd = os.open(self.history_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            if fcntl is None:
+                return fd
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                if os.stat(self.history_file).st_ino == os.fstat(fd).st_ino:
+                    return fd
+            except FileNotFoundError:
+                pass
+            # A header migration replaced the file while we waited; append to the new one
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def _append_bytes(self, data):
+        """Append whole lines with a single write under an exclusive lock, then fsync"""
+        with self._file_lock:
+            fd = self._open_locked()
+            try:
+                if os.fstat(fd).st_size == 0:
+                    data = self._header_bytes() + data
+                os.write(fd, data)
+                os.fsync(fd)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+
+    def _write_batch(self, rows):
+        try:
+            self._append_bytes(self._format_rows(rows))
+            self.rows_written += len(rows)
+            return True
+        except Exception as e:
+            print(f"Error saving analysis history: {e}")
+            return False
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            stopping = batch[0] is None
+
+            # Collect rows for up to flush_interval so bursts share one write and fsync
+            deadline = time.monotonic() + self.flush_interval
+            while not stopping and len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    row = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(row)
+                stopping = row is None
+
+            if stopping:
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+            rows = [row for row in batch if row is not None]
+            if rows:
+                self._write_batch(rows)
+            for _ in batch:
+                self._queue.task_done()
+
+    def append(self, row):
+        """Queue one history row; blocks only if the buffer is full"""
+        if self._closed:
+            self._write_batch([row])
+            return
+        self._queue.put(row)
+
+    def extend(self, rows):
+        """Queue several history rows"""
+        for row in rows:
+            self.append(row)
+
+    def flush(self):
+        """Block until every queued row is on disk"""
+        self._queue.join()
+
+    def close(self):
+        """Flush pending rows and stop the background thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout=10)
+
+
+_open_writers = weakref.WeakSet()
+
+
+@atexit.register
+def _close_writers():
+    for writer in list(_open_writers):
+        writer.close()
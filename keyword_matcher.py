@@ -0,0 +1,122 @@
+import threading
+from collections import deque
+
+from keyword_registry import get_registry
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton that finds every field keyword in a single pass over the text"""
+
+    def __init__(self, field_keywords, word_boundary=False):
+        self.field_keywords = field_keywords
+        self.word_boundary = word_boundary
+
+        # Trie nodes: transitions, failure link and the patterns that end at each node
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+
+        for keywords in field_keywords.values():
+            for keyword in keywords:
+                self._add_pattern(keyword.lower())
+
+        self._build_failure_links()
+
+    def _add_pattern(self, pattern):
+        if not pattern:
+            return
+
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            node = next_node
+
+        if pattern not in self._output[node]:
+            self._output[node] = self._output[node] + (pattern,)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+
+                # Inherit the matches of the longest proper suffix
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def _at_word_boundary(self, text, start, end):
+        before_ok = start == 0 or not text[start - 1].isalnum()
+        after_ok = end == len(text) or not text[end].isalnum()
+        return before_ok and after_ok
+
+    def iter_matches(self, text):
+        """Yield (start, end, keyword) for every keyword occurrence in lowercased text"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        node = 0
+
+        for index, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+
+            for pattern in output[node]:
+                end = index + 1
+                start = end - len(pattern)
+                if self.word_boundary and not self._at_word_boundary(text, start, end):
+                    continue
+                yield start, end, pattern
+
+    def find_all(self, text):
+        """Return a list of (start, end, keyword) matches in text order"""
+        return list(self.iter_matches(text))
+
+    def find_keywords(self, text):
+        """Return the set of distinct keywords present in the text"""
+        return {pattern for _, _, pattern in self.iter_matches(text)}
+
+    def match_fields(self, text, found=None):
+        """Return the matched keywords of every field, in registry order"""
+        if found is None:
+            found = self.find_keywords(text)
+
+        return {
+            field: [keyword for keyword in keywords if keyword.lower() in found]
+            for field, keywords in self.field_keywords.items()
+        }
+
+
+_matchers = {}
+_matchers_lock = threading.Lock()
+
+
+def get_keyword_matcher(word_boundary=False):
+    """Return the compiled matcher for the current keyword registry"""
+    version, field_keywords = get_registry().snapshot()
+    key = (version, word_boundary)
+
+    matcher = _matchers.get(key)
+    if matcher is None:
+        with _matchers_lock:
+            matcher = _matchers.get(key)
+            if matcher is None:
+                matcher = KeywordMatcher(field_keywords, word_boundary=word_boundary)
+                # Drop automatons compiled for older registry versions
+                for stale_key in [k for k in _matchers if k[0] != version]:
+                    del _matchers[stale_key]
+                _matchers[key] = matcher
+
+    return matcher
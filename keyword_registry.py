@@ -0,0 +1,94 @@
+import json
+import os
+import threading
+from types import MappingProxyType
+
+KEYWORDS_FILE = 'data/field_keywords.json'
+
+DEFAULT_FIELD_KEYWORDS = {
+    'Software Engineering': [
+        'python', 'java', 'javascript', 'react', 'node.js', 'sql', 'git',
+        'docker', 'kubernetes', 'aws', 'api', 'database', 'frontend',
+        'backend', 'full-stack', 'agile', 'scrum', 'testing', 'debugging',
+        'html', 'css', 'mongodb', 'postgresql', 'redis', 'microservices'
+    ],
+    'Data Analyst': [
+        'python', 'r', 'sql', 'excel', 'tableau', 'power bi', 'pandas',
+        'numpy', 'matplotlib', 'seaborn', 'statistics', 'data visualization',
+        'machine learning', 'regression', 'classification', 'clustering',
+        'etl', 'data mining', 'business intelligence', 'analytics',
+        'spss', 'sas', 'hadoop', 'spark', 'data warehouse'
+    ],
+    'Consultant': [
+        'consulting', 'strategy', 'business analysis', 'project management',
+        'stakeholder management', 'client relations', 'problem solving',
+        'presentation', 'communication', 'leadership', 'change management',
+        'process improvement', 'market research', 'financial analysis',
+        'risk assessment', 'vendor management', 'negotiation',
+        'strategic planning', 'business development'
+    ]
+}
+
+
+class KeywordRegistry:
+    """Process-wide, read-only field keyword table that reloads when its source file changes"""
+
+    def __init__(self, source_file=KEYWORDS_FILE):
+        self.source_file = source_file
+        self.version = 0
+        self._lock = threading.Lock()
+        self._source_mtime = None
+        self._snapshot = None
+
+    def _current_mtime(self):
+        try:
+            return os.stat(self.source_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def _load(self):
+        """Build the frozen keyword table from the defaults plus the optional JSON override"""
+        keywords = dict(DEFAULT_FIELD_KEYWORDS)
+
+        if os.path.exists(self.source_file):
+            try:
+                with open(self.source_file, 'r') as f:
+                    overrides = json.load(f)
+                for field, field_keywords in overrides.items():
+                    keywords[field] = list(field_keywords)
+            except Exception as e:
+                print(f"⚠️ Error loading field keywords from {self.source_file}: {e}")
+
+        return MappingProxyType({field: tuple(words) for field, words in keywords.items()})
+
+    def snapshot(self):
+        """Return (version, keyword table), reloading only if the source changed"""
+        mtime = self._current_mtime()
+        if self._snapshot is None or mtime != self._source_mtime:
+            with self._lock:
+                if self._snapshot is None or mtime != self._source_mtime:
+                    self.version += 1
+                    self._snapshot = (self.version, self._load())
+                    self._source_mtime = mtime
+        return self._snapshot
+
+    def get(self):
+        """Return the current keyword table"""
+        return self.snapshot()[1]
+
+    def fields(self):
+        """Return the list of known job fields"""
+        return list(self.get().keys())
+
+
+_registry = KeywordRegistry()
+
+
+def get_registry():
+    """Return the shared keyword registry"""
+    return _registry
+
+
+def get_field_keywords():
+    """Return the shared field -> keywords mapping"""
+    return _registry.get()
@@ -0,0 +1,121 @@
+"""
+Scikit-learn-free inference for exported linear field classifiers
+
+ModelTrainer exports a fitted TfidfVectorizer + LogisticRegression pair to a single .npz
+file; LinearFieldPredictor reproduces transform + predict_proba with NumPy alone, so
+workers that only classify never import scikit-learn or unpickle an estimator.
+"""
+
+import re
+from collections import Counter
+
+import numpy as np
+
+# TfidfVectorizer's default token_pattern
+TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+
+LINEAR_FORMAT_VERSION = 1
+
+
+def export_linear_model(vectorizer, classifier, path):
+    """Write the vocabulary, idf weights and linear coefficients to a compressed .npz file"""
+    terms = sorted(vectorizer.vocabulary_, key=vectorizer.vocabulary_.get)
+    multi_class = getattr(classifier, 'multi_class', 'auto')
+    solver = getattr(classifier, 'solver', 'lbfgs')
+    one_vs_rest = len(classifier.classes_) > 2 and (
+        multi_class == 'ovr' or (multi_class == 'auto' and solver == 'liblinear')
+    )
+
+    with open(path, 'wb') as f:
+        np.savez_compressed(
+            f,
+            format_version=np.array(LINEAR_FORMAT_VERSION),
+            terms=np.array(terms, dtype=str),
+            idf=np.asarray(vectorizer.idf_, dtype=np.float64),
+            coef=np.asarray(classifier.coef_, dtype=np.float64),
+            intercept=np.asarray(classifier.intercept_, dtype=np.float64),
+            classes=np.array([str(label) for label in classifier.classes_], dtype=str),
+            lowercase=np.array(bool(getattr(vectorizer, 'lowercase', True))),
+            sublinear_tf=np.array(bool(getattr(vectorizer, 'sublinear_tf', False))),
+            one_vs_rest=np.array(one_vs_rest)
+        )
+
+
+def is_exportable(vectorizer, classifier):
+    """Whether a vectorizer/classifier pair can be served by LinearFieldPredictor"""
+    from sklearn.linear_model import LogisticRegression
+
+    return (
+        isinstance(classifier, LogisticRegression)
+        and hasattr(vectorizer, 'idf_')
+        and getattr(vectorizer, 'analyzer', 'word') == 'word'
+        and getattr(vectorizer, 'ngram_range', (1, 1)) == (1, 1)
+        and getattr(vectorizer, 'norm', 'l2') == 'l2'
+        and getattr(vectorizer, 'token_pattern', TOKEN_PATTERN.pattern) == TOKEN_PATTERN.pattern
+        and getattr(vectorizer, 'strip_accents', None) is None
+        and not getattr(vectorizer, 'binary', False)
+        and getattr(vectorizer, 'preprocessor', None) is None
+        and getattr(vectorizer, 'tokenizer', None) is None
+    )
+
+
+class LinearFieldPredictor:
+    """TF-IDF + linear model + softmax in NumPy, loaded from an exported .npz file"""
+
+    def __init__(self, path):
+        with np.load(path, allow_pickle=False) as data:
+            if int(data['format_version']) != LINEAR_FORMAT_VERSION:
+                raise ValueError(f"Unsupported linear model format in {path}")
+            self.vocabulary = {term: index for index, term in enumerate(data['terms'].tolist())}
+            self.idf = data['idf']
+            # Stored transposed so a sparse row picks whole coefficient rows
+            self.coef_t = np.ascontiguousarray(data['coef'].T)
+            self.intercept = data['intercept']
+            self.classes_ = data['classes'].tolist()
+            self.lowercase = bool(data['lowercase'])
+            self.sublinear_tf = bool(data['sublinear_tf'])
+            self.one_vs_rest = bool(data['one_vs_rest'])
+
+    def _tfidf(self, text):
+        """Return (feature indices, l2-normalised tf-idf values) of one document"""
+        if self.lowercase:
+            text = text.lower()
+        counts = Counter(
+            index for index in map(self.vocabulary.get, TOKEN_PATTERN.findall(text)) if index is not None
+        )
+        if not counts:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+
+        indices = np.fromiter(counts.keys(), dtype=np.intp, count=len(counts))
+        values = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+        if self.sublinear_tf:
+            values = np.log(values) + 1
+        values *= self.idf[indices]
+        values /= np.sqrt(np.dot(values, values))
+        return indices, values
+
+    def decision_function(self, text):
+        indices, values = self._tfidf(text)
+        return values @ self.coef_t[indices] + self.intercept
+
+    def predict_proba_one(self, text):
+        """Class probabilities for one document, ordered like classes_"""
+        scores = self.decision_function(text)
+
+        if len(self.classes_) == 2:
+            positive = 1 / (1 + np.exp(-scores[0]))
+            return np.array([1 - positive, positive])
+
+        if self.one_vs_rest:
+            probabilities = 1 / (1 + np.exp(-scores))
+            return probabilities / probabilities.sum()
+
+        scores = scores - scores.max()
+        probabilities = np.exp(scores)
+        return probabilities / probabilities.sum()
+
+    def predict_proba(self, texts):
+        return np.vstack([self.predict_proba_one(text) for text in texts])
+
+    def predict(self, texts):
+        return [self.classes_[int(np.argmax(row))] for row in self.predict_proba(texts)]
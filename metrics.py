@@ -0,0 +1,256 @@
+import atexit
+import functools
+import json
+import math
+import os
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+
+# Set ATS_METRICS_FILE to keep histograms across restarts, e.g. data/metrics.json
+METRICS_FILE = os.environ.get('ATS_METRICS_FILE')
+METRICS_SAVE_INTERVAL = 60
+
+# Log-spaced latency buckets: four per doubling from 1µs, so percentiles are within ~10%
+BUCKET_BASE = 1e-6
+BUCKETS_PER_DOUBLING = 4
+BUCKET_COUNT = 128
+
+
+def bucket_index(seconds):
+    """Return the histogram bucket of a duration"""
+    if seconds <= BUCKET_BASE:
+        return 0
+    index = int(math.log2(seconds / BUCKET_BASE) * BUCKETS_PER_DOUBLING) + 1
+    return min(index, BUCKET_COUNT - 1)
+
+
+def bucket_upper_bound(index):
+    return BUCKET_BASE * 2 ** (index / BUCKETS_PER_DOUBLING)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram; constant memory however many samples it sees"""
+
+    def __init__(self):
+        self.buckets = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.buckets[bucket_index(seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q):
+        """Approximate q-th percentile (0-100) in seconds"""
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if bucket and seen >= rank:
+                return min(bucket_upper_bound(index), self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else None,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'max': self.max if self.count else None
+        }
+
+    def to_dict(self):
+        return {'buckets': self.buckets, 'count': self.count, 'total': self.total, 'max': self.max}
+
+    def merge(self, data):
+        buckets = data.get('buckets', [])
+        for index, bucket in enumerate(buckets[:BUCKET_COUNT]):
+            self.buckets[index] += bucket
+        self.count += data.get('count', 0)
+        self.total += data.get('total', 0.0)
+        self.max = max(self.max, data.get('max', 0.0))
+
+
+class MetricsRegistry:
+    """In-process timers and counters for the hot paths, optionally persisted to JSON"""
+
+    def __init__(self, metrics_file=None, save_interval=METRICS_SAVE_INTERVAL):
+        self.metrics_file = metrics_file
+        self.started_at = time.time()
+        self._histograms = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+        if metrics_file:
+            self.load()
+            # Streamlit servers are rarely stopped cleanly, so save periodically too
+            thread = threading.Thread(target=self._save_loop, args=(save_interval,), name='metrics-saver', daemon=True)
+            thread.start()
+            atexit.register(self.save)
+
+    def observe(self, name, seconds):
+        """Record one duration"""
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram()
+            histogram.observe(seconds)
+
+    def increment(self, name, amount=1):
+        """Add to a counter"""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    @contextmanager
+    def timer(self, name):
+        """Time a block of code; errors are counted and still timed"""
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.increment(f'{name}.errors')
+            raise
+        finally:
+            self.observe(name, time.perf_counter() - started)
+
+    def latency_summary(self):
+        """Per-timer call count, mean, p50/p95/p99 and max in seconds"""
+        with self._lock:
+            return {name: histogram.summary() for name, histogram in sorted(self._histograms.items())}
+
+    def counters(self):
+        with self._lock:
+            return dict(sorted(self._counters.items()))
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self.started_at = time.time()
+
+    def load(self):
+        """Merge histograms and counters saved by an earlier process"""
+        if not self.metrics_file or not os.path.exists(self.metrics_file):
+            return
+        try:
+            with open(self.metrics_file, 'r') as f:
+                data = json.load(f)
+            with self._lock:
+                for name, histogram_data in data.get('histograms', {}).items():
+                    self._histograms.setdefault(name, LatencyHistogram()).merge(histogram_data)
+                for name, value in data.get('counters', {}).items():
+                    self._counters[name] = self._counters.get(name, 0) + value
+        except Exception as e:
+            print(f"⚠️ Could not load metrics: {e}")
+
+    def save(self):
+        """Write histograms and counters atomically to the metrics file"""
+        if not self.metrics_file:
+            return
+        with self._lock:
+            data = {
+                'saved_at': time.time(),
+                'histograms': {name: histogram.to_dict() for name, histogram in self._histograms.items()},
+                'counters': dict(self._counters)
+            }
+        try:
+            directory = os.path.dirname(self.metrics_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_file = self.metrics_file + f'.{os.getpid()}.tmp'
+            with open(tmp_file, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_file, self.metrics_file)
+        except Exception as e:
+            print(f"⚠️ Could not save metrics: {e}")
+
+    def _save_loop(self, interval):
+        while True:
+            time.sleep(interval)
+            self.save()
+
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics():
+    """Return the process-wide metrics registry"""
+    global _metrics
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                _metrics = MetricsRegistry(METRICS_FILE)
+    return _metrics
+
+
+def timed(name):
+    """Decorator recording every call of a function under a timer name"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_metrics().timer(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+_last_cpu_sample = None
+
+
+def process_stats():
+    """Real resource usage of this process from /proc; values are None where unavailable"""
+    global _last_cpu_sample
+    stats = {'rss_bytes': None, 'memory_percent': None, 'cpu_percent': None, 'threads': None,
+             'disk_percent': None}
+
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    stats['rss_bytes'] = int(line.split()[1]) * 1024
+                elif line.startswith('Threads:'):
+                    stats['threads'] = int(line.split()[1])
+
+        with open('/proc/meminfo') as f:
+            mem_total = next(int(line.split()[1]) * 1024 for line in f if line.startswith('MemTotal:'))
+        if stats['rss_bytes'] is not None:
+            stats['memory_percent'] = 100 * stats['rss_bytes'] / mem_total
+
+        ticks = os.sysconf('SC_CLK_TCK')
+        with open('/proc/self/stat') as f:
+            # Fields after the parenthesised command name; utime/stime are 14th/15th overall
+            fields = f.read().rsplit(')', 1)[1].split()
+        cpu_seconds = (int(fields[11]) + int(fields[12])) / ticks
+        now = time.monotonic()
+
+        if _last_cpu_sample is None:
+            # First reading: average since the process started
+            with open('/proc/uptime') as f:
+                uptime = float(f.read().split()[0])
+            wall, used = uptime - int(fields[19]) / ticks, cpu_seconds
+        else:
+            wall, used = now - _last_cpu_sample[0], cpu_seconds - _last_cpu_sample[1]
+        _last_cpu_sample = (now, cpu_seconds)
+
+        if wall > 0:
+            stats['cpu_percent'] = 100 * used / wall
+    except (OSError, ValueError, IndexError, StopIteration):
+        pass
+
+    try:
+        usage = shutil.disk_usage('.')
+        stats['disk_percent'] = 100 * usage.used / usage.total
+    except OSError:
+        pass
+
+    return stats
@@ -0,0 +1,279 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+
+from model_store import LOCK_FILE, MODELS_DIR, model_files_lock
+
+REGISTRY_FILE = os.path.join(MODELS_DIR, 'registry.json')
+VERSIONS_DIR = os.path.join(MODELS_DIR, 'versions')
+# Versions beyond this many are pruned, except production, the candidate and the rollback history
+KEEP_VERSIONS = 10
+ROLLBACK_DEPTH = 5
+# registry.json is stat'ed at most this often per process; a pointer flip made elsewhere is seen within it
+REGISTRY_CHECK_SECONDS = float(os.environ.get('ATS_REGISTRY_CHECK_SECONDS', 1))
+
+
+def dataset_signature(dataset_file):
+    """Row count and content hash of a CSV, read in blocks"""
+    digest = hashlib.sha256()
+    lines = 0
+    with open(dataset_file, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+            lines += block.count(b'\n')
+    stat = os.stat(dataset_file)
+    return {
+        'sha256': digest.hexdigest(),
+        # Header excluded; quoted multi-line fields make this an estimate, which is all thresholds need
+        'rows': max(lines - 1, 0),
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size
+    }
+
+
+def read_model_summary(models_dir):
+    """Accuracy, p99 latency and provenance of the best model recorded in a models directory"""
+    try:
+        with open(os.path.join(models_dir, 'training_metadata.json'), 'r') as f:
+            metadata = json.load(f)
+        with open(os.path.join(models_dir, 'performance_metrics.json'), 'r') as f:
+            metrics = json.load(f)
+    except (OSError, ValueError):
+        return None
+    best = metrics.get(metadata.get('best_model'), {})
+    return {
+        'best_model': metadata.get('best_model'),
+        'accuracy': metadata.get('best_accuracy', best.get('accuracy')),
+        # Online updates only; measured on their small holdout, so not comparable with accuracy
+        'holdout_accuracy': metadata.get('holdout_accuracy'),
+        'latency_p50_ms': best.get('latency_p50_ms'),
+        'latency_p99_ms': best.get('latency_p99_ms'),
+        'size_bytes': best.get('size_bytes'),
+        'dataset_fingerprint': metadata.get('dataset_fingerprint'),
+        'source': metadata.get('source', 'training'),
+        'training_date': metadata.get('training_date')
+    }
+
+
+class ModelRegistry:
+    """Numbered model versions with production and candidate pointers
+
+    Every training run writes its artifacts and metrics into models/versions/<number>/ and
+    never touches another version. registry.json names the production and shadow candidate
+    versions, so promotion and rollback only rewrite that small file.
+    """
+
+    def __init__(self, models_dir=MODELS_DIR, keep_versions=KEEP_VERSIONS, check_seconds=REGISTRY_CHECK_SECONDS):
+        self.models_dir = models_dir
+        self.versions_dir = os.path.join(models_dir, 'versions')
+        self.registry_file = os.path.join(models_dir, os.path.basename(REGISTRY_FILE))
+        self.lock_file = os.path.join(models_dir, os.path.basename(LOCK_FILE))
+        self.keep_versions = keep_versions
+        self.check_seconds = check_seconds
+        self._lock = threading.Lock()
+        self._cached = (None, None)
+        self._checked_at = None
+
+    def read_state(self, fresh=False):
+        """Current pointers; registry.json is re-read only when it changes
+
+        Its mtime is checked at most every check_seconds, so serving a request costs no
+        filesystem calls; fresh=True checks now (writers and the CLI use it).
+        """
+        now = time.monotonic()
+        with self._lock:
+            if (not fresh and self._checked_at is not None and self._cached[1] is not None
+                    and now - self._checked_at < self.check_seconds):
+                return dict(self._cached[1])
+
+        try:
+            stat = os.stat(self.registry_file)
+            signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except OSError:
+            return {'production': None, 'candidate': None, 'history': []}
+
+        with self._lock:
+            self._checked_at = now
+            if self._cached[0] != signature:
+                try:
+                    with open(self.registry_file, 'r') as f:
+                        self._cached = (signature, json.load(f))
+                except (OSError, ValueError) as e:
+                    print(f"⚠️ Could not read model registry: {e}")
+                    return {'production': None, 'candidate': None, 'history': []}
+            return dict(self._cached[1])
+
+    def _update(self, change):
+        """Apply change(state) and atomically rewrite registry.json under the writer lock"""
+        os.makedirs(self.models_dir, exist_ok=True)
+        with model_files_lock(exclusive=True, lock_file=self.lock_file):
+            state = self.read_state(fresh=True)
+            state['history'] = list(state.get('history', []))
+            change(state)
+            state['updated'] = time.time()
+            tmp_path = f'{self.registry_file}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f, indent=2)
+            os.replace(tmp_path, self.registry_file)
+            # This process sees its own pointer flip immediately
+            with self._lock:
+                self._checked_at = None
+        return state
+
+    @property
+    def production(self):
+        return self.read_state().get('production')
+
+    @property
+    def candidate(self):
+        return self.read_state().get('candidate')
+
+    def version_dir(self, version):
+        return os.path.join(self.versions_dir, version)
+
+    def versions(self):
+        """Version numbers on disk, oldest first"""
+        if not os.path.isdir(self.versions_dir):
+            return []
+        return sorted(name for name in os.listdir(self.versions_dir) if name.isdigit())
+
+    def new_version(self):
+        """Reserve the next version number; returns (version, directory)"""
+        os.makedirs(self.versions_dir, exist_ok=True)
+        existing = self.versions()
+        number = int(existing[-1]) + 1 if existing else 1
+        while True:
+            version = f'{number:04d}'
+            try:
+                # mkdir is atomic, so concurrent trainers never share a number
+                os.mkdir(self.version_dir(version))
+                return version, self.version_dir(version)
+            except FileExistsError:
+                number += 1
+
+    def summary(self, version):
+        return read_model_summary(self.version_dir(version)) if version else None
+
+    def production_summary(self):
+        """Summary of the serving model, including one trained before the registry existed"""
+        production = self.production
+        return self.summary(production) if production else read_model_summary(self.models_dir)
+
+    def list_versions(self):
+        state = self.read_state()
+        rows = []
+        for version in self.versions():
+            summary = self.summary(version)
+            role = 'production' if version == state.get('production') else 'candidate' if version == state.get('candidate') else ''
+            rows.append({'version': version, 'role': role, 'trained': summary is not None, **(summary or {})})
+        return rows
+
+    def resolve(self, live_path):
+        """Where the production copy of a model artifact lives
+
+        Falls back to the flat models/ file when nothing has been promoted yet.
+        """
+        production = self.production
+        if production is None:
+            return live_path
+        return os.path.join(self.version_dir(production), os.path.basename(live_path))
+
+    def _require_trained(self, version):
+        if self.summary(version) is None:
+            raise ValueError(f"Model version {version} does not exist or has not finished training")
+
+    def promote(self, version):
+        """Serve a version; the previous production version is kept for rollback"""
+        self._require_trained(version)
+
+        def change(state):
+            if state.get('production') and state['production'] != version:
+                state['history'] = (state['history'] + [state['production']])[-ROLLBACK_DEPTH:]
+            state['production'] = version
+            if state.get('candidate') == version:
+                state['candidate'] = None
+
+        self._update(change)
+        self.prune()
+
+    def rollback(self):
+        """Return to the previous production version; returns it, or None if there is none"""
+        restored = []
+
+        def change(state):
+            if state['history']:
+                state['production'] = state['history'].pop()
+                restored.append(state['production'])
+
+        self._update(change)
+        return restored[0] if restored else None
+
+    def set_candidate(self, version):
+        """Shadow-score a version on live traffic; None stops shadowing"""
+        if version is not None:
+            self._require_trained(version)
+
+        def change(state):
+            state['candidate'] = version
+
+        self._update(change)
+
+    def prune(self):
+        """Delete old versions that are neither served, shadowed nor needed for rollback
+
+        A version without a summary is still being written, by a retrain that can outlast many
+        online publishes, so it is left alone; the scheduler removes the directory of a failed run.
+        """
+        state = self.read_state(fresh=True)
+        protected = {state.get('production'), state.get('candidate')} | set(state.get('history', []))
+        versions = self.versions()
+        for version in versions[:max(len(versions) - self.keep_versions, 0)]:
+            if version not in protected and self.summary(version) is not None:
+                shutil.rmtree(self.version_dir(version), ignore_errors=True)
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry():
+    """Return the shared model registry"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModelRegistry()
+    return _registry
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="List, shadow, promote or roll back model versions")
+    parser.add_argument('command', choices=['list', 'promote', 'rollback', 'shadow', 'unshadow'])
+    parser.add_argument('version', nargs='?', help="Version number for promote and shadow")
+    args = parser.parse_args()
+
+    registry = get_model_registry()
+    try:
+        if args.command == 'list':
+            for row in registry.list_versions():
+                accuracy = f"{row['accuracy']:.3f}" if row.get('accuracy') is not None else '-'
+                latency = f"{row['latency_p99_ms']:.2f} ms" if row.get('latency_p99_ms') is not None else '-'
+                print(f"{row['version']}  {row['role']:<10}  {row.get('best_model') or '-':<20}  accuracy {accuracy}  p99 {latency}")
+        elif args.command == 'promote':
+            registry.promote(args.version)
+            print(f"✅ Version {args.version} is now in production")
+        elif args.command == 'rollback':
+            version = registry.rollback()
+            print(f"✅ Rolled back to version {version}" if version else "⚠️ No earlier version to roll back to")
+        elif args.command == 'shadow':
+            registry.set_candidate(args.version)
+            print(f"✅ Version {args.version} is now shadow-scored on live traffic")
+        else:
+            registry.set_candidate(None)
+            print("✅ Shadow scoring stopped")
+    except ValueError as e:
+        print(f"❌ {e}")
@@ -0,0 +1,185 @@
+import os
+import pickle
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+MODELS_DIR = 'models'
+CLASSIFIER_FILE = os.path.join(MODELS_DIR, 'field_classifier.pkl')
+VECTORIZER_FILE = os.path.join(MODELS_DIR, 'vectorizer.pkl')
+# Present only when the best model is linear; served without scikit-learn
+LINEAR_MODEL_FILE = os.path.join(MODELS_DIR, 'field_classifier_linear.npz')
+# SGD log-loss model over the served vectorizer's features, saved when the best model has no
+# partial_fit; online learning updates it and serves it once it matches the batch-trained model
+ONLINE_CLASSIFIER_FILE = os.path.join(MODELS_DIR, 'online_classifier.pkl')
+LOCK_FILE = os.path.join(MODELS_DIR, '.models.lock')
+
+# A classifier and the vectorizer it was trained with; always swapped together
+ModelBundle = namedtuple('ModelBundle', ['classifier', 'vectorizer', 'version'])
+
+
+@contextmanager
+def model_files_lock(exclusive, lock_file=LOCK_FILE):
+    """Cross-process lock so a reader never loads a classifier from one training run and a vectorizer from another"""
+    if fcntl is None:
+        yield
+        return
+
+    directory = os.path.dirname(lock_file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fd = os.open(lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+def dump_atomic(obj, path):
+    """Pickle to a temporary file and rename it into place"""
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(obj, f)
+    os.replace(tmp_path, path)
+
+
+class ArtifactHolder:
+    """Process-wide model artifact that reloads when its files on disk change"""
+
+    def __init__(self, files, lock_file=LOCK_FILE, registry=None):
+        self.files = list(files)
+        self.lock_file = lock_file
+        # With a registry the files are read from the production version's directory
+        self.registry = registry
+        self.version = 0
+        self.reloads = 0
+        self._lock = threading.Lock()
+        self._token = None
+        self._value = None
+
+    def current_files(self):
+        if self.registry is None:
+            return self.files
+        return [self.registry.resolve(path) for path in self.files]
+
+    def _current_signature(self, files=None):
+        files = files or self.current_files()
+        try:
+            stats = [os.stat(path) for path in files]
+        except OSError:
+            return None
+        # Paths are part of the signature so a pointer flip reloads even between identical files
+        return tuple((path, stat.st_mtime_ns, stat.st_size) for path, stat in zip(files, stats))
+
+    def _change_token(self):
+        """Cheap per-request check for a new artifact
+
+        A promoted registry version is never rewritten, so its number identifies its files and
+        no stat is needed; the flat models/ directory is checked by file stats.
+        """
+        if self.registry is not None:
+            production = self.registry.production
+            if production is not None:
+                return ('version', production)
+        return self._current_signature()
+
+    def _read(self, version, files):
+        """Build the served object from the files"""
+        raise NotImplementedError
+
+    def _load(self):
+        """Read every file under the shared lock; returns (signature, value or None)"""
+        with model_files_lock(exclusive=False, lock_file=self.lock_file):
+            files = self.current_files()
+            signature = self._current_signature(files)
+            if signature is None:
+                return None, None
+            return signature, self._read(self.version + 1, files)
+
+    def get(self):
+        """Return the current artifact, or None when it has not been trained"""
+        if self._change_token() != self._token:
+            with self._lock:
+                token = self._change_token()
+                if token != self._token:
+                    try:
+                        _, value = self._load()
+                    except Exception as e:
+                        # Keep serving the previous artifact; a fresh write changes the token and retries
+                        print(f"Error loading models: {e}")
+                    else:
+                        if value is not None:
+                            self.version += 1
+                            self.reloads += 1
+                        # Publishing is a single reference assignment, so readers see the old or the new artifact
+                        self._value = value
+                    self._token = token
+        return self._value
+
+
+class ModelHolder(ArtifactHolder):
+    """Shared classifier/vectorizer pair, always swapped together"""
+
+    def __init__(self, classifier_file=CLASSIFIER_FILE, vectorizer_file=VECTORIZER_FILE, lock_file=LOCK_FILE, registry=None):
+        super().__init__([classifier_file, vectorizer_file], lock_file, registry)
+        self.classifier_file = classifier_file
+        self.vectorizer_file = vectorizer_file
+
+    def _read(self, version, files):
+        classifier_file, vectorizer_file = files
+        with open(classifier_file, 'rb') as f:
+            classifier = pickle.load(f)
+        with open(vectorizer_file, 'rb') as f:
+            vectorizer = pickle.load(f)
+        return ModelBundle(classifier, vectorizer, version)
+
+
+class LinearModelHolder(ArtifactHolder):
+    """Shared NumPy-only predictor for an exported linear classifier"""
+
+    def __init__(self, model_file=LINEAR_MODEL_FILE, lock_file=LOCK_FILE, registry=None):
+        super().__init__([model_file], lock_file, registry)
+        self.model_file = model_file
+
+    def _read(self, version, files):
+        from linear_predictor import LinearFieldPredictor
+
+        return LinearFieldPredictor(files[0])
+
+
+_holder = None
+_holder_lock = threading.Lock()
+
+
+def get_model_holder():
+    """Return the shared holder of the production model"""
+    global _holder
+    if _holder is None:
+        from model_registry import get_model_registry
+
+        with _holder_lock:
+            if _holder is None:
+                _holder = ModelHolder(registry=get_model_registry())
+    return _holder
+
+
+_linear_holder = None
+
+
+def get_linear_model_holder():
+    """Return the shared holder of the exported linear model"""
+    global _linear_holder
+    if _linear_holder is None:
+        from model_registry import get_model_registry
+
+        with _holder_lock:
+            if _linear_holder is None:
+                _linear_holder = LinearModelHolder(registry=get_model_registry())
+    return _linear_holder
@@ -1,18 +1,146 @@
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split
-from sklearn.feature_extraction.text import TfidfVectorizer
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.model_selection import KFold, StratifiedKFold
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.linear_model import LogisticRegression
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.naive_bayes import MultinomialNB
 from sklearn.svm import SVC
 from sklearn.metrics import accuracy_score, precision_score, recall_score, classification_report
+import argparse
+import hashlib
 import pickle
 import os
 import json
+import time
+from collections import Counter
 from datetime import datetime
+from feature_cache import get_feature_cache
+from linear_predictor import LinearFieldPredictor, export_linear_model, is_exportable
+from model_registry import dataset_signature, get_model_registry
+from model_store import (
+    CLASSIFIER_FILE, LINEAR_MODEL_FILE, LOCK_FILE, ONLINE_CLASSIFIER_FILE, VECTORIZER_FILE, dump_atomic,
+    get_model_holder, model_files_lock
+)
+
+# Parallel training settings; -1 uses every core
+TRAINING_JOBS = int(os.environ.get('ATS_TRAINING_JOBS', -1))
+CV_FOLDS = int(os.environ.get('ATS_CV_FOLDS', 5))
+
+# Streaming mode: the labeled CSV is read in chunks and hashed into a fixed-width feature space
+TRAINING_DATASET = 'data/comprehensive_training_dataset.csv'
+STREAMING_CHUNKSIZE = 10000
+STREAMING_FEATURES = 2 ** 18
+HOLDOUT_FRACTION = 0.1
+
+# Selection picks the most accurate model whose p99 single-resume latency fits this budget
+LATENCY_BUDGET_MS = float(os.environ.get('ATS_LATENCY_BUDGET_MS', 10))
+
+# A forest or SVM winner is distilled into a sparse logistic regression over an L1-pruned vocabulary
+DISTILL = os.environ.get('ATS_DISTILL', '1').lower() in ('1', 'true', 'yes', 'on')
+DISTILLED_MODEL_NAME = 'Distilled Logistic Regression'
+DISTILL_C = 10.0
+# The student is served instead of its teacher when it agrees with it this often
+# and is at most this much less accurate
+DISTILL_MIN_FIDELITY = 0.9
+DISTILL_ACCURACY_TOLERANCE = 0.01
+
+def _fit_and_score(model, X, y, train_index, test_index):
+    """Fit a fresh copy of a model; score it on one fold, or return it fitted on every row"""
+    model = clone(model)
+    if train_index is None:
+        # The shared matrix is a read-only memory map and libsvm needs a writable one
+        model.fit(X.copy(), y)
+        return model
+    
+    model.fit(X[train_index], y[train_index])
+    y_pred = model.predict(X[test_index])
+    return {
+        'accuracy': accuracy_score(y[test_index], y_pred),
+        'precision': precision_score(y[test_index], y_pred, average='weighted', zero_division=0),
+        'recall': recall_score(y[test_index], y_pred, average='weighted', zero_division=0)
+    }
+
+def _soft_label_rows(X, probabilities, classes, min_weight=1e-3):
+    """One row per (resume, class) weighted by the teacher's probability
+    
+    A weighted fit on these rows minimises cross-entropy against the teacher's soft labels.
+    """
+    rows, columns = np.nonzero(probabilities >= min_weight)
+    return X[rows], classes[columns], probabilities[rows, columns]
+
+def _l1_logistic_regression(C):
+    """L1-penalised logistic regression; scikit-learn 1.8 replaced penalty= with l1_ratio="""
+    if LogisticRegression().get_params().get('penalty') == 'deprecated':
+        return LogisticRegression(C=C, l1_ratio=1.0, solver='saga', max_iter=1000, random_state=42)
+    return LogisticRegression(penalty='l1', C=C, solver='saga', max_iter=1000, random_state=42)
+
+def distill(teacher, vectorizer, texts, X, C=DISTILL_C):
+    """Fit a compact logistic regression student to a fitted teacher's class probabilities
+    
+    An L1-penalised fit chooses the vocabulary; the student is then refitted on TF-IDF
+    features of only those terms, so it exports to LinearFieldPredictor.
+    Returns (student vectorizer, student).
+    """
+    probabilities = teacher.predict_proba(X)
+    classes = np.asarray(teacher.classes_, dtype=object)
+    X_soft, y_soft, weights = _soft_label_rows(X, probabilities, classes)
+    selector = _l1_logistic_regression(C).fit(X_soft, y_soft, sample_weight=weights)
+    
+    terms = sorted(vectorizer.vocabulary_, key=vectorizer.vocabulary_.get)
+    kept = [terms[i] for i in np.flatnonzero(np.abs(selector.coef_).max(axis=0) > 0)] or terms
+    student_vectorizer = clone(vectorizer).set_params(vocabulary=kept, max_features=None)
+    X_student = student_vectorizer.fit_transform(texts)
+    
+    X_soft, y_soft, weights = _soft_label_rows(X_student, probabilities, classes)
+    student = LogisticRegression(C=C, max_iter=1000, random_state=42).fit(X_soft, y_soft, sample_weight=weights)
+    return student_vectorizer, student
+
+def _distill_and_score(teacher, vectorizer, texts, X, y, train_index, test_index):
+    """Distill a teacher fitted on one fold's training rows; score the student against labels and teacher"""
+    teacher = clone(teacher).fit(X[train_index], y[train_index])
+    student_vectorizer, student = distill(teacher, vectorizer, texts[train_index], X[train_index])
+    y_pred = student.predict(student_vectorizer.transform(texts[test_index]))
+    return {
+        'accuracy': accuracy_score(y[test_index], y_pred),
+        'precision': precision_score(y[test_index], y_pred, average='weighted', zero_division=0),
+        'recall': recall_score(y[test_index], y_pred, average='weighted', zero_division=0),
+        'fidelity': accuracy_score(teacher.predict(X[test_index]), y_pred)
+    }
+
+def is_holdout(text, fraction):
+    """Stable per-row holdout assignment, independent of chunking and row order"""
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little') / 2 ** 64 < fraction
+
+def _metrics_from_confusion(confusion):
+    """Accuracy and support-weighted precision/recall from (true, predicted) counts"""
+    total = sum(confusion.values())
+    if total == 0:
+        return {'accuracy': 0.0, 'precision': 0.0, 'recall': 0.0}
+    
+    labels = {label for pair in confusion for label in pair}
+    support = Counter()
+    predicted = Counter()
+    for (true_label, predicted_label), count in confusion.items():
+        support[true_label] += count
+        predicted[predicted_label] += count
+    
+    precision = recall = 0.0
+    for label in labels:
+        correct = confusion.get((label, label), 0)
+        weight = support[label] / total
+        precision += weight * (correct / predicted[label] if predicted[label] else 0.0)
+        recall += weight * (correct / support[label] if support[label] else 0.0)
+    
+    accuracy = sum(count for (true_label, predicted_label), count in confusion.items() if true_label == predicted_label) / total
+    return {'accuracy': accuracy, 'precision': precision, 'recall': recall}
 
 class ModelTrainer:
-    def __init__(self):
+    def __init__(self, latency_budget_ms=LATENCY_BUDGET_MS, n_jobs=TRAINING_JOBS, cv_folds=CV_FOLDS, models_dir=None,
+                 distill=DISTILL):
         self.models = {
             'Random Forest': RandomForestClassifier(n_estimators=100, random_state=42),
             'Logistic Regression': LogisticRegression(random_state=42, max_iter=1000),
@@ -22,6 +150,30 @@ class ModelTrainer:
         self.best_model = None
         self.best_score = 0
         self.best_model_name = None
+        self.validation_texts = []
+        self.latency_budget_ms = latency_budget_ms
+        self.n_jobs = n_jobs
+        self.cv_folds = cv_folds
+        self.distill = distill
+        self.student_vectorizer = None
+        # Incremental companion for online learning when the best model has no partial_fit
+        self.online_model = None
+        # None registers each run as a new model registry version and promotes it; the retrain
+        # scheduler passes a version directory it reserved and decides on promotion itself
+        self.models_dir = models_dir
+        self.version = None
+        self.dataset_fingerprint = None
+    
+    @property
+    def served_vectorizer(self):
+        """The vectorizer saved with the best model
+        
+        A distilled student is served with its own pruned vocabulary; self.vectorizer keeps
+        the full one so the next training run hits the same feature cache entry.
+        """
+        if self.best_model_name == DISTILLED_MODEL_NAME:
+            return self.student_vectorizer
+        return self.vectorizer
     
     def preprocess_text(self, text):
         """Clean and preprocess text for training"""
@@ -41,6 +193,19 @@ class ModelTrainer:
         df = df[df['cleaned_text'].str.len() > 0]
         return df
     
+    def load_features(self, df):
+        """Cleaned text and TF-IDF features for a dataset, served from the feature cache when possible"""
+        required_columns = ['resume_text', 'job_field']
+        for col in required_columns:
+            if col not in df.columns:
+                raise ValueError(f"Missing required column: {col}")
+        
+        features = get_feature_cache().load(
+            df['resume_text'], df['job_field'], self.vectorizer, self.preprocess_text
+        )
+        print(f"📦 Features for {features.matrix.shape[0]} resumes ({features.status} in feature cache)")
+        return features
+    
     def load_training_data(self):
         """Load training data from the dataset loader"""
         try:
@@ -91,40 +256,63 @@ class ModelTrainer:
                     'error': 'No training data available'
                 }
         
-            df = self.prepare_data(df)
-            X = df['cleaned_text']
-            y = df['job_field']
-        
-            X_vectorized = self.vectorizer.fit_transform(X)
-        
-            try:
-                X_train, X_test, y_train, y_test = train_test_split(
-                    X_vectorized, y, test_size=0.2, random_state=42, stratify=y
-                )
-            except ValueError:
-                X_train, X_test, y_train, y_test = train_test_split(
-                    X_vectorized, y, test_size=0.2, random_state=42
+            features = self.load_features(df)
+            self.vectorizer = features.vectorizer
+            X_vectorized = features.matrix
+            y = features.labels
+            self.dataset_fingerprint = features.fingerprint
+            # Kept to check that an exported NumPy predictor reproduces the fitted model
+            self.validation_texts = features.texts[:200]
+            
+            folds = self.make_folds(y)
+            
+            # Every (model, fold) fit plus each model's final fit on all rows runs as its own task.
+            # joblib memory-maps the CSR arrays, so workers share one feature matrix instead of copies.
+            tasks = [
+                (model_name, fold) for model_name in self.models
+                for fold in list(range(len(folds))) + [None]
+            ]
+            print(f"Training {len(self.models)} models over {len(folds)} folds ({len(tasks)} fits, n_jobs={self.n_jobs})...")
+            outputs = Parallel(n_jobs=self.n_jobs, max_nbytes='1M', mmap_mode='r')(
+                delayed(_fit_and_score)(
+                    self.models[model_name], X_vectorized, y,
+                    *(folds[fold] if fold is not None else (None, None))
                 )
-        
+                for model_name, fold in tasks
+            )
+            
+            fold_scores = {model_name: [] for model_name in self.models}
+            for (model_name, fold), output in zip(tasks, outputs):
+                if fold is None:
+                    self.models[model_name] = output
+                else:
+                    fold_scores[model_name].append(output)
+            
             results = {}
-        
             for model_name, model in self.models.items():
-                print(f"Training {model_name}...")
-                model.fit(X_train, y_train)
-                y_pred = model.predict(X_test)
-                accuracy = accuracy_score(y_test, y_pred)
-                precision = precision_score(y_test, y_pred, average='weighted', zero_division=0)
-                recall = recall_score(y_test, y_pred, average='weighted', zero_division=0)
+                scores = pd.DataFrame(fold_scores[model_name])
                 results[model_name] = {
-                    'accuracy': accuracy,
-                    'precision': precision,
-                    'recall': recall,
-                    'model': model
+                    'accuracy': float(scores['accuracy'].mean()),
+                    'accuracy_std': float(scores['accuracy'].std(ddof=0)),
+                    'precision': float(scores['precision'].mean()),
+                    'precision_std': float(scores['precision'].std(ddof=0)),
+                    'recall': float(scores['recall'].mean()),
+                    'recall_std': float(scores['recall'].std(ddof=0)),
+                    'cv_folds': len(folds),
+                    'model': model,
+                    **self.benchmark_model(model, self.validation_texts)
                 }
-                if accuracy > self.best_score:
-                    self.best_score = accuracy
-                    self.best_model = model
-                    self.best_model_name = model_name
+                print(f"  {model_name}: accuracy {results[model_name]['accuracy']:.3f} ± {results[model_name]['accuracy_std']:.3f}")
+            
+            if self.distill:
+                self.distill_teacher(results, features.texts, X_vectorized, y, folds)
+            
+            self.best_model_name = self.select_best_model(results)
+            self.best_model = results[self.best_model_name]['model']
+            self.best_score = results[self.best_model_name]['accuracy']
+            self.online_model = None
+            if not hasattr(self.best_model, 'partial_fit'):
+                self.online_model = self.fit_online_model(features.texts, X_vectorized, y)
         
             self.save_models_and_results(results)
         
@@ -132,10 +320,113 @@ class ModelTrainer:
                 'training_completed': True,
                 'best_model': self.best_model_name,
                 'best_accuracy': self.best_score,
+                'latency_budget_ms': self.latency_budget_ms,
+                'version': self.version,
+                'all_results': {k: {
+                    key: value for key, value in v.items() if key != 'model'
+                } for k, v in results.items()}
+            }
+        
+        except Exception as e:
+            return {
+                'training_completed': False,
+                'error': str(e)
+            }
+    
+    def iter_training_chunks(self, dataset_file, chunksize):
+        """Yield (cleaned texts, labels) chunks of a labeled CSV without loading it whole"""
+        for chunk in pd.read_csv(dataset_file, usecols=['resume_text', 'job_field'], chunksize=chunksize):
+            chunk = chunk.dropna(subset=['job_field'])
+            cleaned = chunk['resume_text'].map(self.preprocess_text)
+            keep = cleaned.str.len() > 0
+            yield cleaned[keep].tolist(), chunk['job_field'][keep].astype(str).tolist()
+    
+    def train_streaming(self, dataset_file=TRAINING_DATASET, chunksize=STREAMING_CHUNKSIZE,
+                        n_features=STREAMING_FEATURES, holdout_fraction=HOLDOUT_FRACTION, epochs=1):
+        """Out-of-core training: hashed features and partial_fit over CSV chunks
+        
+        Memory is bounded by the chunk size rather than the corpus. A stable hash of each
+        resume sends about holdout_fraction of rows to a held-out evaluation stream.
+        """
+        try:
+            if not os.path.exists(dataset_file):
+                return {'training_completed': False, 'error': f'Dataset not found: {dataset_file}'}
+            
+            # partial_fit needs every class up front; this pass reads only the label column
+            classes = set()
+            for chunk in pd.read_csv(dataset_file, usecols=['job_field'], chunksize=chunksize * 10):
+                classes.update(chunk['job_field'].dropna().astype(str))
+            classes = np.array(sorted(classes), dtype=object)
+            if len(classes) < 2:
+                return {'training_completed': False, 'error': 'Need at least two job fields to train'}
+            self.dataset_fingerprint = dataset_signature(dataset_file)['sha256']
+            
+            self.vectorizer = HashingVectorizer(
+                n_features=n_features, stop_words='english', alternate_sign=False, norm='l2'
+            )
+            models = {
+                'SGD Logistic Regression': SGDClassifier(loss='log_loss', alpha=1e-5, random_state=42),
+                'Naive Bayes': MultinomialNB(alpha=0.01)
+            }
+            
+            train_rows = 0
+            for epoch in range(epochs):
+                for texts, labels in self.iter_training_chunks(dataset_file, chunksize):
+                    train_index = [i for i, text in enumerate(texts) if not is_holdout(text, holdout_fraction)]
+                    if not train_index:
+                        continue
+                    X = self.vectorizer.transform([texts[i] for i in train_index])
+                    y = np.array([labels[i] for i in train_index])
+                    for model in models.values():
+                        model.partial_fit(X, y, classes=classes)
+                    if epoch == 0:
+                        train_rows += len(train_index)
+                print(f"Epoch {epoch + 1}/{epochs}: streamed {train_rows} training rows")
+            
+            confusion = {name: Counter() for name in models}
+            holdout_rows = 0
+            self.validation_texts = []
+            for texts, labels in self.iter_training_chunks(dataset_file, chunksize):
+                holdout_index = [i for i, text in enumerate(texts) if is_holdout(text, holdout_fraction)]
+                if not holdout_index:
+                    continue
+                holdout_texts = [texts[i] for i in holdout_index]
+                X = self.vectorizer.transform(holdout_texts)
+                for name, model in models.items():
+                    confusion[name].update(zip((labels[i] for i in holdout_index), model.predict(X)))
+                holdout_rows += len(holdout_index)
+                self.validation_texts.extend(holdout_texts[:200 - len(self.validation_texts)])
+            
+            if holdout_rows == 0:
+                return {'training_completed': False, 'error': 'Holdout stream is empty; raise holdout_fraction'}
+            
+            results = {}
+            for name, model in models.items():
+                results[name] = {
+                    **_metrics_from_confusion(confusion[name]),
+                    'train_rows': train_rows,
+                    'holdout_rows': holdout_rows,
+                    'model': model,
+                    **self.benchmark_model(model, self.validation_texts)
+                }
+                print(f"  {name}: holdout accuracy {results[name]['accuracy']:.3f}")
+            
+            self.best_model_name = self.select_best_model(results)
+            self.best_model = results[self.best_model_name]['model']
+            self.best_score = results[self.best_model_name]['accuracy']
+            # The streamed models take partial_fit themselves
+            self.online_model = None
+            
+            self.save_models_and_results(results)
+            
+            return {
+                'training_completed': True,
+                'best_model': self.best_model_name,
+                'best_accuracy': self.best_score,
+                'latency_budget_ms': self.latency_budget_ms,
+                'version': self.version,
                 'all_results': {k: {
-                    'accuracy': v['accuracy'],
-                    'precision': v['precision'],
-                    'recall': v['recall']
+                    key: value for key, value in v.items() if key != 'model'
                 } for k, v in results.items()}
             }
         
@@ -145,46 +436,203 @@ class ModelTrainer:
                 'error': str(e)
             }
     
+    def fit_online_model(self, texts, X, y):
+        """SGD log-loss companion over the served features, for online updates to partial_fit"""
+        vectorizer = self.served_vectorizer
+        if vectorizer is not self.vectorizer:
+            X = vectorizer.transform(texts)
+        return SGDClassifier(loss='log_loss', alpha=1e-5, random_state=42).fit(X, y)
+    
+    def make_folds(self, y):
+        """Stratified (train, test) index pairs, with fewer folds when a field is rare"""
+        _, class_counts = np.unique(y, return_counts=True)
+        n_splits = min(self.cv_folds, len(y))
+        if class_counts.min() >= 2:
+            splitter = StratifiedKFold(n_splits=min(n_splits, class_counts.min()), shuffle=True, random_state=42)
+        else:
+            splitter = KFold(n_splits=n_splits, shuffle=True, random_state=42)
+        return list(splitter.split(np.zeros(len(y)), y))
+    
+    def distill_teacher(self, results, texts, X, y, folds):
+        """Add a distilled student of the most accurate model to results when that model is not linear"""
+        teacher_name = max(results, key=lambda name: results[name]['accuracy'])
+        teacher = results[teacher_name]['model']
+        if is_exportable(self.vectorizer, teacher):
+            return None
+        
+        texts = np.asarray(texts, dtype=object)
+        print(f"Distilling {teacher_name} into a sparse logistic regression over {len(folds)} folds...")
+        outputs = Parallel(n_jobs=self.n_jobs, max_nbytes='1M', mmap_mode='r')(
+            delayed(_distill_and_score)(teacher, self.vectorizer, texts, X, y, train_index, test_index)
+            for train_index, test_index in folds
+        )
+        self.student_vectorizer, student = distill(teacher, self.vectorizer, texts, X)
+        
+        scores = pd.DataFrame(outputs)
+        result = {
+            'accuracy': float(scores['accuracy'].mean()),
+            'accuracy_std': float(scores['accuracy'].std(ddof=0)),
+            'precision': float(scores['precision'].mean()),
+            'precision_std': float(scores['precision'].std(ddof=0)),
+            'recall': float(scores['recall'].mean()),
+            'recall_std': float(scores['recall'].std(ddof=0)),
+            'fidelity': float(scores['fidelity'].mean()),
+            'fidelity_std': float(scores['fidelity'].std(ddof=0)),
+            'cv_folds': len(folds),
+            'teacher': teacher_name,
+            'vocabulary_size': len(self.student_vectorizer.vocabulary_),
+            'model': student,
+            **self.benchmark_model(student, self.validation_texts, self.student_vectorizer)
+        }
+        results[DISTILLED_MODEL_NAME] = result
+        print(
+            f"  {DISTILLED_MODEL_NAME}: accuracy {result['accuracy']:.3f}, fidelity {result['fidelity']:.3f} to {teacher_name}, "
+            f"{result['vocabulary_size']} terms, {result['size_bytes']} bytes vs {results[teacher_name]['size_bytes']}, "
+            f"p99 {result['latency_p99_ms']:.2f} ms vs {results[teacher_name]['latency_p99_ms']:.2f} ms"
+        )
+        return result
+    
+    def benchmark_model(self, model, texts, vectorizer=None, single_runs=100, batch_runs=5):
+        """Measure single-resume and batch inference latency, from cleaned text, and serialized size"""
+        texts = list(texts) or ['']
+        vectorizer = vectorizer or self.vectorizer
+        predict = lambda batch: model.predict_proba(vectorizer.transform(batch))
+        predict(texts[:1])  # warm-up
+        
+        single = []
+        for i in range(single_runs):
+            started = time.perf_counter()
+            predict([texts[i % len(texts)]])
+            single.append((time.perf_counter() - started) * 1000)
+        
+        batch = []
+        for _ in range(batch_runs):
+            started = time.perf_counter()
+            predict(texts)
+            batch.append((time.perf_counter() - started) * 1000)
+        
+        return {
+            'latency_p50_ms': float(np.percentile(single, 50)),
+            'latency_p99_ms': float(np.percentile(single, 99)),
+            'batch_size': len(texts),
+            'batch_p50_ms': float(np.percentile(batch, 50)),
+            'batch_p99_ms': float(np.percentile(batch, 99)),
+            'size_bytes': len(pickle.dumps(model))
+        }
+    
+    def select_best_model(self, results):
+        """Most accurate model within the latency budget; the fastest one if none fits"""
+        within_budget = [
+            name for name, result in results.items()
+            if self.latency_budget_ms is None or result['latency_p99_ms'] <= self.latency_budget_ms
+        ]
+        for name, result in results.items():
+            result['within_budget'] = name in within_budget
+        
+        if not within_budget:
+            print(f"⚠️ No model meets the {self.latency_budget_ms} ms budget; choosing the fastest")
+            return min(results, key=lambda name: results[name]['latency_p99_ms'])
+        
+        # Ties in accuracy go to the faster model
+        best = max(within_budget, key=lambda name: (results[name]['accuracy'], -results[name]['latency_p99_ms']))
+        
+        # Near-teacher accuracy at linear-model cost wins over the teacher itself
+        student = results.get(DISTILLED_MODEL_NAME)
+        if (student is not None and best == student['teacher'] and student['within_budget']
+                and student['fidelity'] >= DISTILL_MIN_FIDELITY
+                and student['accuracy'] >= results[best]['accuracy'] - DISTILL_ACCURACY_TOLERANCE):
+            return DISTILLED_MODEL_NAME
+        return best
+    
     def save_models_and_results(self, results):
-        """Save trained models and performance metrics"""
-        os.makedirs('models', exist_ok=True)
+        """Save trained models and performance metrics as a new registry version, or into models_dir"""
+        registry = None
+        if self.models_dir is None:
+            registry = get_model_registry()
+            self.version, output_dir = registry.new_version()
+        else:
+            output_dir = self.models_dir
+            os.makedirs(output_dir, exist_ok=True)
         
-        if self.best_model is not None:
-            with open('models/field_classifier.pkl', 'wb') as f:
-                pickle.dump(self.best_model, f)
+        def output_path(live_path):
+            return os.path.join(output_dir, os.path.basename(live_path))
         
-        with open('models/vectorizer.pkl', 'wb') as f:
-            pickle.dump(self.vectorizer, f)
+        # Both artifacts are replaced under one exclusive lock so readers pick up the new pair together
+        with model_files_lock(exclusive=True, lock_file=output_path(LOCK_FILE)):
+            if self.best_model is not None:
+                dump_atomic(self.best_model, output_path(CLASSIFIER_FILE))
+            dump_atomic(self.served_vectorizer, output_path(VECTORIZER_FILE))
+            self.export_linear_model(output_path(LINEAR_MODEL_FILE))
+            if self.online_model is not None:
+                dump_atomic(self.online_model, output_path(ONLINE_CLASSIFIER_FILE))
+            elif os.path.exists(output_path(ONLINE_CLASSIFIER_FILE)):
+                os.remove(output_path(ONLINE_CLASSIFIER_FILE))
         
         metrics = {k: {
-            'accuracy': v['accuracy'],
-            'precision': v['precision'],
-            'recall': v['recall']
+            key: value for key, value in v.items() if key != 'model'
         } for k, v in results.items()}
         
-        with open('models/performance_metrics.json', 'w') as f:
+        with open(os.path.join(output_dir, 'performance_metrics.json'), 'w') as f:
             json.dump(metrics, f, indent=2)
         
         metadata = {
             'training_date': datetime.now().isoformat(),
             'best_model': self.best_model_name,
             'best_accuracy': self.best_score,
-            'models_trained': list(self.models.keys())
+            'latency_budget_ms': self.latency_budget_ms,
+            'models_trained': list(results.keys()),
+            'distilled_from': results[self.best_model_name].get('teacher'),
+            'dataset_fingerprint': self.dataset_fingerprint
         }
         
-        with open('models/training_metadata.json', 'w') as f:
+        with open(os.path.join(output_dir, 'training_metadata.json'), 'w') as f:
             json.dump(metadata, f, indent=2)
+        
+        # The version is complete on disk before the pointer flip makes it the served one
+        if registry is not None:
+            registry.promote(self.version)
     
-    def load_model(self):
-        """Load trained model"""
+    def export_linear_model(self, path, tolerance=1e-6):
+        """Export the best model for scikit-learn-free serving when it is linear
+        
+        The export is only kept if its probabilities match the fitted model on the
+        training texts; otherwise any stale export is removed so serving falls back
+        to the pickled model.
+        """
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        vectorizer = self.served_vectorizer
         try:
-            with open('models/field_classifier.pkl', 'rb') as f:
-                model = pickle.load(f)
-            with open('models/vectorizer.pkl', 'rb') as f:
-                vectorizer = pickle.load(f)
-            return model, vectorizer
-        except FileNotFoundError:
+            if self.best_model is None or not is_exportable(vectorizer, self.best_model):
+                if os.path.exists(path):
+                    os.remove(path)
+                return False
+            
+            export_linear_model(vectorizer, self.best_model, tmp_path)
+            
+            if self.validation_texts:
+                expected = self.best_model.predict_proba(vectorizer.transform(self.validation_texts))
+                actual = LinearFieldPredictor(tmp_path).predict_proba(self.validation_texts)
+                if not np.allclose(actual, expected, rtol=0, atol=tolerance):
+                    print(f"⚠️ Linear export differs from {self.best_model_name}; keeping the pickled model only")
+                    os.remove(tmp_path)
+                    if os.path.exists(path):
+                        os.remove(path)
+                    return False
+            
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            print(f"⚠️ Could not export linear model: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+    
+    def load_model(self):
+        """Return the trained (model, vectorizer) pair from the shared model holder"""
+        bundle = get_model_holder().get()
+        if bundle is None:
             return None, None
+        return bundle.classifier, bundle.vectorizer
     
     def predict_field(self, resume_text):
         """Predict job field for a resume"""
@@ -202,3 +650,23 @@ class ModelTrainer:
             'confidence': max(probabilities),
             'all_probabilities': prob_dict
         }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the job field classifier")
+    parser.add_argument('--streaming', action='store_true', help="Out-of-core training over CSV chunks")
+    parser.add_argument('--dataset', default=TRAINING_DATASET, help="Labeled CSV with resume_text and job_field")
+    parser.add_argument('--chunksize', type=int, default=STREAMING_CHUNKSIZE, help="Rows per streamed chunk")
+    parser.add_argument('--epochs', type=int, default=1, help="Passes over the data in streaming mode")
+    args = parser.parse_args()
+    
+    trainer = ModelTrainer()
+    if args.streaming:
+        outcome = trainer.train_streaming(args.dataset, chunksize=args.chunksize, epochs=args.epochs)
+    else:
+        outcome = trainer.train_models(pd.read_csv(args.dataset) if args.dataset != TRAINING_DATASET else None)
+    
+    if outcome['training_completed']:
+        print(f"✅ Best model: {outcome['best_model']} (accuracy {outcome['best_accuracy']:.3f})")
+    else:
+        print(f"❌ Training failed: {outcome['error']}")
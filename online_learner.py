@@ -0,0 +1,235 @@
+import copy
+import json
+import os
+import pickle
+import queue
+import threading
+from collections import deque
+from datetime import datetime
+
+import numpy as np
+
+from model_store import (
+    CLASSIFIER_FILE, ONLINE_CLASSIFIER_FILE, VECTORIZER_FILE, dump_atomic, get_model_holder, model_files_lock
+)
+from model_trainer import is_holdout
+
+# Opt-in: analysed resumes are labelled with the field the user targeted, which is a weak label
+ONLINE_LEARNING = os.environ.get('ATS_ONLINE_LEARNING', '').lower() in ('1', 'true', 'yes', 'on')
+ONLINE_BATCH_SIZE = 32
+ONLINE_HOLDOUT_FRACTION = 0.2
+ONLINE_MAX_HOLDOUT = 1000
+# An update is published unless it loses more than this much holdout accuracy
+ONLINE_TOLERANCE = 0.01
+
+
+class OnlineLearner:
+    """Background partial_fit updates of the served classifier from newly labelled resumes
+
+    Batch-trained winners (Random Forest, SVC, ...) have no partial_fit. For those the trainer
+    saves an SGD log-loss companion over the same features; it learns from every batch and
+    replaces the served classifier once it is at least as accurate on the holdout.
+    """
+
+    def __init__(self, holder=None, batch_size=ONLINE_BATCH_SIZE, holdout_fraction=ONLINE_HOLDOUT_FRACTION,
+                 max_holdout=ONLINE_MAX_HOLDOUT, tolerance=ONLINE_TOLERANCE, max_buffered=10000):
+        self.holder = holder or get_model_holder()
+        self.batch_size = batch_size
+        self.holdout_fraction = holdout_fraction
+        self.tolerance = tolerance
+        self.published = 0
+        self.rejected = 0
+        self.skipped = 0
+        self.last_holdout_accuracy = None
+
+        self._companion = None
+        self._companion_version = None
+
+        self._queue = queue.Queue(maxsize=max_buffered)
+        self._pending = []
+        self._holdout = deque(maxlen=max_holdout)
+        self._thread = threading.Thread(target=self._run, name='online-learner', daemon=True)
+        self._thread.start()
+
+    def add_example(self, cleaned_text, label):
+        """Queue one labelled resume (already preprocessed); drops it if the buffer is full"""
+        try:
+            self._queue.put_nowait((cleaned_text, str(label)))
+            return True
+        except queue.Full:
+            self.skipped += 1
+            return False
+
+    def flush(self):
+        """Wait until every queued example has been routed and full batches applied"""
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            example = self._queue.get()
+            try:
+                if example is None:
+                    return
+                text, label = example
+                if not text:
+                    continue
+                # Stable routing keeps a resume analysed twice on the same side
+                if is_holdout(text, self.holdout_fraction):
+                    self._holdout.append(example)
+                else:
+                    self._pending.append(example)
+                    if len(self._pending) >= self.batch_size:
+                        batch, self._pending = self._pending, []
+                        self._update(batch)
+            except Exception as e:
+                print(f"Error in online model update: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _accuracy(self, classifier, vectorizer, examples):
+        if not examples:
+            return None
+        predictions = classifier.predict(vectorizer.transform([text for text, _ in examples]))
+        return float(np.mean([predicted == label for predicted, (_, label) in zip(predictions, examples)]))
+
+    def _load_companion(self, models):
+        """The served model's SGD companion, kept in memory so it learns across batches"""
+        if self._companion_version != models.version:
+            classifier_file = self.holder.current_files()[0]
+            companion_file = os.path.join(os.path.dirname(classifier_file), os.path.basename(ONLINE_CLASSIFIER_FILE))
+            try:
+                with open(companion_file, 'rb') as f:
+                    self._companion = pickle.load(f)
+            except OSError:
+                self._companion = None
+            self._companion_version = models.version
+        return self._companion
+
+    def _update(self, batch):
+        """partial_fit a copy of the incremental model; publish it if the holdout does not regress"""
+        models = self.holder.get()
+        if models is None:
+            self.skipped += len(batch)
+            return False
+
+        incremental = hasattr(models.classifier, 'partial_fit')
+        base = models.classifier if incremental else self._load_companion(models)
+        if base is None:
+            # A batch-trained model saved without a companion only changes on a full retrain
+            self.skipped += len(batch)
+            return False
+
+        known = set(base.classes_)
+        batch = [(text, label) for text, label in batch if label in known]
+        if not batch:
+            return False
+
+        candidate = copy.deepcopy(base)
+        candidate.partial_fit(
+            models.vectorizer.transform([text for text, _ in batch]),
+            np.array([label for _, label in batch], dtype=object)
+        )
+
+        holdout = [(text, label) for text, label in self._holdout if label in known]
+        baseline = self._accuracy(models.classifier, models.vectorizer, holdout)
+        updated = self._accuracy(candidate, models.vectorizer, holdout)
+        if not incremental:
+            self._companion = candidate
+            # Replacing a different model family needs holdout evidence that it is no worse
+            if baseline is None or updated < baseline:
+                self.rejected += 1
+                return False
+        elif baseline is not None and updated < baseline - self.tolerance:
+            self.rejected += 1
+            return False
+
+        self._publish(candidate, models.vectorizer, updated, len(holdout))
+        self.published += 1
+        self.last_holdout_accuracy = updated
+        return True
+
+    def _write_summary(self, directory, parent_dir, classifier, holdout_accuracy, holdout_rows, parent):
+        """Metrics for the updated model, with its holdout accuracy kept apart from the trained accuracy
+
+        The holdout is small and weakly labelled, so it is recorded under its own key. best_accuracy
+        stays the parent's cross-validated figure, which the update had to match on the holdout to be
+        published, and which a scheduled retrain's cross-validated accuracy is compared against.
+        """
+        model_name = f'Online {type(classifier).__name__}'
+        try:
+            with open(os.path.join(parent_dir, 'training_metadata.json'), 'r') as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            metadata = {}
+        metadata.update({
+            'training_date': datetime.now().isoformat(),
+            'best_model': model_name,
+            'holdout_accuracy': holdout_accuracy,
+            'holdout_rows': holdout_rows,
+            'models_trained': [model_name],
+            'distilled_from': None,
+            'source': 'online',
+            'parent_version': parent
+        })
+        metrics = {
+            'accuracy': metadata.get('best_accuracy'),
+            'holdout_accuracy': holdout_accuracy,
+            'holdout_rows': holdout_rows
+        }
+        documents = {
+            'performance_metrics.json': {model_name: metrics},
+            'training_metadata.json': metadata
+        }
+        for file_name, document in documents.items():
+            tmp_path = os.path.join(directory, f'{file_name}.{os.getpid()}.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(document, f, indent=2)
+            os.replace(tmp_path, os.path.join(directory, file_name))
+
+    def _publish(self, classifier, vectorizer, holdout_accuracy, holdout_rows):
+        """Make the updated classifier the served one in every process using the model holder"""
+        registry = self.holder.registry
+        if registry is None:
+            # The vectorizer is unchanged, so only the classifier file is replaced
+            directory = os.path.dirname(self.holder.classifier_file)
+            with model_files_lock(exclusive=True, lock_file=self.holder.lock_file):
+                dump_atomic(classifier, self.holder.classifier_file)
+                self._write_summary(directory, directory, classifier, holdout_accuracy, holdout_rows, None)
+            return
+
+        # Each update is its own registry version, so a bad one is undone with a rollback
+        parent = registry.production
+        parent_dir = registry.version_dir(parent) if parent else registry.models_dir
+        version, version_dir = registry.new_version()
+        dump_atomic(classifier, os.path.join(version_dir, os.path.basename(CLASSIFIER_FILE)))
+        dump_atomic(vectorizer, os.path.join(version_dir, os.path.basename(VECTORIZER_FILE)))
+        self._write_summary(version_dir, parent_dir, classifier, holdout_accuracy, holdout_rows, parent)
+
+        registry.promote(version)
+
+    def stats(self):
+        return {
+            'queued': self._queue.qsize(),
+            'pending': len(self._pending),
+            'holdout': len(self._holdout),
+            'published': self.published,
+            'rejected': self.rejected,
+            'skipped': self.skipped,
+            'last_holdout_accuracy': self.last_holdout_accuracy
+        }
+
+
+_learner = None
+_learner_lock = threading.Lock()
+
+
+def get_online_learner():
+    """Return the shared online learner, or None when online learning is disabled"""
+    global _learner
+    if not ONLINE_LEARNING:
+        return None
+    if _learner is None:
+        with _learner_lock:
+            if _learner is None:
+                _learner = OnlineLearner()
+    return _learner
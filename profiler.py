@@ -0,0 +1,142 @@
+import cProfile
+import io
+import os
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+PROFILE_DIR = 'data/profiles'
+PROFILE_MAX_CAPTURES = 50
+PROFILE_TOP_ALLOCATIONS = 20
+
+# ATS_PROFILE=1 profiles every analysis from startup; the System Status page can also toggle it
+PROFILE_ENABLED = os.environ.get('ATS_PROFILE', '').lower() in ('1', 'true', 'yes', 'on')
+
+
+class Profiler:
+    """Opt-in cProfile and tracemalloc capture of single analyses into a bounded directory"""
+
+    def __init__(self, profile_dir=PROFILE_DIR, max_captures=PROFILE_MAX_CAPTURES, enabled=PROFILE_ENABLED):
+        self.profile_dir = profile_dir
+        self.max_captures = max_captures
+        self.enabled = enabled
+        # Only one cProfile profiler can be active per process
+        self._active = threading.Lock()
+
+    @contextmanager
+    def capture(self, label):
+        """Profile the enclosed block when enabled; a no-op otherwise"""
+        if not self.enabled or not self._active.acquire(blocking=False):
+            yield None
+            return
+
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        profile = cProfile.Profile()
+        started = time.perf_counter()
+
+        try:
+            profile.enable()
+            try:
+                yield profile
+            finally:
+                profile.disable()
+                seconds = time.perf_counter() - started
+                snapshot = tracemalloc.take_snapshot()
+                peak = tracemalloc.get_traced_memory()[1]
+                if started_tracing:
+                    tracemalloc.stop()
+                self._write_capture(label, profile, snapshot, seconds, peak)
+        finally:
+            self._active.release()
+
+    def _write_capture(self, label, profile, snapshot, seconds, peak):
+        try:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            safe_label = re.sub(r'[^A-Za-z0-9_.-]+', '_', label)[:60]
+            name = f"{time.strftime('%Y%m%d-%H%M%S')}-{int(time.time() * 1000) % 1000:03d}-{os.getpid()}-{safe_label}"
+            base = os.path.join(self.profile_dir, name)
+
+            profile.dump_stats(base + '.prof')
+
+            lines = [f"{label}: {seconds * 1000:.1f} ms, peak traced memory {peak / 1024:.1f} KiB", ""]
+            for stat in snapshot.statistics('lineno')[:PROFILE_TOP_ALLOCATIONS]:
+                lines.append(str(stat))
+            with open(base + '.alloc.txt', 'w') as f:
+                f.write('\n'.join(lines) + '\n')
+
+            self._prune()
+        except Exception as e:
+            print(f"⚠️ Could not write profile capture: {e}")
+
+    def _prune(self):
+        """Keep only the newest captures"""
+        captures = self.list_captures()
+        for capture in captures[self.max_captures:]:
+            for path in (capture['prof_path'], capture['alloc_path']):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def list_captures(self):
+        """Captures on disk, newest first"""
+        if not os.path.isdir(self.profile_dir):
+            return []
+
+        captures = []
+        for file_name in os.listdir(self.profile_dir):
+            if not file_name.endswith('.prof'):
+                continue
+            prof_path = os.path.join(self.profile_dir, file_name)
+            try:
+                created = os.path.getmtime(prof_path)
+            except OSError:
+                continue
+            captures.append({
+                'name': file_name[:-5],
+                'created': created,
+                'prof_path': prof_path,
+                'alloc_path': prof_path[:-5] + '.alloc.txt'
+            })
+        captures.sort(key=lambda capture: (capture['created'], capture['name']), reverse=True)
+        return captures
+
+    def top_functions(self, prof_path, limit=20):
+        """Top functions of a capture by cumulative time"""
+        stats = pstats.Stats(prof_path, stream=io.StringIO())
+        rows = []
+        for (file_name, line, function), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+            rows.append({
+                'function': f"{function} ({os.path.basename(file_name)}:{line})",
+                'calls': ncalls,
+                'tottime': tottime,
+                'cumtime': cumtime
+            })
+        rows.sort(key=lambda row: row['cumtime'], reverse=True)
+        return rows[:limit]
+
+    def read_allocations(self, capture):
+        try:
+            with open(capture['alloc_path'], 'r') as f:
+                return f.read()
+        except OSError:
+            return ""
+
+
+_profiler = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler():
+    """Return the process-wide profiler"""
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                _profiler = Profiler()
+    return _profiler
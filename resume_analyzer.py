@@ -1,68 +1,39 @@
 import re
-import nltk
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import pickle
-import os
+import time
 import numpy as np
-
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt', quiet=True)
-
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords', quiet=True)
+from keyword_registry import get_field_keywords
+from keyword_matcher import get_keyword_matcher
+from metrics import timed
+from model_store import get_linear_model_holder, get_model_holder
+from shadow_scorer import get_shadow_scorer
 
 class ResumeAnalyzer:
     def __init__(self):
-        self.field_keywords = {
-            'Software Engineering': [
-                'python', 'java', 'javascript', 'react', 'node.js', 'sql', 'git',
-                'docker', 'kubernetes', 'aws', 'api', 'database', 'frontend',
-                'backend', 'full-stack', 'agile', 'scrum', 'testing', 'debugging',
-                'html', 'css', 'mongodb', 'postgresql', 'redis', 'microservices'
-            ],
-            'Data Analyst': [
-                'python', 'r', 'sql', 'excel', 'tableau', 'power bi', 'pandas',
-                'numpy', 'matplotlib', 'seaborn', 'statistics', 'data visualization',
-                'machine learning', 'regression', 'classification', 'clustering',
-                'etl', 'data mining', 'business intelligence', 'analytics',
-                'spss', 'sas', 'hadoop', 'spark', 'data warehouse'
-            ],
-            'Consultant': [
-                'consulting', 'strategy', 'business analysis', 'project management',
-                'stakeholder management', 'client relations', 'problem solving',
-                'presentation', 'communication', 'leadership', 'change management',
-                'process improvement', 'market research', 'financial analysis',
-                'risk assessment', 'vendor management', 'negotiation',
-                'strategic planning', 'business development'
-            ]
-        }
-        
-        self.load_models()
+        # Warm whichever model will serve predictions; the pickles are only needed without a linear export
+        if get_linear_model_holder().get() is None:
+            self.load_models()
+    
+    @property
+    def field_keywords(self):
+        """Field keywords from the shared, process-wide registry"""
+        return get_field_keywords()
     
     def load_models(self):
-        """Load trained models if they exist"""
-        try:
-            if os.path.exists('models/field_classifier.pkl'):
-                with open('models/field_classifier.pkl', 'rb') as f:
-                    self.field_classifier = pickle.load(f)
-            else:
-                self.field_classifier = None
-                
-            if os.path.exists('models/vectorizer.pkl'):
-                with open('models/vectorizer.pkl', 'rb') as f:
-                    self.vectorizer = pickle.load(f)
-            else:
-                self.vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
-        except Exception as e:
-            print(f"Error loading models: {e}")
-            self.field_classifier = None
-            self.vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
+        """Return the current trained models from the shared holder, or None if there are none"""
+        return get_model_holder().get()
+    
+    @property
+    def field_classifier(self):
+        models = self.load_models()
+        return models.classifier if models is not None else None
+    
+    @property
+    def vectorizer(self):
+        models = self.load_models()
+        if models is not None:
+            return models.vectorizer
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        return TfidfVectorizer(max_features=1000, stop_words='english')
     
     def preprocess_text(self, text):
         """Clean and preprocess text"""
@@ -78,30 +49,43 @@ class ResumeAnalyzer:
         
         return text
     
-    def extract_skills(self, text):
+    def extract_skills(self, text, word_boundary=False):
         """Extract skills from resume text"""
         text = self.preprocess_text(text)
-        skills_found = {}
         
-        for field, keywords in self.field_keywords.items():
-            field_skills = []
-            for keyword in keywords:
-                if keyword.lower() in text:
-                    field_skills.append(keyword)
-            skills_found[field] = field_skills
-        
-        return skills_found
+        # One pass over the text for every keyword of every field
+        matcher = get_keyword_matcher(word_boundary=word_boundary)
+        return matcher.match_fields(text)
     
+    @timed('resume_analyzer.get_field_recommendations')
     def get_field_recommendations(self, resume_text):
         """Get field recommendations based on resume content"""
-        if self.field_classifier is not None and hasattr(self.vectorizer, 'vocabulary_'):
+        cleaned_text = self.preprocess_text(resume_text)
+        
+        # An exported linear model is served in NumPy without importing scikit-learn
+        linear_model = get_linear_model_holder().get()
+        if linear_model is not None:
+            try:
+                started = time.perf_counter()
+                probabilities = linear_model.predict_proba_one(cleaned_text)
+                recommendations = dict(zip(linear_model.classes_, probabilities))
+                self._shadow(cleaned_text, recommendations, time.perf_counter() - started)
+                return recommendations
+            except Exception as e:
+                print(f"Error using exported linear model: {e}")
+        
+        # One snapshot, so a reload mid-prediction cannot mix a new classifier with an old vectorizer
+        models = self.load_models()
+        if models is not None:
             try:
                 # Use trained model
-                text_vector = self.vectorizer.transform([self.preprocess_text(resume_text)])
-                probabilities = self.field_classifier.predict_proba(text_vector)[0]
+                started = time.perf_counter()
+                text_vector = models.vectorizer.transform([cleaned_text])
+                probabilities = models.classifier.predict_proba(text_vector)[0]
                 
-                field_names = self.field_classifier.classes_
+                field_names = models.classifier.classes_
                 recommendations = dict(zip(field_names, probabilities))
+                self._shadow(cleaned_text, recommendations, time.perf_counter() - started)
             except Exception as e:
                 print(f"Error using trained model: {e}")
                 recommendations = self._keyword_based_recommendations(resume_text)
@@ -111,6 +95,10 @@ class ResumeAnalyzer:
         
         return recommendations
     
+    def _shadow(self, cleaned_text, recommendations, seconds):
+        """Hand the request to the shadow scorer when a candidate model is being compared"""
+        get_shadow_scorer().submit(cleaned_text, max(recommendations, key=recommendations.get), seconds)
+    
     def _keyword_based_recommendations(self, resume_text):
         """Fallback keyword-based recommendations"""
         skills_found = self.extract_skills(resume_text)
@@ -131,6 +119,7 @@ class ResumeAnalyzer:
         
         return recommendations
     
+    @timed('resume_analyzer.analyze_resume')
     def analyze_resume(self, resume_text, target_field):
         """Perform comprehensive resume analysis"""
         skills_found = self.extract_skills(resume_text)
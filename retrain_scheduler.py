@@ -0,0 +1,259 @@
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from model_registry import ModelRegistry, dataset_signature
+from model_store import MODELS_DIR
+from model_trainer import TRAINING_DATASET
+
+# ATS_AUTO_RETRAIN=1 starts the scheduler inside the app; `python retrain_scheduler.py` runs it standalone
+AUTO_RETRAIN = os.environ.get('ATS_AUTO_RETRAIN', '').lower() in ('1', 'true', 'yes', 'on')
+RETRAIN_CHECK_SECONDS = float(os.environ.get('ATS_RETRAIN_CHECK_SECONDS', 300))
+# A changed dataset is retrained once this many rows were added or removed, or once the last run is this old
+RETRAIN_MIN_ROW_DELTA = int(os.environ.get('ATS_RETRAIN_MIN_ROW_DELTA', 100))
+RETRAIN_MAX_AGE_SECONDS = float(os.environ.get('ATS_RETRAIN_MAX_AGE_SECONDS', 24 * 3600))
+# A candidate may be this much slower (p99) than the live model and still be promoted;
+# the absolute slack keeps benchmark noise on sub-millisecond models from blocking promotion
+PROMOTION_LATENCY_TOLERANCE = 0.10
+PROMOTION_LATENCY_SLACK_MS = 0.5
+
+
+def _retrain_job(dataset_file, version_dir):
+    """Train into a version directory; runs in a child process"""
+    try:
+        os.nice(10)
+    except (AttributeError, OSError):
+        pass
+
+    import pandas as pd
+    from model_trainer import ModelTrainer
+
+    result = ModelTrainer(models_dir=version_dir).train_models(pd.read_csv(dataset_file))
+    if not result['training_completed']:
+        print(f"❌ Scheduled retraining failed: {result['error']}")
+        raise SystemExit(1)
+
+
+class RetrainScheduler:
+    """Retrains in a separate process when the dataset changes and promotes better models"""
+
+    def __init__(self, dataset_file=TRAINING_DATASET, models_dir=MODELS_DIR, state_file=None,
+                 check_seconds=RETRAIN_CHECK_SECONDS, min_row_delta=RETRAIN_MIN_ROW_DELTA,
+                 max_age_seconds=RETRAIN_MAX_AGE_SECONDS, latency_tolerance=PROMOTION_LATENCY_TOLERANCE):
+        self.dataset_file = dataset_file
+        self.models_dir = models_dir
+        self.registry = ModelRegistry(models_dir)
+        self.state_file = state_file or os.path.join(models_dir, 'retrain_state.json')
+        self.check_seconds = check_seconds
+        self.min_row_delta = min_row_delta
+        self.max_age_seconds = max_age_seconds
+        self.latency_tolerance = latency_tolerance
+
+        self._context = multiprocessing.get_context('spawn')
+        self._process = None
+        self._job = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def load_state(self):
+        try:
+            with open(self.state_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_state(self, state):
+        os.makedirs(os.path.dirname(self.state_file) or '.', exist_ok=True)
+        tmp_path = f'{self.state_file}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, self.state_file)
+
+    @property
+    def running(self):
+        return self._process is not None and self._process.is_alive()
+
+    def retrain_reason(self, state, signature):
+        """Why the dataset should be retrained now, or None"""
+        trained = state.get('dataset')
+        if trained is None:
+            if self.registry.production_summary() is None:
+                return 'no trained model'
+            # Models trained before the scheduler existed count as trained on the current data
+            return None
+        if trained['sha256'] == signature['sha256']:
+            return None
+
+        row_delta = abs(signature['rows'] - trained['rows'])
+        if row_delta >= self.min_row_delta:
+            return f'{row_delta} rows changed'
+        if time.time() - state.get('last_started', 0) >= self.max_age_seconds:
+            return 'dataset changed since the last run'
+        return None
+
+    def check(self):
+        """Start a retraining run if the dataset crossed a threshold; returns the reason or None"""
+        if self.running or not os.path.exists(self.dataset_file):
+            return None
+
+        state = self.load_state()
+        signature = dataset_signature(self.dataset_file)
+        reason = self.retrain_reason(state, signature)
+        if reason is None:
+            if 'dataset' not in state:
+                state['dataset'] = signature
+                self.save_state(state)
+            return None
+
+        self.start_retrain(signature, reason)
+        return reason
+
+    def start_retrain(self, signature, reason):
+        version, version_dir = self.registry.new_version()
+
+        print(f"🔄 Retraining model version {version} ({reason})")
+        self._process = self._context.Process(
+            # Not a daemon: training fans out to joblib workers, which daemonic processes may not start
+            target=_retrain_job, args=(self.dataset_file, version_dir), name=f'retrain-{version}'
+        )
+        self._process.start()
+        self._job = {'version': version, 'version_dir': version_dir, 'dataset': signature, 'reason': reason}
+
+        state = self.load_state()
+        state['last_started'] = time.time()
+        self.save_state(state)
+
+    def poll(self):
+        """Finish a completed run: promote or reject it; returns the outcome or None while running"""
+        if self._process is None or self._process.is_alive():
+            return None
+
+        self._process.join()
+        job, exitcode = self._job, self._process.exitcode
+        self._process = None
+        self._job = None
+
+        state = self.load_state()
+        # A failed or rejected run still consumes the dataset change so it is not retried in a loop
+        state['dataset'] = job['dataset']
+        outcome = {'version': job['version'], 'reason': job['reason'], 'finished': time.time()}
+
+        candidate = self.registry.summary(job['version']) if exitcode == 0 else None
+        if candidate is None:
+            outcome['status'] = 'failed'
+            shutil.rmtree(job['version_dir'], ignore_errors=True)
+            print(f"❌ Retraining of {job['version']} failed (exit code {exitcode})")
+        elif self.is_better(candidate, self.registry.production_summary()):
+            # A pointer flip; the model holders reload on their next call
+            self.registry.promote(job['version'])
+            outcome['status'] = 'promoted'
+            print(f"✅ Promoted model version {job['version']} ({candidate['best_model']}, accuracy {candidate['accuracy']:.3f})")
+        else:
+            # Kept in the registry, where it can still be shadow-scored or promoted by hand
+            outcome['status'] = 'rejected'
+            print(f"⚠️ Model version {job['version']} did not beat the live model; keeping the live model")
+        outcome['candidate'] = candidate
+
+        state['last_run'] = outcome
+        self.save_state(state)
+        return outcome
+
+    def is_better(self, candidate, live):
+        """At least as accurate as the live model and not meaningfully slower"""
+        if live is None or live.get('accuracy') is None:
+            return True
+        if candidate['accuracy'] < live['accuracy']:
+            return False
+        if candidate.get('latency_p99_ms') is None or live.get('latency_p99_ms') is None:
+            return True
+        return candidate['latency_p99_ms'] <= live['latency_p99_ms'] * (1 + self.latency_tolerance) + PROMOTION_LATENCY_SLACK_MS
+
+    def tick(self):
+        self.poll()
+        try:
+            self.check()
+        except Exception as e:
+            print(f"⚠️ Retrain check failed: {e}")
+
+    def _run(self):
+        # Only one scheduler per models directory, however many app processes start one
+        lock_fd = None
+        if fcntl is not None:
+            os.makedirs(self.models_dir, exist_ok=True)
+            lock_fd = os.open(os.path.join(self.models_dir, '.scheduler.lock'), os.O_RDWR | os.O_CREAT, 0o644)
+            while not self._stop.is_set():
+                try:
+                    fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except OSError:
+                    self._stop.wait(self.check_seconds)
+        try:
+            while not self._stop.is_set():
+                self.tick()
+                self._stop.wait(1 if self.running else self.check_seconds)
+        finally:
+            if lock_fd is not None:
+                os.close(lock_fd)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='retrain-scheduler', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop checking and abandon a run in progress; the live model is untouched"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self.running:
+            self._process.terminate()
+            self._process.join()
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_retrain_scheduler():
+    """Return the shared, started scheduler, or None when automatic retraining is disabled"""
+    global _scheduler
+    if not AUTO_RETRAIN:
+        return None
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = RetrainScheduler().start()
+    return _scheduler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Retrain the field classifier when the dataset changes")
+    parser.add_argument('--dataset', default=TRAINING_DATASET, help="Labeled CSV to watch")
+    parser.add_argument('--interval', type=float, default=RETRAIN_CHECK_SECONDS, help="Seconds between dataset checks")
+    parser.add_argument('--once', action='store_true', help="Check once, wait for any run to finish, then exit")
+    args = parser.parse_args()
+
+    scheduler = RetrainScheduler(dataset_file=args.dataset, check_seconds=args.interval)
+    if args.once:
+        scheduler.check()
+        while scheduler.running:
+            time.sleep(1)
+        outcome = scheduler.poll()
+        print(f"Outcome: {outcome['status'] if outcome else 'no retraining needed'}")
+    else:
+        scheduler.start()
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            scheduler.stop()
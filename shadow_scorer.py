@@ -0,0 +1,146 @@
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+
+from metrics import get_metrics
+from model_registry import get_model_registry
+from model_store import CLASSIFIER_FILE, LINEAR_MODEL_FILE, VECTORIZER_FILE, LinearModelHolder, ModelHolder
+
+SHADOW_QUEUE_SIZE = 200
+
+
+class ShadowScorer:
+    """Scores live requests with the registry's candidate version off the request path
+
+    The analyzer submits each production prediction with its latency; a background
+    thread runs the candidate on the same cleaned text and records agreement and both
+    latencies as shadow.<version>.* metrics.
+    """
+
+    def __init__(self, registry=None, metrics=None, max_queued=SHADOW_QUEUE_SIZE):
+        self.registry = registry or get_model_registry()
+        self.metrics = metrics or get_metrics()
+        self.dropped = 0
+        self._holders = {}
+        self._queue = queue.Queue(maxsize=max_queued)
+        self._thread = None
+        self._thread_lock = threading.Lock()
+
+    def submit(self, cleaned_text, production_field, production_seconds):
+        """Queue a request for the candidate, if there is one; never blocks the caller"""
+        candidate = self.registry.candidate
+        if candidate is None or candidate == self.registry.production:
+            return False
+
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait((candidate, cleaned_text, production_field, production_seconds))
+            return True
+        except queue.Full:
+            # Shadow traffic is sampled under load rather than slowing production down
+            self.dropped += 1
+            return False
+
+    def flush(self):
+        """Wait until every queued request has been scored"""
+        self._queue.join()
+
+    def _ensure_thread(self):
+        if self._thread is None:
+            with self._thread_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name='shadow-scorer', daemon=True)
+                    self._thread.start()
+
+    def _holders_for(self, version):
+        """Linear and pickled model holders reading straight from a version's directory"""
+        if version not in self._holders:
+            version_dir = self.registry.version_dir(version)
+            # Only the current candidate's models are kept in memory
+            self._holders = {version: (
+                LinearModelHolder(os.path.join(version_dir, os.path.basename(LINEAR_MODEL_FILE)), self.registry.lock_file),
+                ModelHolder(
+                    os.path.join(version_dir, os.path.basename(CLASSIFIER_FILE)),
+                    os.path.join(version_dir, os.path.basename(VECTORIZER_FILE)),
+                    self.registry.lock_file
+                )
+            )}
+        return self._holders[version]
+
+    def _load(self, version):
+        """A version's served artifacts as (linear model, None) or (None, pickled models)"""
+        linear_holder, model_holder = self._holders_for(version)
+        linear_model = linear_holder.get()
+        if linear_model is not None:
+            return linear_model, None
+        return None, model_holder.get()
+
+    def _predict(self, linear_model, models, cleaned_text):
+        if linear_model is not None:
+            probabilities = linear_model.predict_proba_one(cleaned_text)
+            return linear_model.classes_[int(np.argmax(probabilities))]
+        if models is None:
+            return None
+        probabilities = models.classifier.predict_proba(models.vectorizer.transform([cleaned_text]))[0]
+        return models.classifier.classes_[int(np.argmax(probabilities))]
+
+    def predict_field(self, version, cleaned_text):
+        """Top field from a version, served the way production would serve it"""
+        return self._predict(*self._load(version), cleaned_text)
+
+    def _run(self):
+        while True:
+            version, cleaned_text, production_field, production_seconds = self._queue.get()
+            try:
+                # Loaded before the clock starts: production latency never includes a model load either
+                linear_model, models = self._load(version)
+                started = time.perf_counter()
+                candidate_field = self._predict(linear_model, models, cleaned_text)
+                candidate_seconds = time.perf_counter() - started
+                if candidate_field is not None:
+                    prefix = f'shadow.{version}'
+                    self.metrics.increment(f'{prefix}.requests')
+                    if str(candidate_field) == str(production_field):
+                        self.metrics.increment(f'{prefix}.agreements')
+                    self.metrics.observe(f'{prefix}.production', production_seconds)
+                    self.metrics.observe(f'{prefix}.candidate', candidate_seconds)
+            except Exception as e:
+                print(f"Error in shadow scoring: {e}")
+            finally:
+                self._queue.task_done()
+
+    def report(self, version=None):
+        """Agreement rate and production vs. candidate latency for a shadowed version"""
+        version = version or self.registry.candidate
+        if version is None:
+            return None
+
+        prefix = f'shadow.{version}'
+        counters = self.metrics.counters()
+        latency = self.metrics.latency_summary()
+        requests = counters.get(f'{prefix}.requests', 0)
+        return {
+            'version': version,
+            'requests': requests,
+            'agreement_rate': counters.get(f'{prefix}.agreements', 0) / requests if requests else None,
+            'production': latency.get(f'{prefix}.production'),
+            'candidate': latency.get(f'{prefix}.candidate'),
+            'dropped': self.dropped
+        }
+
+
+_scorer = None
+_scorer_lock = threading.Lock()
+
+
+def get_shadow_scorer():
+    """Return the shared shadow scorer"""
+    global _scorer
+    if _scorer is None:
+        with _scorer_lock:
+            if _scorer is None:
+                _scorer = ShadowScorer()
+    return _scorer
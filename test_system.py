@@ -131,6 +131,1210 @@ def test_components():
         print(f"❌ Component test error: {e}")
         return False
 
+def test_scoring_engine():
+    """Test that the shared scoring context gives the same scores as raw text"""
+    print("🧮 Testing scoring engine...")
+    
+    try:
+        from ats_scorer import ATSScorer, ResumeContext
+        
+        sample_text = """
+        SUMMARY
+        Data analyst with five years of experience building dashboards and reports for finance teams
+        
+        EXPERIENCE
+        Analyst at Numbers Inc (Jan 2019 - present)
+        • Automated reporting with SQL, Python and Tableau
+        
+        EDUCATION
+        Master of Science, State University (2018), GPA 3.8
+        """
+        
+        scorer = ATSScorer()
+        ctx = ResumeContext(sample_text)
+        
+        from_context = scorer.score_all(ctx, "Data Analyst")
+        from_text = {
+            'contact_info': scorer.score_contact_info(sample_text),
+            'professional_summary': scorer.score_professional_summary(sample_text),
+            'work_experience': scorer.score_work_experience(sample_text),
+            'education': scorer.score_education(sample_text),
+            'skills': scorer.score_skills(sample_text, "Data Analyst"),
+            'keywords_match': scorer.score_keywords_match(sample_text, "Data Analyst"),
+            'formatting': scorer.score_formatting(sample_text),
+            'length': scorer.score_length(sample_text)
+        }
+        
+        if from_context != from_text:
+            print(f"❌ Context scores differ: {from_context} vs {from_text}")
+            return False
+        
+        if ctx.word_count != len(sample_text.split()):
+            print("❌ Context word count is wrong")
+            return False
+        
+        print(f"✅ Scoring engine consistent: {sum(from_context.values()):.1f} points")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Scoring engine error: {e}")
+        return False
+
+def test_keyword_registry():
+    """Test that the keyword registry is shared, read-only and reloads on change"""
+    print("🗂️ Testing keyword registry...")
+    
+    try:
+        import json
+        import tempfile
+        from keyword_registry import KeywordRegistry, get_field_keywords
+        from resume_analyzer import ResumeAnalyzer
+        
+        if ResumeAnalyzer().field_keywords is not get_field_keywords():
+            print("❌ ResumeAnalyzer does not use the shared registry")
+            return False
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source_file = os.path.join(tmp_dir, 'field_keywords.json')
+            registry = KeywordRegistry(source_file)
+            first = registry.get()
+            
+            if registry.get() is not first:
+                print("❌ Registry reloaded without a source change")
+                return False
+            
+            with open(source_file, 'w') as f:
+                json.dump({'Designer': ['figma', 'sketch']}, f)
+            
+            reloaded = registry.get()
+            if reloaded.get('Designer') != ('figma', 'sketch') or registry.version != 2:
+                print("❌ Registry did not pick up the new source file")
+                return False
+            
+            try:
+                reloaded['Designer'] = ()
+                print("❌ Registry is mutable")
+                return False
+            except TypeError:
+                pass
+        
+        print(f"✅ Keyword registry ready: {len(get_field_keywords())} fields")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Keyword registry error: {e}")
+        return False
+
+def test_keyword_matcher():
+    """Test single-pass keyword matching and word-boundary semantics"""
+    print("🔎 Testing keyword matcher...")
+    
+    try:
+        from keyword_matcher import KeywordMatcher
+        
+        matcher = KeywordMatcher({
+            'Data Analyst': ['r', 'sql', 'power bi'],
+            'Software Engineering': ['sql', 'react']
+        })
+        text = "built power bi reports from sql for a react app"
+        
+        matches = matcher.find_all(text)
+        if (6, 14, 'power bi') not in matches:
+            print(f"❌ Missing match position: {matches}")
+            return False
+        
+        fields = matcher.match_fields(text)
+        if fields['Data Analyst'] != ['r', 'sql', 'power bi'] or fields['Software Engineering'] != ['sql', 'react']:
+            print(f"❌ Unexpected field matches: {fields}")
+            return False
+        
+        bounded = KeywordMatcher(matcher.field_keywords, word_boundary=True).match_fields(text)
+        if 'r' in bounded['Data Analyst']:
+            print("❌ Word-boundary matching still finds 'r' inside words")
+            return False
+        
+        print(f"✅ Keyword matcher found {len(matches)} matches")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Keyword matcher error: {e}")
+        return False
+
+def test_history_writer():
+    """Test that concurrent history appends are all written"""
+    print("📝 Testing history writer...")
+    
+    try:
+        import tempfile
+        import threading
+        from history_writer import HistoryWriter
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            history_file = os.path.join(tmp_dir, 'analysis_history.csv')
+            writer = HistoryWriter(history_file, max_buffered=50, batch_size=20)
+            
+            def record(session):
+                for i in range(100):
+                    writer.append({'timestamp': f'{session}-{i}', 'target_field': 'Consultant', 'ats_score': i})
+            
+            sessions = [threading.Thread(target=record, args=(n,)) for n in range(4)]
+            for session in sessions:
+                session.start()
+            for session in sessions:
+                session.join()
+            writer.close()
+            
+            df = pd.read_csv(history_file)
+            if len(df) != 400 or df['timestamp'].nunique() != 400:
+                print(f"❌ Expected 400 history rows, found {len(df)}")
+                return False
+        
+        print("✅ History writer kept every row")
+        return True
+        
+    except Exception as e:
+        print(f"❌ History writer error: {e}")
+        return False
+
+def test_history_migration():
+    """Test that an older history log gains the seconds_* columns without losing rows"""
+    print("🧭 Testing history migration...")
+    
+    try:
+        import csv
+        import tempfile
+        from ats_scorer import ATSScorer
+        from history_writer import HISTORY_COLUMNS, HistoryWriter
+        
+        old_columns = [column for column in HISTORY_COLUMNS if not column.startswith('seconds_')]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            history_file = os.path.join(tmp_dir, 'analysis_history.csv')
+            with open(history_file, 'w', newline='') as f:
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow(old_columns)
+                for i in range(5):
+                    writer.writerow([f'2024-01-0{i + 1}T10:00:00', 'Data Analyst, Senior', 70 + i] + [''] * (len(old_columns) - 3))
+                # A malformed row is carried over verbatim rather than dropped
+                writer.writerow(['2024-01-09T10:00:00', 'Consultant', 50] + ['1'] * len(old_columns))
+            
+            scorer = ATSScorer()
+            resume = "Jane Doe jane@example.com Data analyst with SQL and Python experience"
+            scores = scorer.score_all(resume, "Data Analyst")
+            timings = {'extraction': 0.01, 'scoring': 0.02, 'classification': 0.03, 'gap_analysis': 0.04, 'total': 0.1}
+            
+            history = HistoryWriter(history_file)
+            history.append(scorer.history_row(resume, "Data Analyst", sum(scores.values()), scores, timings))
+            history.close()
+            
+            with open(history_file, newline='') as f:
+                rows = list(csv.reader(f))
+            if rows[0] != HISTORY_COLUMNS or len(rows) != 8:
+                print(f"❌ Migration changed the rows: header {rows[0]}, {len(rows) - 1} rows")
+                return False
+            if rows[1][1] != 'Data Analyst, Senior' or len(rows[6]) != len(old_columns) + 3:
+                print("❌ Migrated rows were not carried over intact")
+                return False
+            
+            latest = dict(zip(rows[0], rows[-1]))
+            if float(latest['seconds_total']) != 0.1 or float(latest['seconds_gap_analysis']) != 0.04:
+                print(f"❌ Stage timings were not recorded: {latest}")
+                return False
+        
+        print("✅ History log migrated with every row and stage timings recorded")
+        return True
+        
+    except Exception as e:
+        print(f"❌ History migration error: {e}")
+        return False
+
+def test_history_store():
+    """Test that both history backends answer queries alike and rebuild their rollups"""
+    print("🗄️ Testing history store...")
+    
+    try:
+        import tempfile
+        from history_store import CSVHistoryStore, SQLiteHistoryStore
+        
+        rows = [
+            {'timestamp': datetime.now().isoformat(), 'target_field': 'Data Analyst', 'ats_score': 91},
+            {'timestamp': datetime.now().isoformat(), 'target_field': 'Consultant', 'ats_score': 55},
+            {'timestamp': '2020-01-01T09:00:00', 'target_field': 'Data Analyst', 'ats_score': 100}
+        ]
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sqlite_store = SQLiteHistoryStore(os.path.join(tmp_dir, 'history.db'))
+            csv_store = CSVHistoryStore(os.path.join(tmp_dir, 'history.csv'))
+            
+            for store in (sqlite_store, csv_store):
+                store.extend(rows)
+                histogram = [count for _, _, count in store.score_histogram()]
+                
+                if store.total_count() != 3 or store.today_count() != 2:
+                    print(f"❌ {type(store).__name__} counts are wrong")
+                    return False
+                if store.field_counts() != {'Data Analyst': 2, 'Consultant': 1}:
+                    print(f"❌ {type(store).__name__} field counts are wrong: {store.field_counts()}")
+                    return False
+                if histogram != [0] * 8 + [1] + [0] * 4 + [1, 1]:
+                    print(f"❌ {type(store).__name__} histogram is wrong: {histogram}")
+                    return False
+                
+                rollups = (store.daily_counts(), store.field_counts(), store.score_histogram())
+                store.rebuild_rollups()
+                if (store.daily_counts(), store.field_counts(), store.score_histogram()) != rollups:
+                    print(f"❌ {type(store).__name__} rebuilt rollups differ from incremental ones")
+                    return False
+            
+            sqlite_store.close()
+            csv_store.close()
+        
+        print("✅ History backends agree")
+        return True
+        
+    except Exception as e:
+        print(f"❌ History store error: {e}")
+        return False
+
+def test_batch_scoring():
+    """Test that batch scoring matches per-resume scoring"""
+    print("📦 Testing batch scoring...")
+    
+    try:
+        from ats_scorer import ATSScorer
+        
+        resumes = [
+            "Jane Roe\njane@roe.io\nSKILLS\nSQL, Excel, Tableau\nEXPERIENCE\n2019-2022 Analyst",
+            "PROFILE\nConsultant focused on strategy, change management and client relations for retail chains\n• Led workshops",
+            ""
+        ]
+        
+        scorer = ATSScorer()
+        batch = scorer.score_batch(resumes, "Data Analyst", save_history=False)
+        
+        for i, resume in enumerate(resumes):
+            expected = scorer.score_all(resume, "Data Analyst")
+            for category, score in expected.items():
+                if batch[category].iloc[i] != score:
+                    print(f"❌ Resume {i} {category}: batch {batch[category].iloc[i]} vs single {score}")
+                    return False
+        
+        print(f"✅ Batch scoring matches for {len(batch)} resumes")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Batch scoring error: {e}")
+        return False
+
+def test_bulk_screening():
+    """Test the bulk screening CLI: output rows, resuming, CSV output and history recording"""
+    print("📦 Testing bulk screening...")
+    
+    try:
+        import json
+        import tempfile
+        import ats_screen
+        import history_store
+        
+        resume = (
+            "Jane Doe\njane{n}@example.com | 555-123-4567\nSummary\nData analyst with SQL and Python.\n"
+            "Experience\nData Analyst, Acme 2019-2023\nEducation\nBachelor of Science\nSkills\nSQL, Python, Tableau"
+        )
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            resume_dir = os.path.join(tmp_dir, 'resumes')
+            os.makedirs(resume_dir)
+            for n in range(4):
+                with open(os.path.join(resume_dir, f'resume_{n}.txt'), 'w') as f:
+                    f.write(resume.format(n=n))
+            
+            output = os.path.join(tmp_dir, 'results.jsonl')
+            history_file = os.path.join(tmp_dir, 'history.csv')
+            score_args = ['score', resume_dir, '--field', 'Data Analyst', '--workers', '2']
+            
+            previous_store = history_store._store
+            history_store._store = history_store.CSVHistoryStore(history_file)
+            try:
+                ats_screen.main(score_args + ['--output', output, '--record-history'])
+            finally:
+                history_store._store.close()
+                history_store._store = previous_store
+            
+            with open(output) as f:
+                rows = [json.loads(line) for line in f]
+            if len(rows) != 4 or any(row['status'] != 'ok' for row in rows):
+                print(f"❌ Expected 4 screened resumes, got {rows}")
+                return False
+            if len(pd.read_csv(history_file)) != 4:
+                print("❌ --record-history did not write a history row per resume")
+                return False
+            
+            # A rerun skips everything already in the output file
+            ats_screen.main(score_args + ['--output', output])
+            with open(output) as f:
+                if len(f.readlines()) != 4:
+                    print("❌ Rerun screened completed resumes again")
+                    return False
+            
+            # A torn last record is dropped and its resume screened again on a clean line
+            with open(output, 'rb') as f:
+                data = f.read()
+            with open(output, 'wb') as f:
+                f.write(data[:-20])
+            ats_screen.main(score_args + ['--output', output])
+            with open(output) as f:
+                rows = [json.loads(line) for line in f]
+            reader = ats_screen.ResultWriter(output)
+            reader.close()
+            if len(rows) != 4 or len(reader.completed) != 4:
+                print("❌ Resuming after a torn record lost or corrupted a result")
+                return False
+            
+            csv_output = os.path.join(tmp_dir, 'results.csv')
+            ats_screen.main(score_args + ['--output', csv_output])
+            csv_rows = pd.read_csv(csv_output)
+            if len(csv_rows) != 4 or list(csv_rows.columns) != ats_screen.RESULT_COLUMNS:
+                print("❌ CSV output is missing rows or columns")
+                return False
+        
+        print("✅ Bulk screening resumed cleanly and recorded history")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Bulk screening error: {e}")
+        return False
+
+def test_text_cache():
+    """Test that repeated uploads are served from the extracted-text cache"""
+    print("💾 Testing text cache...")
+    
+    try:
+        import io
+        import tempfile
+        from text_cache import TextCache
+        from text_extractor import TextExtractor
+        
+        class Upload(io.BytesIO):
+            type = "text/plain"
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = TextCache(tmp_dir, max_bytes=64)
+            extractor = TextExtractor(cache=cache)
+            
+            first = extractor.extract_text(Upload(b"Python developer with SQL skills"))
+            second = extractor.extract_text(Upload(b"Python developer with SQL skills"))
+            
+            if first != second or cache.stats()['hits'] != 1 or cache.stats()['misses'] != 1:
+                print(f"❌ Unexpected cache behaviour: {cache.stats()}")
+                return False
+            
+            extractor.extract_text(Upload(b"Management consultant with strategy and change experience"))
+            if cache.stats()['evictions'] != 1 or cache.stats()['bytes'] > 64:
+                print(f"❌ Cache did not stay within its size limit: {cache.stats()}")
+                return False
+        
+        # Caches in separate processes share one directory: entries and the size bound
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            first_process = TextCache(tmp_dir, max_bytes=100, rescan_seconds=0)
+            second_process = TextCache(tmp_dir, max_bytes=100, rescan_seconds=0)
+            first_process.put('a', 'x' * 40)
+            if second_process.get('a') != 'x' * 40:
+                print("❌ Entry written by another process was not found")
+                return False
+            
+            second_process.put('b', 'y' * 40)
+            first_process.put('c', 'z' * 40)
+            if first_process.stats()['bytes'] > 100 or second_process.get('a') is not None:
+                print(f"❌ Shared cache directory outgrew its bound: {first_process.stats()}")
+                return False
+        
+        print("✅ Text cache hits on repeated uploads")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Text cache error: {e}")
+        return False
+
+def build_pdf(page_texts):
+    """Build a minimal text PDF with one line per page"""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in page_texts:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {len(objects)} 0 R /Resources << /Font << /F1 3 0 R >> >> >>")
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode('latin-1')
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode('latin-1')
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode('latin-1')
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode('latin-1')
+    return out
+
+def test_pdf_page_budget():
+    """Test page-by-page PDF extraction stops at the page budget"""
+    print("📄 Testing PDF page budget...")
+    
+    try:
+        import io
+        from text_extractor import TextExtractor
+        
+        class Upload(io.BytesIO):
+            type = "application/pdf"
+        
+        extractor = TextExtractor(cache=False, max_pdf_pages=3)
+        stats = {}
+        text = extractor.extract_from_pdf(Upload(build_pdf([f"Page {i}" for i in range(10)])), stats)
+        
+        if text.split("\n") != ["Page 0", "Page 1", "Page 2"]:
+            print(f"❌ Unexpected PDF text: {text!r}")
+            return False
+        
+        if stats['total_pages'] != 10 or stats['pages_read'] != 3 or not stats['truncated'] or len(stats['page_seconds']) != 3:
+            print(f"❌ Unexpected PDF stats: {stats}")
+            return False
+        
+        print("✅ PDF extraction honoured the page budget")
+        return True
+        
+    except Exception as e:
+        print(f"❌ PDF page budget error: {e}")
+        return False
+
+def test_docx_extraction():
+    """Test streaming DOCX extraction keeps headers and table cells in document order"""
+    print("📝 Testing DOCX extraction...")
+    
+    try:
+        import io
+        import docx
+        from text_extractor import TextExtractor
+        
+        class Upload(io.BytesIO):
+            type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+        
+        document = docx.Document()
+        document.sections[0].header.paragraphs[0].text = "Jane Doe | jane@example.com"
+        document.add_paragraph("Data analyst")
+        table = document.add_table(rows=1, cols=2)
+        table.cell(0, 0).text = "Python"
+        table.cell(0, 1).text = "SQL"
+        document.add_paragraph("Experience")
+        buffer = io.BytesIO()
+        document.save(buffer)
+        
+        extractor = TextExtractor(cache=False, isolate=False)
+        text = extractor.extract_from_docx(Upload(buffer.getvalue()))
+        
+        if text.split("\n") != ["Jane Doe | jane@example.com", "Data analyst", "Python", "SQL", "Experience"]:
+            print(f"❌ Unexpected DOCX text: {text!r}")
+            return False
+        
+        print("✅ DOCX extraction kept headers and tables in order")
+        return True
+        
+    except Exception as e:
+        print(f"❌ DOCX extraction error: {e}")
+        return False
+
+def test_extraction_pool():
+    """Test isolated extraction with worker recycling and a hard timeout"""
+    print("🛡️ Testing extraction pool...")
+    
+    try:
+        from extraction_pool import ExtractionError, ExtractionPool, ExtractionTimeout
+        
+        pool = ExtractionPool(workers=1, timeout=30, max_jobs_per_worker=2)
+        pdf_bytes = build_pdf(["Isolated extraction"])
+        
+        try:
+            texts = [pool.extract(pdf_bytes, "application/pdf") for _ in range(3)]
+            if texts != ["Isolated extraction"] * 3 or pool.recycled != 1:
+                print(f"❌ Unexpected pool results: {texts}, recycled={pool.recycled}")
+                return False
+            
+            pool.timeout = 0
+            try:
+                pool.extract(build_pdf([f"Page {i}" for i in range(200)]), "application/pdf", max_pdf_pages=200)
+                print("❌ Extraction did not time out")
+                return False
+            except ExtractionTimeout:
+                pass
+            
+            pool.timeout = 30
+            if pool.extract(pdf_bytes, "application/pdf") != "Isolated extraction":
+                print("❌ Pool did not recover after a timeout")
+                return False
+            
+            # Parser failures reach the parent instead of coming back as empty text
+            try:
+                pool.extract(b"%PDF-1.4 truncated", "application/pdf")
+                print("❌ A corrupt PDF did not raise")
+                return False
+            except ExtractionTimeout:
+                print("❌ A corrupt PDF timed out")
+                return False
+            except ExtractionError as e:
+                if not str(e):
+                    print("❌ A corrupt PDF raised without a message")
+                    return False
+        finally:
+            pool.close()
+        
+        print("✅ Extraction pool recycles workers and enforces timeouts")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Extraction pool error: {e}")
+        return False
+
+def test_metrics():
+    """Test latency histograms, counters and persistence"""
+    print("⏱️ Testing metrics...")
+    
+    try:
+        import tempfile
+        from metrics import MetricsRegistry, process_stats
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            metrics_file = os.path.join(tmp_dir, 'metrics.json')
+            metrics = MetricsRegistry(metrics_file)
+            
+            for i in range(1, 101):
+                metrics.observe('stage', i / 1000)
+            metrics.increment('calls', 3)
+            
+            summary = metrics.latency_summary()['stage']
+            if summary['count'] != 100 or not 0.045 <= summary['p50'] <= 0.06 or not 0.09 <= summary['p99'] <= 0.1:
+                print(f"❌ Unexpected latency summary: {summary}")
+                return False
+            
+            metrics.save()
+            reloaded = MetricsRegistry(metrics_file)
+            if reloaded.latency_summary() != metrics.latency_summary() or reloaded.counters() != {'calls': 3}:
+                print("❌ Persisted metrics did not reload")
+                return False
+        
+        stats = process_stats()
+        if os.path.exists('/proc/self/status') and not stats['rss_bytes']:
+            print(f"❌ Could not read process stats: {stats}")
+            return False
+        
+        print("✅ Metrics record percentiles and persist")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Metrics error: {e}")
+        return False
+
+def test_profiler():
+    """Test that profiling captures are opt-in and bounded"""
+    print("🔬 Testing profiler...")
+    
+    try:
+        import tempfile
+        from profiler import Profiler
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            profiler = Profiler(tmp_dir, max_captures=2, enabled=False)
+            with profiler.capture("disabled") as profile:
+                sorted(range(1000))
+            if profile is not None or profiler.list_captures():
+                print("❌ Disabled profiler wrote a capture")
+                return False
+            
+            profiler.enabled = True
+            for i in range(3):
+                with profiler.capture(f"run {i}"):
+                    sorted(range(1000))
+            
+            captures = profiler.list_captures()
+            if len(captures) != 2 or not captures[0]['name'].endswith('run_2'):
+                print(f"❌ Unexpected captures: {[capture['name'] for capture in captures]}")
+                return False
+            
+            if not profiler.top_functions(captures[0]['prof_path']) or "peak traced memory" not in profiler.read_allocations(captures[0]):
+                print("❌ Capture is missing profile or allocation data")
+                return False
+        
+        print("✅ Profiler captures on demand within its limit")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Profiler error: {e}")
+        return False
+
+def test_model_holder():
+    """Test that the model holder loads once and swaps in retrained artifacts"""
+    print("🧠 Testing model holder...")
+    
+    try:
+        import tempfile
+        from model_store import ModelHolder, dump_atomic
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            classifier_file = os.path.join(tmp_dir, 'classifier.pkl')
+            vectorizer_file = os.path.join(tmp_dir, 'vectorizer.pkl')
+            holder = ModelHolder(classifier_file, vectorizer_file, os.path.join(tmp_dir, '.lock'))
+            
+            if holder.get() is not None:
+                print("❌ Holder returned models before any were trained")
+                return False
+            
+            dump_atomic({'run': 1}, classifier_file)
+            dump_atomic({'run': 1}, vectorizer_file)
+            first = holder.get()
+            if first.classifier != {'run': 1} or holder.get() is not first or holder.reloads != 1:
+                print("❌ Models were not loaded exactly once")
+                return False
+            
+            dump_atomic({'run': 2}, classifier_file)
+            dump_atomic({'run': 2}, vectorizer_file)
+            os.utime(classifier_file, ns=(0, 10 ** 9))
+            second = holder.get()
+            if second.classifier != {'run': 2} or second.vectorizer != {'run': 2} or second.version != 2:
+                print("❌ Retrained models were not swapped in")
+                return False
+        
+        print("✅ Model holder hot-reloads retrained models")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Model holder error: {e}")
+        return False
+
+def test_linear_predictor():
+    """Test that the NumPy predictor reproduces an exported scikit-learn model"""
+    print("🧮 Testing linear predictor...")
+    
+    try:
+        import tempfile
+        import numpy as np
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.linear_model import LogisticRegression
+        from linear_predictor import LinearFieldPredictor, export_linear_model
+        
+        texts = [
+            "python java react docker aws microservices", "javascript react node api git",
+            "sql tableau excel statistics dashboards", "python pandas sql regression analysis",
+            "strategy stakeholder management consulting", "business analysis change management strategy"
+        ]
+        labels = ["Software Engineering", "Software Engineering", "Data Analyst", "Data Analyst", "Consultant", "Consultant"]
+        
+        vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
+        classifier = LogisticRegression(max_iter=1000).fit(vectorizer.fit_transform(texts), labels)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'linear.npz')
+            export_linear_model(vectorizer, classifier, path)
+            predictor = LinearFieldPredictor(path)
+        
+        probe = texts + ["python sql consulting", "no known words here", ""]
+        expected = classifier.predict_proba(vectorizer.transform(probe))
+        if not np.allclose(predictor.predict_proba(probe), expected, atol=1e-9) or predictor.classes_ != list(classifier.classes_):
+            print("❌ NumPy predictor disagrees with scikit-learn")
+            return False
+        
+        print("✅ NumPy predictor matches scikit-learn")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Linear predictor error: {e}")
+        return False
+
+def test_model_selection():
+    """Test latency-budgeted model selection"""
+    print("⚖️ Testing model selection...")
+    
+    try:
+        from model_trainer import ModelTrainer
+        
+        results = {
+            'Random Forest': {'accuracy': 0.92, 'latency_p99_ms': 18.0},
+            'Logistic Regression': {'accuracy': 0.90, 'latency_p99_ms': 1.2},
+            'SVM': {'accuracy': 0.90, 'latency_p99_ms': 1.5}
+        }
+        
+        if ModelTrainer(latency_budget_ms=10).select_best_model(results) != 'Logistic Regression':
+            print("❌ Budgeted selection did not pick the fastest of the most accurate models in budget")
+            return False
+        if results['Random Forest']['within_budget'] or not results['SVM']['within_budget']:
+            print("❌ Budget flags are wrong")
+            return False
+        if ModelTrainer(latency_budget_ms=50).select_best_model(results) != 'Random Forest':
+            print("❌ A generous budget should pick the most accurate model")
+            return False
+        if ModelTrainer(latency_budget_ms=0.5).select_best_model(results) != 'Logistic Regression':
+            print("❌ With no model in budget the fastest should win")
+            return False
+        
+        print("✅ Model selection respects the latency budget")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Model selection error: {e}")
+        return False
+
+def test_cross_validation_folds():
+    """Test stratified folds and per-fold scoring on a shared matrix"""
+    print("🔀 Testing cross-validation folds...")
+    
+    try:
+        import numpy as np
+        from scipy.sparse import csr_matrix
+        from sklearn.linear_model import LogisticRegression
+        from model_trainer import ModelTrainer, _fit_and_score
+        
+        y = np.array(['A'] * 6 + ['B'] * 6 + ['C'] * 3)
+        folds = ModelTrainer(cv_folds=5).make_folds(y)
+        
+        if len(folds) != 3 or sorted(np.concatenate([test for _, test in folds]).tolist()) != list(range(15)):
+            print(f"❌ Folds do not partition the rows: {len(folds)} folds")
+            return False
+        
+        X = csr_matrix(np.eye(3)[[0] * 6 + [1] * 6 + [2] * 3])
+        scores = _fit_and_score(LogisticRegression(max_iter=1000), X, y, *folds[0])
+        if scores['accuracy'] != 1.0:
+            print(f"❌ Unexpected fold scores: {scores}")
+            return False
+        
+        print("✅ Cross-validation folds are stratified and complete")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Cross-validation error: {e}")
+        return False
+
+def test_feature_cache():
+    """Test that training features are reused and only appended rows are transformed"""
+    print("📦 Testing feature cache...")
+    
+    try:
+        import tempfile
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from feature_cache import FeatureCache
+        from model_trainer import ModelTrainer
+        
+        trainer = ModelTrainer()
+        texts = ["Python developer", "SQL analyst", "!!!", "Strategy consultant", "Java engineer"] * 4
+        labels = ["SE", "DA", "DA", "C", "SE"] * 4
+        new_vectorizer = lambda: TfidfVectorizer(max_features=1000, stop_words='english')
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = FeatureCache(tmp_dir)
+            first = cache.load(texts, labels, new_vectorizer(), trainer.preprocess_text)
+            second = cache.load(texts, labels, new_vectorizer(), trainer.preprocess_text)
+            appended = cache.load(texts + ["Data analyst"], labels + ["DA"], new_vectorizer(), trainer.preprocess_text)
+            
+            statuses = [first.status, second.status, appended.status]
+            if statuses != ['miss', 'hit', 'append']:
+                print(f"❌ Unexpected cache statuses: {statuses}")
+                return False
+            
+            if first.matrix.shape[0] != 16 or (first.matrix != second.matrix).nnz or appended.matrix.shape[0] != 17:
+                print("❌ Cached features do not line up with the dataset")
+                return False
+        
+        print("✅ Feature cache reuses and extends training features")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Feature cache error: {e}")
+        return False
+
+def test_streaming_training():
+    """Test out-of-core training over CSV chunks with a held-out stream"""
+    print("🌊 Testing streaming training...")
+    
+    cwd = os.getcwd()
+    try:
+        import tempfile
+        from model_trainer import ModelTrainer
+        
+        rows = []
+        for i in range(60):
+            rows.append({'resume_text': f"Python Java React Docker microservices engineer {i}", 'job_field': 'Software Engineering'})
+            rows.append({'resume_text': f"SQL Tableau Excel statistics dashboards analyst {i}", 'job_field': 'Data Analyst'})
+            rows.append({'resume_text': f"Strategy stakeholder change management consultant {i}", 'job_field': 'Consultant'})
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.chdir(tmp_dir)
+            pd.DataFrame(rows).to_csv('training.csv', index=False)
+            
+            result = ModelTrainer().train_streaming('training.csv', chunksize=25, n_features=2 ** 12, holdout_fraction=0.2)
+            if not result['training_completed']:
+                print(f"❌ Streaming training failed: {result['error']}")
+                return False
+            
+            stats = result['all_results'][result['best_model']]
+            if stats['train_rows'] + stats['holdout_rows'] != 180 or stats['holdout_rows'] == 0 or stats['accuracy'] < 0.9:
+                print(f"❌ Unexpected streaming results: {stats}")
+                return False
+            
+            from model_registry import ModelRegistry
+            registry = ModelRegistry('models')
+            if registry.production != result['version'] or not os.path.exists(registry.resolve('models/field_classifier.pkl')):
+                print("❌ Streaming model was not saved")
+                return False
+        
+        print("✅ Streaming training learned from chunks")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Streaming training error: {e}")
+        return False
+    finally:
+        os.chdir(cwd)
+
+def test_online_learning():
+    """Test background partial_fit updates, including through a batch-trained model's SGD companion"""
+    print("🔁 Testing online learning...")
+    
+    try:
+        import json
+        import pickle
+        import tempfile
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.linear_model import SGDClassifier
+        from model_store import ModelHolder
+        from online_learner import OnlineLearner
+        
+        texts = ["python java react developer", "sql tableau excel analyst"] * 10
+        labels = ["Software Engineering", "Data Analyst"] * 10
+        vectorizer = TfidfVectorizer()
+        classifier = SGDClassifier(loss='log_loss', random_state=42)
+        classifier.partial_fit(vectorizer.fit_transform(texts), labels, classes=sorted(set(labels)))
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            holder = ModelHolder(
+                os.path.join(tmp_dir, 'field_classifier.pkl'),
+                os.path.join(tmp_dir, 'vectorizer.pkl'),
+                os.path.join(tmp_dir, '.models.lock')
+            )
+            for obj, path in ((classifier, holder.classifier_file), (vectorizer, holder.vectorizer_file)):
+                with open(path, 'wb') as f:
+                    pickle.dump(obj, f)
+            with open(os.path.join(tmp_dir, 'training_metadata.json'), 'w') as f:
+                json.dump({'best_model': 'SGD', 'best_accuracy': 0.9}, f)
+            before = holder.get().version
+            
+            learner = OnlineLearner(holder=holder, batch_size=8, holdout_fraction=0.3)
+            for i in range(40):
+                learner.add_example(f"python docker developer {i}", "Software Engineering")
+                learner.add_example(f"excel dashboards analyst {i}", "Data Analyst")
+            learner.flush()
+            
+            stats = learner.stats()
+            if stats['published'] == 0 or stats['holdout'] == 0:
+                print(f"❌ No online update was published: {stats}")
+                return False
+            
+            if holder.get().version == before:
+                print("❌ Model holder did not pick up the online update")
+                return False
+            
+            with open(os.path.join(tmp_dir, 'training_metadata.json')) as f:
+                metadata = json.load(f)
+            if metadata['holdout_accuracy'] != stats['last_holdout_accuracy']:
+                print("❌ Published metrics do not record the measured holdout accuracy")
+                return False
+            if metadata['best_accuracy'] != 0.9:
+                print("❌ The holdout accuracy replaced the trained accuracy")
+                return False
+        
+        # A batch-trained winner is updated through the SGD companion saved next to it
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            holder = ModelHolder(
+                os.path.join(tmp_dir, 'field_classifier.pkl'),
+                os.path.join(tmp_dir, 'vectorizer.pkl'),
+                os.path.join(tmp_dir, '.models.lock')
+            )
+            forest = RandomForestClassifier(n_estimators=10, random_state=42).fit(vectorizer.transform(texts), labels)
+            for obj, path in (
+                (forest, holder.classifier_file), (vectorizer, holder.vectorizer_file),
+                (classifier, os.path.join(tmp_dir, 'online_classifier.pkl'))
+            ):
+                with open(path, 'wb') as f:
+                    pickle.dump(obj, f)
+            
+            learner = OnlineLearner(holder=holder, batch_size=8, holdout_fraction=0.3)
+            for i in range(40):
+                learner.add_example(f"python docker developer {i}", "Software Engineering")
+                learner.add_example(f"excel dashboards analyst {i}", "Data Analyst")
+            learner.flush()
+            
+            if learner.stats()['published'] == 0 or not isinstance(holder.get().classifier, SGDClassifier):
+                print(f"❌ Companion model was never served: {learner.stats()}")
+                return False
+        
+        print(f"✅ Online learning published {stats['published']} updates")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Online learning error: {e}")
+        return False
+
+def test_retrain_scheduler():
+    """Test dataset-triggered retraining in a child process, promoted by flipping the registry's production pointer"""
+    print("🗓️ Testing retrain scheduler...")
+    
+    cwd = os.getcwd()
+    try:
+        import tempfile
+        import time
+        from model_store import ModelHolder
+        from online_learner import OnlineLearner
+        from retrain_scheduler import RetrainScheduler
+        
+        def labelled_rows(start, count):
+            return [
+                row for i in range(start, start + count) for row in (
+                    {'resume_text': f"Python Java React Docker microservices engineer {i}", 'job_field': 'Software Engineering'},
+                    {'resume_text': f"SQL Tableau Excel statistics dashboards analyst {i}", 'job_field': 'Data Analyst'}
+                )
+            ]
+        
+        # Conflicting labels on a few rows keep cross-validated accuracy below a clean online holdout's
+        rows = labelled_rows(0, 40) + [
+            {'resume_text': f"Python Java React Docker microservices engineer {i}", 'job_field': 'Data Analyst'}
+            for i in range(8)
+        ]
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.chdir(tmp_dir)
+            pd.DataFrame(rows).to_csv('training.csv', index=False)
+            
+            scheduler = RetrainScheduler(dataset_file='training.csv', models_dir='models', min_row_delta=10)
+            if scheduler.check() is None:
+                print("❌ Scheduler did not retrain without a live model")
+                return False
+            
+            while scheduler.running:
+                time.sleep(0.2)
+            outcome = scheduler.poll()
+            if outcome is None or outcome['status'] != 'promoted':
+                print(f"❌ First model was not promoted: {outcome}")
+                return False
+            
+            if scheduler.registry.production != outcome['version'] or not os.path.exists(scheduler.registry.resolve('models/field_classifier.pkl')):
+                print("❌ Promoted artifacts are missing")
+                return False
+            
+            if scheduler.check() is not None:
+                print("❌ Scheduler retrained an unchanged dataset")
+                return False
+            
+            # An online update scores its small holdout perfectly
+            holder = ModelHolder(
+                'models/field_classifier.pkl', 'models/vectorizer.pkl', 'models/.models.lock', registry=scheduler.registry
+            )
+            learner = OnlineLearner(holder=holder, batch_size=8, holdout_fraction=0.3)
+            for i in range(40):
+                learner.add_example(f"Python Java React Docker microservices engineer online {i}", 'Software Engineering')
+                learner.add_example(f"SQL Tableau Excel statistics dashboards analyst online {i}", 'Data Analyst')
+            learner.flush()
+            live = scheduler.registry.production_summary()
+            if learner.stats()['published'] == 0 or live['source'] != 'online':
+                print(f"❌ No online update was published: {learner.stats()}")
+                return False
+            if live['accuracy'] != outcome['candidate']['accuracy']:
+                print("❌ The online version's accuracy is not comparable with its parent's")
+                return False
+            
+            # A retrain on more clean data is compared against that, not the holdout figure
+            pd.DataFrame(rows + labelled_rows(40, 200)).to_csv('training.csv', index=False)
+            if scheduler.check() is None:
+                print("❌ Scheduler did not retrain a grown dataset")
+                return False
+            while scheduler.running:
+                time.sleep(0.2)
+            outcome = scheduler.poll()
+            if outcome is None or outcome['status'] != 'promoted':
+                print(f"❌ Retrain after an online update was not promoted: {outcome}")
+                return False
+        
+        print(f"✅ Scheduler trained and promoted version {outcome['version']}")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Retrain scheduler error: {e}")
+        return False
+    finally:
+        os.chdir(cwd)
+
+def test_model_registry():
+    """Test numbered versions, pointer-flip promotion and rollback, and shadow scoring"""
+    print("🗃️ Testing model registry...")
+    
+    try:
+        import json
+        import pickle
+        import tempfile
+        import time
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.linear_model import LogisticRegression
+        from metrics import MetricsRegistry
+        from model_registry import ModelRegistry
+        from model_store import ModelHolder
+        from shadow_scorer import ShadowScorer
+        
+        texts = ["python java react developer", "sql tableau excel analyst"] * 10
+        labels = ["Software Engineering", "Data Analyst"] * 10
+        
+        def publish(registry, C):
+            version, version_dir = registry.new_version()
+            vectorizer = TfidfVectorizer()
+            classifier = LogisticRegression(C=C).fit(vectorizer.fit_transform(texts), labels)
+            for obj, name in ((classifier, 'field_classifier.pkl'), (vectorizer, 'vectorizer.pkl')):
+                with open(os.path.join(version_dir, name), 'wb') as f:
+                    pickle.dump(obj, f)
+            with open(os.path.join(version_dir, 'performance_metrics.json'), 'w') as f:
+                json.dump({'LR': {'accuracy': 1.0, 'latency_p99_ms': 1.0}}, f)
+            with open(os.path.join(version_dir, 'training_metadata.json'), 'w') as f:
+                json.dump({'best_model': 'LR', 'best_accuracy': 1.0, 'dataset_fingerprint': 'abc'}, f)
+            return version
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            registry = ModelRegistry(tmp_dir)
+            for C in (1.0, 0.01):
+                publish(registry, C)
+            
+            if registry.versions() != ['0001', '0002']:
+                print(f"❌ Unexpected versions: {registry.versions()}")
+                return False
+            
+            holder = ModelHolder(
+                os.path.join(tmp_dir, 'field_classifier.pkl'), os.path.join(tmp_dir, 'vectorizer.pkl'),
+                registry.lock_file, registry=registry
+            )
+            registry.promote('0001')
+            first = holder.get()
+            registry.promote('0002')
+            second = holder.get()
+            if first is None or second is first or second.classifier.C != 0.01:
+                print("❌ Promotion did not switch the served model")
+                return False
+            
+            if registry.rollback() != '0001' or holder.get().classifier.C != 1.0:
+                print("❌ Rollback did not restore the previous version")
+                return False
+            
+            # Serving a promoted version costs no filesystem calls per request
+            stat_calls = []
+            real_stat = os.stat
+            os.stat = lambda *args, **kwargs: stat_calls.append(args) or real_stat(*args, **kwargs)
+            try:
+                for _ in range(100):
+                    holder.get()
+            finally:
+                os.stat = real_stat
+            if len(stat_calls) > 1:
+                print(f"❌ {len(stat_calls)} stat calls for 100 predictions")
+                return False
+            
+            registry.set_candidate('0002')
+            scorer = ShadowScorer(registry=registry, metrics=MetricsRegistry())
+            # A slow model load must not count towards the candidate's latency
+            load = scorer._load
+            scorer._load = lambda version: time.sleep(0.05) or load(version)
+            for text, label in zip(texts, labels):
+                scorer.submit(text, label, 0.001)
+            scorer.flush()
+            report = scorer.report()
+            if report['requests'] != len(texts) or report['agreement_rate'] != 1.0 or report['candidate']['count'] != len(texts):
+                print(f"❌ Unexpected shadow report: {report}")
+                return False
+            if report['candidate']['max'] >= 0.05:
+                print(f"❌ Candidate latency includes loading the model: {report['candidate']}")
+                return False
+            
+            # Pruning after many publishes leaves a version that is still being trained into
+            registry = ModelRegistry(os.path.join(tmp_dir, 'pruned'), keep_versions=2)
+            training, training_dir = registry.new_version()
+            first = publish(registry, 1.0)
+            registry.promote(first)
+            for _ in range(8):
+                registry.promote(publish(registry, 1.0))
+            if not os.path.isdir(training_dir):
+                print("❌ Pruning removed a version that is still being trained")
+                return False
+            if first in registry.versions():
+                print(f"❌ Old versions were not pruned: {registry.versions()}")
+                return False
+        
+        print("✅ Model registry promotes, rolls back and shadow-scores versions")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Model registry error: {e}")
+        return False
+
+def test_distillation():
+    """Test distilling a Random Forest into a pruned logistic regression served as the linear export"""
+    print("⚗️ Testing distillation...")
+    
+    cwd = os.getcwd()
+    try:
+        import pickle
+        import tempfile
+        from sklearn.ensemble import RandomForestClassifier
+        from model_registry import ModelRegistry
+        from model_trainer import DISTILLED_MODEL_NAME, ModelTrainer
+        
+        rows = []
+        for i in range(30):
+            rows.append({'resume_text': f"Python Java React Docker microservices engineer project {i}", 'job_field': 'Software Engineering'})
+            rows.append({'resume_text': f"SQL Tableau Excel statistics dashboards analyst project {i}", 'job_field': 'Data Analyst'})
+            rows.append({'resume_text': f"Strategy stakeholder change management consultant project {i}", 'job_field': 'Consultant'})
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.chdir(tmp_dir)
+            trainer = ModelTrainer(latency_budget_ms=None, cv_folds=3)
+            trainer.models = {'Random Forest': RandomForestClassifier(n_estimators=50, random_state=42)}
+            result = trainer.train_models(pd.DataFrame(rows))
+            if not result['training_completed']:
+                print(f"❌ Training failed: {result['error']}")
+                return False
+            
+            student = result['all_results'].get(DISTILLED_MODEL_NAME)
+            if student is None or student['fidelity'] < 0.9 or student['teacher'] != 'Random Forest':
+                print(f"❌ Unexpected distillation results: {student}")
+                return False
+            
+            teacher = result['all_results']['Random Forest']
+            if student['size_bytes'] >= teacher['size_bytes'] or student['vocabulary_size'] >= len(trainer.models['Random Forest'].feature_importances_):
+                print("❌ Student is not smaller than its teacher")
+                return False
+            
+            registry = ModelRegistry('models')
+            if result['best_model'] != DISTILLED_MODEL_NAME or not os.path.exists(registry.resolve('models/field_classifier_linear.npz')):
+                print("❌ Distilled student was not offered as the serving artifact")
+                return False
+            
+            # The pruned vocabulary is only saved with the student; the trainer keeps the full one
+            with open(registry.resolve('models/vectorizer.pkl'), 'rb') as f:
+                served_vocabulary = len(pickle.load(f).vocabulary_)
+            if trainer.vectorizer.vocabulary is not None or served_vocabulary != student['vocabulary_size']:
+                print("❌ Trainer kept the student's pruned vectorizer")
+                return False
+            if trainer.load_features(pd.DataFrame(rows)).status != 'hit':
+                print("❌ Retraining on the same data missed the feature cache")
+                return False
+        
+        print(f"✅ Distilled student keeps {student['fidelity']:.0%} fidelity with {student['vocabulary_size']} terms")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Distillation error: {e}")
+        return False
+    finally:
+        os.chdir(cwd)
+
 def test_streamlit_app():
     """Test if Streamlit app can be imported"""
     print("🚀 Testing Streamlit app...")
@@ -161,6 +1365,30 @@ def main():
         ("Directory Test", test_directories),
         ("Dataset Test", test_dataset),
         ("Component Test", test_components),
+        ("Scoring Engine Test", test_scoring_engine),
+        ("Keyword Registry Test", test_keyword_registry),
+        ("Keyword Matcher Test", test_keyword_matcher),
+        ("History Writer Test", test_history_writer),
+        ("History Migration Test", test_history_migration),
+        ("History Store Test", test_history_store),
+        ("Batch Scoring Test", test_batch_scoring),
+        ("Bulk Screening Test", test_bulk_screening),
+        ("Text Cache Test", test_text_cache),
+        ("PDF Page Budget Test", test_pdf_page_budget),
+        ("DOCX Extraction Test", test_docx_extraction),
+        ("Extraction Pool Test", test_extraction_pool),
+        ("Metrics Test", test_metrics),
+        ("Profiler Test", test_profiler),
+        ("Model Holder Test", test_model_holder),
+        ("Linear Predictor Test", test_linear_predictor),
+        ("Model Selection Test", test_model_selection),
+        ("Cross-Validation Test", test_cross_validation_folds),
+        ("Feature Cache Test", test_feature_cache),
+        ("Streaming Training Test", test_streaming_training),
+        ("Online Learning Test", test_online_learning),
+        ("Retrain Scheduler Test", test_retrain_scheduler),
+        ("Model Registry Test", test_model_registry),
+        ("Distillation Test", test_distillation),
         ("Streamlit App Test", test_streamlit_app)
     ]
     
@@ -0,0 +1,160 @@
+import hashlib
+import os
+import threading
+import time
+
+TEXT_CACHE_DIR = 'data/text_cache'
+TEXT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Other processes write to the same directory; their entries count towards the bound after a rescan
+TEXT_CACHE_RESCAN_SECONDS = 30
+
+
+class TextCache:
+    """Disk-backed, size-bounded LRU cache of extracted resume text keyed by content hash
+
+    The directory is the index: every process sharing it (Streamlit servers, bulk screening
+    workers) sees the others' entries, file mtimes order the LRU, and the size bound is
+    enforced over the directory's contents.
+    """
+
+    def __init__(self, cache_dir=TEXT_CACHE_DIR, max_bytes=TEXT_CACHE_MAX_BYTES, rescan_seconds=TEXT_CACHE_RESCAN_SECONDS):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.rescan_seconds = rescan_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Guards the counters and the size estimate only; file I/O happens outside it
+        self._lock = threading.Lock()
+        self._evict_lock = threading.Lock()
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._scanned_at = time.monotonic()
+        self._estimated_bytes = sum(size for _, _, size in self._scan())
+
+    def _scan(self):
+        """(mtime, key, size) of every entry in the directory, least recently used first"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.txt'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue  # evicted by another process since listdir
+            entries.append((stat.st_mtime_ns, name[:-4], stat.st_size))
+        return sorted(entries)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + '.txt')
+
+    @staticmethod
+    def make_key(data, *parts):
+        """SHA-256 of the file bytes plus anything else the result depends on"""
+        digest = hashlib.sha256(data)
+        for part in parts:
+            digest.update(b'\0' + str(part).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _count(self, counter, amount=1):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def get(self, key):
+        """Return cached text for a key, or None"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except OSError:
+            self._count('misses')
+            return None
+
+        try:
+            # The mtime is the LRU position every process sees
+            os.utime(path)
+        except OSError:
+            pass
+        self._count('hits')
+        return text
+
+    def put(self, key, text):
+        """Store text for a key and evict least recently used entries over the size limit"""
+        data = text.encode('utf-8')
+        if len(data) > self.max_bytes:
+            return
+
+        tmp_path = self._path(key) + f'.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            print(f"⚠️ Could not cache extracted text: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            self._estimated_bytes += len(data)
+            due = (self._estimated_bytes > self.max_bytes
+                   or time.monotonic() - self._scanned_at >= self.rescan_seconds)
+        if due:
+            self.evict()
+
+    def evict(self):
+        """Rescan the directory and remove least recently used entries until it fits the bound"""
+        # One eviction pass per process at a time; passes in other processes only race on
+        # removing the same files, which is harmless
+        if not self._evict_lock.acquire(blocking=False):
+            return
+        try:
+            entries = self._scan()
+            self._scanned_at = time.monotonic()
+            total = sum(size for _, _, size in entries)
+            evicted = 0
+            for _, key, size in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(self._path(key))
+                    evicted += 1
+                except OSError:
+                    pass  # already removed by another process
+                total -= size
+            with self._lock:
+                self._estimated_bytes = total
+                self.evictions += evicted
+        finally:
+            self._evict_lock.release()
+
+    def stats(self):
+        """Hit/miss counters and the directory's current size"""
+        entries = self._scan()
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(entries),
+                'bytes': sum(size for _, _, size in entries)
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_text_cache():
+    """Return the shared text cache"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TextCache()
+    return _cache
@@ -1,54 +1,275 @@
 import PyPDF2
 import docx
 import io
+import time
+import zipfile
 import streamlit as st
+from xml.etree import ElementTree
+from extraction_pool import ExtractionError, get_extraction_pool
+from metrics import get_metrics, timed
+from text_cache import TextCache, get_text_cache
+
+# Bump whenever extraction output changes so cached text from older versions is ignored
+EXTRACTOR_VERSION = '3'
+
+# Only the first pages of a resume matter; long portfolios are cut off here
+PDF_MAX_PAGES = 15
+MAX_TEXT_CHARS = 60000
+
+PDF_TYPE = "application/pdf"
+DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+TXT_TYPE = "text/plain"
+
+# WordprocessingML tags read by the streaming DOCX parser
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+W_P = W_NS + 'p'
+W_T = W_NS + 't'
+W_TAB = W_NS + 'tab'
+W_BREAKS = {W_NS + 'br', W_NS + 'cr'}
+W_TABLE_PARTS = {W_NS + 'tc', W_NS + 'tbl'}
+# Word stores text boxes twice, once per rendering; only the first copy is read
+MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+# Parsers that can hang or leak on malformed input run in the isolated worker pool
+ISOLATED_TYPES = {PDF_TYPE, DOCX_TYPE}
 
 class TextExtractor:
-    def __init__(self):
-        pass
+    def __init__(self, cache=None, max_pdf_pages=PDF_MAX_PAGES, max_chars=MAX_TEXT_CHARS, isolate=None):
+        # cache=None uses the shared cache, cache=False disables caching
+        self.cache = get_text_cache() if cache is None else (cache or None)
+        # isolate=None uses the shared worker pool when enabled, isolate=False parses in-process
+        self.pool = get_extraction_pool() if isolate is None else (isolate or None)
+        self.max_pdf_pages = max_pdf_pages
+        self.max_chars = max_chars
+        # Why the last isolated extraction failed (timeout, memory cap, parser error), or None
+        self.last_error = None
+    
+    def _read_bytes(self, uploaded_file):
+        """Read the upload without consuming it for the extractors"""
+        if hasattr(uploaded_file, 'getvalue'):
+            return uploaded_file.getvalue()
+        data = uploaded_file.read()
+        uploaded_file.seek(0)
+        return data
     
+    @timed('text_extractor.extract_text')
     def extract_text(self, uploaded_file):
         """Extract text from uploaded file based on file type"""
+        self.last_error = None
         try:
             file_type = uploaded_file.type
             
-            if file_type == "application/pdf":
-                return self.extract_from_pdf(uploaded_file)
-            elif file_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                return self.extract_from_docx(uploaded_file)
-            elif file_type == "text/plain":
-                return self.extract_from_txt(uploaded_file)
-            else:
+            cache_key = None
+            if self.cache is not None:
+                cache_key = TextCache.make_key(
+                    self._read_bytes(uploaded_file), file_type, EXTRACTOR_VERSION, self.max_pdf_pages, self.max_chars
+                )
+                cached_text = self.cache.get(cache_key)
+                if cached_text is not None:
+                    get_metrics().increment('text_extractor.cache_hits')
+                    return cached_text
+            
+            if file_type not in (PDF_TYPE, DOCX_TYPE, TXT_TYPE):
                 st.error(f"Unsupported file type: {file_type}")
                 return ""
+            
+            if self.pool is not None and file_type in ISOLATED_TYPES:
+                try:
+                    text = self.pool.extract(
+                        self._read_bytes(uploaded_file), file_type, self.max_pdf_pages, self.max_chars
+                    )
+                except ExtractionError as e:
+                    get_metrics().increment('text_extractor.isolated_failures')
+                    self.last_error = str(e)
+                    st.error(f"Error extracting text: {str(e)}")
+                    return ""
+            else:
+                text = self.extract_by_type(uploaded_file, file_type)
+            
+            # Failed extractions return "" and are retried next time
+            if text and cache_key is not None:
+                self.cache.put(cache_key, text)
+            
+            return text
         except Exception as e:
             st.error(f"Error extracting text: {str(e)}")
             return ""
     
-    def extract_from_pdf(self, uploaded_file):
-        """Extract text from PDF file"""
-        try:
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(uploaded_file.read()))
-            text = ""
+    def extract_by_type(self, uploaded_file, file_type):
+        """Run the in-process extractor for a file type"""
+        if file_type == PDF_TYPE:
+            return self.extract_from_pdf(uploaded_file)
+        elif file_type == DOCX_TYPE:
+            return self.extract_from_docx(uploaded_file)
+        elif file_type == TXT_TYPE:
+            return self.extract_from_txt(uploaded_file)
+        raise ValueError(f"Unsupported file type: {file_type}")
+    
+    def parse_by_type(self, uploaded_file, file_type):
+        """Like extract_by_type, but parser errors propagate instead of being reported and swallowed
+        
+        The isolated workers use this so the parent sees the real failure, a MemoryError from
+        the memory cap included, rather than an empty string.
+        """
+        if file_type == PDF_TYPE:
+            return self.parse_pdf(uploaded_file)
+        elif file_type == DOCX_TYPE:
+            return self.parse_docx(uploaded_file)
+        elif file_type == TXT_TYPE:
+            return uploaded_file.read().decode('utf-8')
+        raise ValueError(f"Unsupported file type: {file_type}")
+    
+    def iter_pdf_pages(self, uploaded_file, max_pages=None, max_chars=None, stats=None):
+        """Yield (page_number, text, seconds) page by page, stopping at the page or character budget"""
+        # PdfReader reads lazily from any seekable stream, so the upload is not copied first
+        stream = uploaded_file if hasattr(uploaded_file, 'seek') else io.BytesIO(uploaded_file.read())
+        pdf_reader = PyPDF2.PdfReader(stream)
+        
+        total_pages = len(pdf_reader.pages)
+        if stats is not None:
+            stats.update(total_pages=total_pages, pages_read=0, page_seconds=[], truncated=False)
+        
+        chars = 0
+        for page_number, page in enumerate(pdf_reader.pages, 1):
+            if max_pages is not None and page_number > max_pages:
+                break
+            
+            started = time.perf_counter()
+            page_text = page.extract_text()
+            seconds = time.perf_counter() - started
             
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
+            if stats is not None:
+                stats['pages_read'] = page_number
+                stats['page_seconds'].append(seconds)
+            yield page_number, page_text, seconds
             
-            return text.strip()
+            chars += len(page_text) + 1
+            if max_chars is not None and chars >= max_chars:
+                break
+        
+        if stats is not None:
+            stats['truncated'] = stats['pages_read'] < total_pages
+    
+    def parse_pdf(self, uploaded_file, stats=None):
+        """Text of a PDF within the page and character budget; raises on unreadable files"""
+        parts = [
+            page_text for _, page_text, _ in
+            self.iter_pdf_pages(uploaded_file, self.max_pdf_pages, self.max_chars, stats)
+        ]
+        
+        # Joined once at the end instead of growing a string page by page
+        text = "\n".join(parts)
+        if self.max_chars is not None:
+            text = text[:self.max_chars]
+        
+        return text.strip()
+    
+    def extract_from_pdf(self, uploaded_file, stats=None):
+        """Extract text from PDF file
+        
+        If a stats dict is given it is filled with the page count, the number of pages
+        read, whether the budget cut the document short, and per-page timings.
+        """
+        try:
+            return self.parse_pdf(uploaded_file, stats)
         except Exception as e:
             st.error(f"Error reading PDF: {str(e)}")
             return ""
     
-    def extract_from_docx(self, uploaded_file):
-        """Extract text from DOCX file"""
-        try:
-            doc = docx.Document(io.BytesIO(uploaded_file.read()))
-            text = ""
+    def iter_docx_paragraphs(self, archive, part_name):
+        """Yield paragraph text from one DOCX XML part in document order, table cells included"""
+        with archive.open(part_name) as part:
+            buffers = []
+            skip_depth = 0
+            for event, elem in ElementTree.iterparse(part, events=('start', 'end')):
+                tag = elem.tag
+                if event == 'start':
+                    if tag == MC_FALLBACK or skip_depth:
+                        skip_depth += 1
+                    elif tag == W_P:
+                        buffers.append([])
+                    continue
+                
+                if skip_depth:
+                    skip_depth -= 1
+                    if tag == MC_FALLBACK:
+                        elem.clear()
+                    continue
+                
+                if tag == W_T:
+                    if buffers and elem.text:
+                        buffers[-1].append(elem.text)
+                elif tag == W_TAB:
+                    if buffers:
+                        buffers[-1].append('\t')
+                elif tag in W_BREAKS:
+                    if buffers:
+                        buffers[-1].append('\n')
+                elif tag == W_P:
+                    if buffers:
+                        yield ''.join(buffers.pop())
+                    # Drop finished subtrees so memory stays flat on long documents
+                    elem.clear()
+                elif tag in W_TABLE_PARTS:
+                    elem.clear()
+    
+    def extract_docx_xml(self, uploaded_file):
+        """Stream text out of the DOCX zip: headers first, then the body with its tables"""
+        archive = zipfile.ZipFile(io.BytesIO(self._read_bytes(uploaded_file)))
+        with archive:
+            names = set(archive.namelist())
+            if 'word/document.xml' not in names:
+                raise ValueError("word/document.xml not found")
             
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
+            headers = sorted(
+                (name for name in names if name.startswith('word/header') and name.endswith('.xml')),
+                key=lambda name: (len(name), name)
+            )
             
-            return text.strip()
+            parts = []
+            chars = 0
+            seen_header_lines = set()
+            for header in headers:
+                for paragraph in self.iter_docx_paragraphs(archive, header):
+                    # First-page and default headers usually repeat the same contact line
+                    if paragraph and paragraph not in seen_header_lines:
+                        seen_header_lines.add(paragraph)
+                        parts.append(paragraph)
+                        chars += len(paragraph) + 1
+            
+            for paragraph in self.iter_docx_paragraphs(archive, 'word/document.xml'):
+                parts.append(paragraph)
+                chars += len(paragraph) + 1
+                if self.max_chars is not None and chars >= self.max_chars:
+                    break
+        
+        text = "\n".join(parts)
+        if self.max_chars is not None:
+            text = text[:self.max_chars]
+        return text.strip()
+    
+    def parse_docx(self, uploaded_file):
+        """Text of a DOCX, falling back to python-docx if the XML stream fails; raises on unreadable files"""
+        try:
+            return self.extract_docx_xml(uploaded_file)
+        except MemoryError:
+            raise
+        except Exception:
+            pass
+        
+        uploaded_file.seek(0)
+        doc = docx.Document(io.BytesIO(uploaded_file.read()))
+        text = ""
+        
+        for paragraph in doc.paragraphs:
+            text += paragraph.text + "\n"
+        
+        return text.strip()
+    
+    def extract_from_docx(self, uploaded_file):
+        """Extract text from DOCX file, falling back to python-docx if the XML stream fails"""
+        try:
+            return self.parse_docx(uploaded_file)
         except Exception as e:
             st.error(f"Error reading DOCX: {str(e)}")
             return ""